@@ -0,0 +1 @@
+var htmx=function(){"use strict";const Q={onLoad:null,process:null,on:null,off:null,trigger:null,ajax:null,find:null,findAll:null,closest:null,values:function(e,t){return dn(e,t||"post").values},remove:null,addClass:null,removeClass:null,toggleClass:null,takeClass:null,swap:null,defineExtension:null,removeExtension:null,logAll:null,logNone:null,logger:null,config:{historyEnabled:!0,historyCacheSize:10,refreshOnHistoryMiss:!1,defaultSwapStyle:"innerHTML",defaultSwapDelay:0,defaultSettleDelay:20,includeIndicatorStyles:!0,indicatorClass:"htmx-indicator",requestClass:"htmx-request",addedClass:"htmx-added",settlingClass:"htmx-settling",swappingClass:"htmx-swapping",allowEval:!0,allowScriptTags:!0,inlineScriptNonce:"",inlineStyleNonce:"",attributesToSettle:["class","style","width","height"],withCredentials:!1,timeout:0,wsReconnectDelay:"full-jitter",wsBinaryType:"blob",disableSelector:"[hx-disable], [data-hx-disable]",scrollBehavior:"instant",defaultFocusScroll:!1,getCacheBusterParam:!1,globalViewTransitions:!1,methodsThatUseUrlParams:["get","delete"],selfRequestsOnly:!0,ignoreTitle:!1,scrollIntoViewOnBoost:!0,triggerSpecsCache:null,disableInheritance:!1,responseHandling:[{code:"204",swap:!1},{code:"[23]..",swap:!0},{code:"[45]..",swap:!1,error:!0}],allowNestedOobSwaps:!0,historyRestoreAsHxRequest:!0,reportValidityOfForms:!1},parseInterval:null,location:location,_:null,version:"2.0.8"};Q.onLoad=V,Q.process=Ft,Q.on=xe,Q.off=be,Q.trigger=ae,Q.ajax=Ln,Q.find=f,Q.findAll=x,Q.closest=g,Q.remove=_,Q.addClass=K,Q.removeClass=G,Q.toggleClass=W,Q.takeClass=Z,Q.swap=ze,Q.defineExtension=_n,Q.removeExtension=zn,Q.logAll=j,Q.logNone=$,Q.parseInterval=d,Q._=e;const n={addTriggerHandler:St,bodyContains:se,canAccessLocalStorage:X,findThisElement:Se,filterValues:yn,swap:ze,hasAttribute:s,getAttributeValue:a,getClosestAttributeValue:ne,getClosestMatch:q,getExpressionVars:Rn,getHeaders:mn,getInputValues:dn,getInternalData:oe,getSwapSpecification:bn,getTriggerSpecs:st,getTarget:Ee,makeFragment:D,mergeObjects:le,makeSettleInfo:Sn,oobSwap:Te,querySelectorExt:ue,settleImmediately:Yt,shouldCancel:ht,triggerEvent:ae,triggerErrorEvent:fe,withExtensions:Vt},de=["get","post","put","delete","patch"],R=de.map(function(e){return"[hx-"+e+"], [data-hx-"+e+"]"}).join(", ");function d(e){if(null==e)return;let t=NaN;return t="ms"==e.slice(-2)?parseFloat(e.slice(0,-2)):"s"==e.slice(-1)?1e3*parseFloat(e.slice(0,-1)):"m"==e.slice(-1)?1e3*parseFloat(e.slice(0,-1))*60:parseFloat(e),isNaN(t)?void 0:t}function ee(e,t){return e instanceof Element&&e.getAttribute(t)}function s(e,t){return!!e.hasAttribute&&(e.hasAttribute(t)||e.hasAttribute("data-"+t))}function a(e,t){return ee(e,t)||ee(e,"data-"+t)}function u(e){const t=e.parentElement;return!t&&e.parentNode instanceof ShadowRoot?e.parentNode:t}function te(){return document}function y(e,t){return e.getRootNode?e.getRootNode({composed:t}):te()}function q(e,t){for(;e&&!t(e);)e=u(e);return e||null}function o(e,t,n){const r=a(t,n),o=a(t,"hx-disinherit");var i=a(t,"hx-inherit");if(e!==t){if(Q.config.disableInheritance)return i&&("*"===i||i.split(" ").indexOf(n)>=0)?r:null;if(o&&("*"===o||o.split(" ").indexOf(n)>=0))return"unset"}return r}function ne(e,t){let n=null;if(q(e,function(r){return!!(n=o(e,ce(r),t))}),"unset"!==n)return n}function h(e,t){return e instanceof Element&&e.matches(t)}function A(e){const t=/<([a-z][^\/\0>\x20\t\r\n\f]*)/i.exec(e);return t?t[1].toLowerCase():""}function L(e){if("parseHTMLUnsafe"in Document)return Document.parseHTMLUnsafe(e);return(new DOMParser).parseFromString(e,"text/html")}function N(e,t){for(;t.childNodes.length>0;)e.append(t.childNodes[0])}function r(e){const t=te().createElement("script");return ie(e.attributes,function(e){t.setAttribute(e.name,e.value)}),t.textContent=e.textContent,t.async=!1,Q.config.inlineScriptNonce&&(t.nonce=Q.config.inlineScriptNonce),t}function i(e){return e.matches("script")&&("text/javascript"===e.type||"module"===e.type||""===e.type)}function I(e){Array.from(e.querySelectorAll("script")).forEach(e=>{if(i(e)){const t=r(e),n=e.parentNode;try{n.insertBefore(t,e)}catch(e){H(e)}finally{e.remove()}}})}function D(e){const t=e.replace(/<head(\s[^>]*)?>[\s\S]*?<\/head>/i,""),n=A(t);let r;if("html"===n){r=new DocumentFragment;const t=L(e);N(r,t.body),r.title=t.title}else if("body"===n){r=new DocumentFragment;const e=L(t);N(r,e.body),r.title=e.title}else{const e=L('<body><template class="internal-htmx-wrapper">'+t+"</template></body>");r=e.querySelector("template").content,r.title=e.title;var o=r.querySelector("title");o&&o.parentNode===r&&(o.remove(),r.title=o.innerText)}return r&&(Q.config.allowScriptTags?I(r):r.querySelectorAll("script").forEach(e=>e.remove())),r}function re(e){e&&e()}function t(e,t){return Object.prototype.toString.call(e)==="[object "+t+"]"}function P(e){return"function"==typeof e}function k(e){return t(e,"Object")}function oe(e){const t="htmx-internal-data";let n=e[t];return n||(n=e[t]={}),n}function M(e){const t=[];if(e)for(let n=0;n<e.length;n++)t.push(e[n]);return t}function ie(e,t){if(e)for(let n=0;n<e.length;n++)t(e[n])}function F(e){const t=e.getBoundingClientRect(),n=t.top,r=t.bottom;return n<window.innerHeight&&r>=0}function se(e){return e.getRootNode({composed:!0})===document}function B(e){return e.trim().split(/\s+/)}function le(e,t){for(const n in t)t.hasOwnProperty(n)&&(e[n]=t[n]);return e}function v(e){try{return JSON.parse(e)}catch(e){return H(e),null}}function X(){const e="htmx:sessionStorageTest";try{return sessionStorage.setItem(e,e),sessionStorage.removeItem(e),!0}catch(e){return!1}}function U(e){const t=new URL(e,"http://x");return t&&(e=t.pathname+t.search),"/"!=e&&(e=e.replace(/\/+$/,"")),e}function e(e){return On(te().body,function(){return eval(e)})}function V(e){return Q.on("htmx:load",function(t){e(t.detail.elt)})}function j(){Q.logger=function(e,t,n){console&&console.log(t,e,n)}}function $(){Q.logger=null}function f(e,t){return"string"!=typeof e?e.querySelector(t):f(te(),e)}function x(e,t){return"string"!=typeof e?e.querySelectorAll(t):x(te(),e)}function b(){return window}function _(e,t){e=w(e),t?b().setTimeout(function(){_(e),e=null},t):u(e).removeChild(e)}function ce(e){return e instanceof Element?e:null}function z(e){return e instanceof HTMLElement?e:null}function J(e){return"string"==typeof e?e:null}function p(e){return e instanceof Element||e instanceof Document||e instanceof DocumentFragment?e:null}function K(e,t,n){(e=ce(w(e)))&&(n?b().setTimeout(function(){K(e,t),e=null},n):e.classList&&e.classList.add(t))}function G(e,t,n){let r=ce(w(e));r&&(n?b().setTimeout(function(){G(r,t),r=null},n):r.classList&&(r.classList.remove(t),0===r.classList.length&&r.removeAttribute("class")))}function W(e,t){(e=w(e)).classList.toggle(t)}function Z(e,t){ie((e=w(e)).parentElement.children,function(e){G(e,t)}),K(ce(e),t)}function g(e,t){return(e=ce(w(e)))?e.closest(t):null}function l(e,t){return e.substring(0,t.length)===t}function Y(e,t){return e.substring(e.length-t.length)===t}function pe(e){const t=e.trim();return l(t,"<")&&Y(t,"/>")?t.substring(1,t.length-2):t}function m(e,t,n){if(0===t.indexOf("global "))return m(e,t.slice(7),!0);e=w(e);const r=[];{let e=0,n=0;for(let o=0;o<t.length;o++){const i=t[o];","!==i||0!==e?"<"===i?e++:"/"===i&&o<t.length-1&&">"===t[o+1]&&e--:(r.push(t.substring(n,o)),n=o+1)}n<t.length&&r.push(t.substring(n))}const o=[],i=[];for(;r.length>0;){const t=pe(r.shift());let s;0===t.indexOf("closest ")?s=g(ce(e),pe(t.slice(8))):0===t.indexOf("find ")?s=f(p(e),pe(t.slice(5))):"next"===t||"nextElementSibling"===t?s=ce(e).nextElementSibling:0===t.indexOf("next ")?s=ge(e,pe(t.slice(5)),!!n):"previous"===t||"previousElementSibling"===t?s=ce(e).previousElementSibling:0===t.indexOf("previous ")?s=me(e,pe(t.slice(9)),!!n):"document"===t?s=document:"window"===t?s=window:"body"===t?s=document.body:"root"===t?s=y(e,!!n):"host"===t?s=e.getRootNode().host:i.push(t),s&&o.push(s)}if(i.length>0){const t=i.join(","),r=p(y(e,!!n));o.push(...M(r.querySelectorAll(t)))}return o}var ge=function(e,t,n){const r=p(y(e,n)).querySelectorAll(t);for(let t=0;t<r.length;t++){const n=r[t];if(n.compareDocumentPosition(e)===Node.DOCUMENT_POSITION_PRECEDING)return n}},me=function(e,t,n){const r=p(y(e,n)).querySelectorAll(t);for(let t=r.length-1;t>=0;t--){const n=r[t];if(n.compareDocumentPosition(e)===Node.DOCUMENT_POSITION_FOLLOWING)return n}};function ue(e,t){return"string"!=typeof e?m(e,t)[0]:m(te().body,e)[0]}function w(e,t){return"string"==typeof e?f(p(t)||document,e):e}function ye(e,t,n,r){return P(t)?{target:te().body,event:J(e),listener:t,options:n}:{target:w(e),event:J(t),listener:n,options:r}}function xe(e,t,n,r){Gn(function(){const o=ye(e,t,n,r);o.target.addEventListener(o.event,o.listener,o.options)});return P(t)?t:n}function be(e,t,n){return Gn(function(){const r=ye(e,t,n);r.target.removeEventListener(r.event,r.listener)}),P(t)?t:n}const ve=te().createElement("output");function we(e,t){const n=ne(e,t);if(n){if("this"===n)return[Se(e,t)];{const r=m(e,n);if(/(^|,)(\s*)inherit(\s*)($|,)/.test(n)){const n=ce(q(e,function(n){return n!==e&&s(ce(n),t)}));n&&r.push(...we(n,t))}return 0===r.length?(H('The selector "'+n+'" on '+t+" returned no matches!"),[ve]):r}}}function Se(e,t){return ce(q(e,function(e){return null!=a(ce(e),t)}))}function Ee(e){const t=ne(e,"hx-target");if(t)return"this"===t?Se(e,"hx-target"):ue(e,t);return oe(e).boosted?te().body:e}function Ce(e){return Q.config.attributesToSettle.includes(e)}function Oe(e,t){ie(Array.from(e.attributes),function(n){!t.hasAttribute(n.name)&&Ce(n.name)&&e.removeAttribute(n.name)}),ie(t.attributes,function(t){Ce(t.name)&&e.setAttribute(t.name,t.value)})}function He(e,t){const n=Jn(t);for(let r=0;r<n.length;r++){const o=n[r];try{if(o.isInlineSwap(e))return!0}catch(t){H(t)}}return"outerHTML"===e}function Te(e,t,n,r){r=r||te();let o="#"+CSS.escape(ee(t,"id")),i="outerHTML";"true"===e||(e.indexOf(":")>0?(i=e.substring(0,e.indexOf(":")),o=e.substring(e.indexOf(":")+1)):i=e),t.removeAttribute("hx-swap-oob"),t.removeAttribute("data-hx-swap-oob");const s=m(r,o,!1);return s.length?(ie(s,function(e){let r;const o=t.cloneNode(!0);r=te().createDocumentFragment(),r.appendChild(o),He(i,e)||(r=p(o));const s={shouldSwap:!0,target:e,fragment:r};ae(e,"htmx:oobBeforeSwap",s)&&(e=s.target,s.shouldSwap&&(qe(r),$e(i,e,e,r,n),Re()),ie(n.elts,function(e){ae(e,"htmx:oobAfterSwap",s)}))}),t.parentNode.removeChild(t)):(t.parentNode.removeChild(t),fe(te().body,"htmx:oobErrorNoTarget",{content:t})),e}function Re(){const e=f("#--htmx-preserve-pantry--");if(e){for(const t of[...e.children]){const e=f("#"+t.id);e.parentNode.moveBefore(t,e),e.remove()}e.remove()}}function qe(e){ie(x(e,"[hx-preserve], [data-hx-preserve]"),function(e){const t=a(e,"id"),n=te().getElementById(t);if(null!=n)if(e.moveBefore){let e=f("#--htmx-preserve-pantry--");null==e&&(te().body.insertAdjacentHTML("afterend","<div id='--htmx-preserve-pantry--'></div>"),e=f("#--htmx-preserve-pantry--")),e.moveBefore(n,null)}else e.parentNode.replaceChild(n,e)})}function Ae(e,t,n){ie(t.querySelectorAll("[id]"),function(t){const r=ee(t,"id");if(r&&r.length>0){const o=r.replace("'","\\'"),i=t.tagName.replace(":","\\:"),s=p(e),l=s&&s.querySelector(i+"[id='"+o+"']");if(l&&l!==s){const e=t.cloneNode();Oe(t,l),n.tasks.push(function(){Oe(t,e)})}}})}function Le(e){return function(){G(e,Q.config.addedClass),Ft(ce(e)),Ne(p(e)),ae(e,"htmx:load")}}function Ne(e){const t="[autofocus]",n=z(h(e,t)?e:e.querySelector(t));null!=n&&n.focus()}function c(e,t,n,r){for(Ae(e,n,r);n.childNodes.length>0;){const o=n.firstChild;K(ce(o),Q.config.addedClass),e.insertBefore(o,t),o.nodeType!==Node.TEXT_NODE&&o.nodeType!==Node.COMMENT_NODE&&r.tasks.push(Le(o))}}function Ie(e,t){let n=0;for(;n<e.length;)t=(t<<5)-t+e.charCodeAt(n++)|0;return t}function De(e){let t=0;for(let n=0;n<e.attributes.length;n++){const r=e.attributes[n];r.value&&(t=Ie(r.name,t),t=Ie(r.value,t))}return t}function Pe(e){const t=oe(e);if(t.onHandlers){for(let n=0;n<t.onHandlers.length;n++){const r=t.onHandlers[n];be(e,r.event,r.listener)}delete t.onHandlers}}function ke(e){const t=oe(e);t.timeout&&clearTimeout(t.timeout),t.listenerInfos&&ie(t.listenerInfos,function(e){e.on&&be(e.on,e.trigger,e.listener)}),Pe(e),ie(Object.keys(t),function(e){"firstInitCompleted"!==e&&delete t[e]})}function S(e){ae(e,"htmx:beforeCleanupElement"),ke(e),ie(e.children,function(e){S(e)})}function Me(e,t,n){if("BODY"===e.tagName)return je(e,t,n);let r;const o=e.previousSibling,i=u(e);if(i){for(c(i,e,t,n),r=null==o?i.firstChild:o.nextSibling,n.elts=n.elts.filter(function(t){return t!==e});r&&r!==e;)r instanceof Element&&n.elts.push(r),r=r.nextSibling;S(e),e.remove()}}function Fe(e,t,n){return c(e,e.firstChild,t,n)}function Be(e,t,n){return c(u(e),e,t,n)}function Xe(e,t,n){return c(e,null,t,n)}function Ue(e,t,n){return c(u(e),e.nextSibling,t,n)}function Ve(e){S(e);const t=u(e);if(t)return t.removeChild(e)}function je(e,t,n){const r=e.firstChild;if(c(e,r,t,n),r){for(;r.nextSibling;)S(r.nextSibling),e.removeChild(r.nextSibling);S(r),e.removeChild(r)}}function $e(e,t,n,r,o){switch(e){case"none":return;case"outerHTML":return void Me(n,r,o);case"afterbegin":return void Fe(n,r,o);case"beforebegin":return void Be(n,r,o);case"beforeend":return void Xe(n,r,o);case"afterend":return void Ue(n,r,o);case"delete":return void Ve(n);default:var i=Jn(t);for(let s=0;s<i.length;s++){const l=i[s];try{const t=l.handleSwap(e,n,r,o);if(t){if(Array.isArray(t))for(let e=0;e<t.length;e++){const n=t[e];n.nodeType!==Node.TEXT_NODE&&n.nodeType!==Node.COMMENT_NODE&&o.tasks.push(Le(n))}return}}catch(t){H(t)}}"innerHTML"===e?je(n,r,o):$e(Q.config.defaultSwapStyle,t,n,r,o)}}function _e(e,t,n){var r=x(e,"[hx-swap-oob], [data-hx-swap-oob]");return ie(r,function(e){if(Q.config.allowNestedOobSwaps||null===e.parentElement){const r=a(e,"hx-swap-oob");null!=r&&Te(r,e,t,n)}else e.removeAttribute("hx-swap-oob"),e.removeAttribute("data-hx-swap-oob")}),r.length>0}function ze(e,t,n,r){r||(r={});let o=null,i=null,s=function(){re(r.beforeSwapCallback),e=w(e);const i=r.contextElement?y(r.contextElement,!1):te(),s=document.activeElement;let l={};l={elt:s,start:s?s.selectionStart:null,end:s?s.selectionEnd:null};const a=Sn(e);if("textContent"===n.swapStyle)e.textContent=t;else{let o=D(t);if(a.title=r.title||o.title,r.historyRequest&&(o=o.querySelector("[hx-history-elt],[data-hx-history-elt]")||o),r.selectOOB){const e=r.selectOOB.split(",");for(let t=0;t<e.length;t++){const n=e[t].split(":",2);let r=n[0].trim();0===r.indexOf("#")&&(r=r.substring(1));const s=n[1]||"true",l=o.querySelector("#"+r);l&&Te(s,l,a,i)}}if(_e(o,a,i),ie(x(o,"template"),function(e){e.content&&_e(e.content,a,i)&&e.remove()}),r.select){const e=te().createDocumentFragment();ie(o.querySelectorAll(r.select),function(t){e.appendChild(t)}),o=e}qe(o),$e(n.swapStyle,r.contextElement,e,o,a),Re()}if(l.elt&&!se(l.elt)&&ee(l.elt,"id")){const e=document.getElementById(ee(l.elt,"id")),t={preventScroll:void 0!==n.focusScroll?!n.focusScroll:!Q.config.defaultFocusScroll};if(e){if(l.start&&e.setSelectionRange)try{e.setSelectionRange(l.start,l.end)}catch(s){}e.focus(t)}}e.classList.remove(Q.config.swappingClass),ie(a.elts,function(e){e.classList&&e.classList.add(Q.config.settlingClass),ae(e,"htmx:afterSwap",r.eventInfo)}),re(r.afterSwapCallback),n.ignoreTitle||Xn(a.title);const c=function(){if(ie(a.tasks,function(e){e.call()}),ie(a.elts,function(e){e.classList&&e.classList.remove(Q.config.settlingClass),ae(e,"htmx:afterSettle",r.eventInfo)}),r.anchor){const e=ce(w("#"+r.anchor));e&&e.scrollIntoView({block:"start",behavior:"auto"})}En(a.elts,n),re(r.afterSettleCallback),re(o)};n.settleDelay>0?b().setTimeout(c,n.settleDelay):c()},l=Q.config.globalViewTransitions;n.hasOwnProperty("transition")&&(l=n.transition);const a=r.contextElement||te();if(l&&ae(a,"htmx:beforeTransition",r.eventInfo)&&"undefined"!=typeof Promise&&document.startViewTransition){const e=new Promise(function(e,t){o=e,i=t}),t=s;s=function(){document.startViewTransition(function(){return t(),e})}}try{n?.swapDelay&&n.swapDelay>0?b().setTimeout(s,n.swapDelay):s()}catch(s){throw fe(a,"htmx:swapError",r.eventInfo),re(i),s}}function Je(e,t,n){const r=e.getResponseHeader(t);if(0===r.indexOf("{")){const e=v(r);for(const t in e)if(e.hasOwnProperty(t)){let r=e[t];k(r)?n=void 0!==r.target?r.target:n:r={value:r},ae(n,t,r)}}else{const e=r.split(",");for(let t=0;t<e.length;t++)ae(n,e[t].trim(),[])}}const Ke=/\s/,E=/[\s,]/,Ge=/[_$a-zA-Z]/,We=/[_$a-zA-Z0-9]/,Ze=['"',"'","/"],C=/[^\s]/,Ye=/[{(]/,Qe=/[})]/;function et(e){const t=[];let n=0;for(;n<e.length;){if(Ge.exec(e.charAt(n))){for(var r=n;We.exec(e.charAt(n+1));)n++;t.push(e.substring(r,n+1))}else if(-1!==Ze.indexOf(e.charAt(n))){const o=e.charAt(n);r=n;for(n++;n<e.length&&e.charAt(n)!==o;)"\\"===e.charAt(n)&&n++,n++;t.push(e.substring(r,n+1))}else{const r=e.charAt(n);t.push(r)}n++}return t}function tt(e,t,n){return Ge.exec(e.charAt(0))&&"true"!==e&&"false"!==e&&"this"!==e&&e!==n&&"."!==t}function nt(e,t,n){if("["===t[0]){t.shift();let r=1,o=" return (function("+n+"){ return (",i=null;for(;t.length>0;){const s=t[0];if("]"===s){if(r--,0===r){null===i&&(o+="true"),t.shift(),o+=")})";try{const t=On(e,function(){return Function(o)()},function(){return!0});return t.source=o,t}catch(e){return fe(te().body,"htmx:syntax:error",{error:e,source:o}),null}}}else"["===s&&r++;tt(s,i,n)?o+="(("+n+"."+s+") ? ("+n+"."+s+") : (window."+s+"))":o+=s,i=t.shift()}}}function O(e,t){let n="";for(;e.length>0&&!t.test(e[0]);)n+=e.shift();return n}function rt(e){let t;return e.length>0&&Ye.test(e[0])?(e.shift(),t=O(e,Qe).trim(),e.shift()):t=O(e,E),t}const ot="input, textarea, select";function it(e,t,n){const r=[],o=et(t);do{O(o,C);const t=o.length,n=O(o,/[,\[\s]/);if(""!==n)if("every"===n){const t={trigger:"every"};O(o,C),t.pollInterval=d(O(o,/[,\[\s]/)),O(o,C),(i=nt(e,o,"event"))&&(t.eventFilter=i),r.push(t)}else{const t={trigger:n};var i;for((i=nt(e,o,"event"))&&(t.eventFilter=i),O(o,C);o.length>0&&","!==o[0];){const n=o.shift();if("changed"===n)t.changed=!0;else if("once"===n)t.once=!0;else if("consume"===n)t.consume=!0;else if("delay"===n&&":"===o[0])o.shift(),t.delay=d(O(o,E));else if("from"===n&&":"===o[0]){if(o.shift(),Ye.test(o[0]))var s=rt(o);else if("closest"===(s=O(o,E))||"find"===s||"next"===s||"previous"===s){o.shift();const e=rt(o);e.length>0&&(s+=" "+e)}t.from=s}else"target"===n&&":"===o[0]?(o.shift(),t.target=rt(o)):"throttle"===n&&":"===o[0]?(o.shift(),t.throttle=d(O(o,E))):"queue"===n&&":"===o[0]?(o.shift(),t.queue=O(o,E)):"root"===n&&":"===o[0]?(o.shift(),t[n]=rt(o)):"threshold"===n&&":"===o[0]?(o.shift(),t[n]=O(o,E)):fe(e,"htmx:syntax:error",{token:o.shift()});O(o,C)}r.push(t)}o.length===t&&fe(e,"htmx:syntax:error",{token:o.shift()}),O(o,C)}while(","===o[0]&&o.shift());return n&&(n[t]=r),r}function st(e){const t=a(e,"hx-trigger");let n=[];if(t){const r=Q.config.triggerSpecsCache;n=r&&r[t]||it(e,t,r)}return n.length>0?n:h(e,"form")?[{trigger:"submit"}]:h(e,'input[type="button"], input[type="submit"]')?[{trigger:"click"}]:h(e,ot)?[{trigger:"change"}]:[{trigger:"click"}]}function lt(e){oe(e).cancelled=!0}function ct(e,t,n){const r=oe(e);r.timeout=b().setTimeout(function(){se(e)&&!0!==r.cancelled&&(pt(n,e,Xt("hx:poll:trigger",{triggerSpec:n,target:e}))||t(e),ct(e,t,n))},n.pollInterval)}function ut(e){return location.hostname===e.hostname&&ee(e,"href")&&0!==ee(e,"href").indexOf("#")}function ft(e){return g(e,Q.config.disableSelector)}function at(e,t,n){if(e instanceof HTMLAnchorElement&&ut(e)&&(""===e.target||"_self"===e.target)||"FORM"===e.tagName&&"dialog"!==String(ee(e,"method")).toLowerCase()){let r,o;if(t.boosted=!0,"A"===e.tagName)r="get",o=ee(e,"href");else{const t=ee(e,"method");r=t?t.toLowerCase():"get",o=ee(e,"action"),null!=o&&""!==o||(o=location.href),"get"===r&&o.includes("?")&&(o=o.replace(/\?[^#]+/,""))}n.forEach(function(n){gt(e,function(e,t){const n=ce(e);ft(n)?S(n):he(r,o,n,t)},t,n,!0)})}}function ht(e,t){if("submit"===e.type&&"FORM"===t.tagName)return!0;if("click"===e.type){const e=t.closest('input[type="submit"], button');if(e&&e.form&&"submit"===e.type)return!0;const n=t.closest("a"),r=/^#.+/;if(n&&n.href&&!r.test(n.getAttribute("href")))return!0}return!1}function dt(e,t){return oe(e).boosted&&e instanceof HTMLAnchorElement&&"click"===t.type&&(t.ctrlKey||t.metaKey)}function pt(e,t,n){const r=e.eventFilter;if(r)try{return!0!==r.call(t,n)}catch(e){const t=r.source;return fe(te().body,"htmx:eventFilter:error",{error:e,source:t}),!0}return!1}function gt(e,t,n,r,o){const i=oe(e);let s;s=r.from?m(e,r.from):[e],r.changed&&("lastValue"in i||(i.lastValue=new WeakMap),s.forEach(function(e){i.lastValue.has(r)||i.lastValue.set(r,new WeakMap),i.lastValue.get(r).set(e,e.value)})),ie(s,function(s){const l=function(n){if(!se(e))return void s.removeEventListener(r.trigger,l);if(dt(e,n))return;if((o||ht(n,s))&&n.preventDefault(),pt(r,e,n))return;const a=oe(n);if(a.triggerSpec=r,null==a.handledFor&&(a.handledFor=[]),a.handledFor.indexOf(e)<0){if(a.handledFor.push(e),r.consume&&n.stopPropagation(),r.target&&n.target&&!h(ce(n.target),r.target))return;if(r.once){if(i.triggeredOnce)return;i.triggeredOnce=!0}if(r.changed){const e=n.target,t=e.value,o=i.lastValue.get(r);if(o.has(e)&&o.get(e)===t)return;o.set(e,t)}if(i.delayed&&clearTimeout(i.delayed),i.throttle)return;r.throttle>0?i.throttle||(ae(e,"htmx:trigger"),t(e,n),i.throttle=b().setTimeout(function(){i.throttle=null},r.throttle)):r.delay>0?i.delayed=b().setTimeout(function(){ae(e,"htmx:trigger"),t(e,n)},r.delay):(ae(e,"htmx:trigger"),t(e,n))}};null==n.listenerInfos&&(n.listenerInfos=[]),n.listenerInfos.push({trigger:r.trigger,listener:l,on:s}),s.addEventListener(r.trigger,l)})}let mt=!1,yt=null;function xt(){yt||(yt=function(){mt=!0},window.addEventListener("scroll",yt),window.addEventListener("resize",yt),setInterval(function(){mt&&(mt=!1,ie(te().querySelectorAll("[hx-trigger*='revealed'],[data-hx-trigger*='revealed']"),function(e){bt(e)}))},200))}function bt(e){if(!s(e,"data-hx-revealed")&&F(e)){e.setAttribute("data-hx-revealed","true");oe(e).initHash?ae(e,"revealed"):e.addEventListener("htmx:afterProcessNode",function(){ae(e,"revealed")},{once:!0})}}function vt(e,t,n,r){const o=function(){n.loaded||(n.loaded=!0,ae(e,"htmx:trigger"),t(e))};r>0?b().setTimeout(o,r):o()}function wt(e,t,n){let r=!1;return ie(de,function(o){if(s(e,"hx-"+o)){const i=a(e,"hx-"+o);r=!0,t.path=i,t.verb=o,n.forEach(function(n){St(e,n,t,function(e,t){const n=ce(e);ft(n)?S(n):he(o,i,n,t)})})}}),r}function St(e,t,n,r){if("revealed"===t.trigger)xt(),gt(e,r,n,t),bt(ce(e));else if("intersect"===t.trigger){const o={};t.root&&(o.root=ue(e,t.root)),t.threshold&&(o.threshold=parseFloat(t.threshold));const i=new IntersectionObserver(function(t){for(let n=0;n<t.length;n++){if(t[n].isIntersecting){ae(e,"intersect");break}}},o);i.observe(ce(e)),gt(ce(e),r,n,t)}else n.firstInitCompleted||"load"!==t.trigger?t.pollInterval>0?(n.polling=!0,ct(ce(e),r,t)):gt(e,r,n,t):pt(t,e,Xt("load",{elt:e}))||vt(ce(e),r,n,t.delay)}function Et(e){const t=ce(e);if(!t)return!1;const n=t.attributes;for(let e=0;e<n.length;e++){const t=n[e].name;if(l(t,"hx-on:")||l(t,"data-hx-on:")||l(t,"hx-on-")||l(t,"data-hx-on-"))return!0}return!1}const Ct=(new XPathEvaluator).createExpression('.//*[@*[ starts-with(name(), "hx-on:") or starts-with(name(), "data-hx-on:") or starts-with(name(), "hx-on-") or starts-with(name(), "data-hx-on-") ]]');function Ot(e,t){Et(e)&&t.push(ce(e));const n=Ct.evaluate(e);let r=null;for(;r=n.iterateNext();)t.push(ce(r))}function Ht(e){const t=[];if(e instanceof DocumentFragment)for(const n of e.childNodes)Ot(n,t);else Ot(e,t);return t}function Tt(e){if(e.querySelectorAll){const n=", [hx-boost] a, [data-hx-boost] a, a[hx-boost], a[data-hx-boost]",r=[];for(const e in jn){const n=jn[e];if(n.getSelectors){var t=n.getSelectors();t&&r.push(t)}}return e.querySelectorAll(R+n+", form, [type='submit'], [hx-ext], [data-hx-ext], [hx-trigger], [data-hx-trigger]"+r.flat().map(e=>", "+e).join(""))}return[]}function Rt(e){const t=At(e.target),n=Nt(e);n&&(n.lastButtonClicked=t)}function qt(e){const t=Nt(e);t&&(t.lastButtonClicked=null)}function At(e){return g(ce(e),"button, input[type='submit']")}function Lt(e){return e.form||g(e,"form")}function Nt(e){const t=At(e.target);if(!t)return;const n=Lt(t);return n?oe(n):void 0}function It(e){e.addEventListener("click",Rt),e.addEventListener("focusin",Rt),e.addEventListener("focusout",qt)}function Dt(e,t,n){const r=oe(e);let o;Array.isArray(r.onHandlers)||(r.onHandlers=[]);const i=function(t){On(e,function(){ft(e)||(o||(o=new Function("event",n)),o.call(e,t))})};e.addEventListener(t,i),r.onHandlers.push({event:t,listener:i})}function Pt(e){Pe(e);for(let t=0;t<e.attributes.length;t++){const n=e.attributes[t].name,r=e.attributes[t].value;if(l(n,"hx-on")||l(n,"data-hx-on")){const t=n.indexOf("-on")+3,o=n.slice(t,t+1);if("-"===o||":"===o){let o=n.slice(t+1);l(o,":")?o="htmx"+o:l(o,"-")?o="htmx:"+o.slice(1):l(o,"htmx-")&&(o="htmx:"+o.slice(5)),Dt(e,o,r)}}}}function kt(e){ae(e,"htmx:beforeProcessNode");const t=oe(e),n=st(e);wt(e,t,n)||("true"===ne(e,"hx-boost")?at(e,t,n):s(e,"hx-trigger")&&n.forEach(function(n){St(e,n,t,function(){})})),("FORM"===e.tagName||"submit"===ee(e,"type")&&s(e,"form"))&&It(e),t.firstInitCompleted=!0,ae(e,"htmx:afterProcessNode")}function Mt(e){if(!(e instanceof Element))return!1;const t=oe(e),n=De(e);return t.initHash!==n&&(ke(e),t.initHash=n,!0)}function Ft(e){if(ft(e=w(e)))return void S(e);const t=[];Mt(e)&&t.push(e),ie(Tt(e),function(e){ft(e)?S(e):Mt(e)&&t.push(e)}),ie(Ht(e),Pt),ie(t,kt)}function Bt(e){return e.replace(/([a-z0-9])([A-Z])/g,"$1-$2").toLowerCase()}function Xt(e,t){return new CustomEvent(e,{bubbles:!0,cancelable:!0,composed:!0,detail:t})}function fe(e,t,n){ae(e,t,le({error:t},n))}function Ut(e){return"htmx:afterProcessNode"===e}function Vt(e,t,n){ie(Jn(e,[],n),function(e){try{t(e)}catch(e){H(e)}})}function H(e){console.error(e)}function ae(e,t,n){e=w(e),null==n&&(n={}),n.elt=e;const r=Xt(t,n);Q.logger&&!Ut(t)&&Q.logger(e,t,n),n.error&&(H(n.error),ae(e,"htmx:error",{errorInfo:n}));let o=e.dispatchEvent(r);const i=Bt(t);if(o&&i!==t){const t=Xt(i,r.detail);o=o&&e.dispatchEvent(t)}return Vt(ce(e),function(e){o=o&&!1!==e.onEvent(t,r)&&!r.defaultPrevented}),o}let jt;function $t(e){jt=e,X()&&sessionStorage.setItem("htmx-current-path-for-history",e)}function _t(){return te().querySelector("[hx-history-elt],[data-hx-history-elt]")||te().body}function zt(e,t){if(!X())return;const n=Kt(t),r=te().title,o=window.scrollY;if(Q.config.historyCacheSize<=0)return void sessionStorage.removeItem("htmx-history-cache");e=U(e);const i=v(sessionStorage.getItem("htmx-history-cache"))||[];for(let t=0;t<i.length;t++)if(i[t].url===e){i.splice(t,1);break}const s={url:e,content:n,title:r,scroll:o};for(ae(te().body,"htmx:historyItemCreated",{item:s,cache:i}),i.push(s);i.length>Q.config.historyCacheSize;)i.shift();for(;i.length>0;)try{sessionStorage.setItem("htmx-history-cache",JSON.stringify(i));break}catch(t){fe(te().body,"htmx:historyCacheError",{cause:t,cache:i}),i.shift()}}function Jt(e){if(!X())return null;e=U(e);const t=v(sessionStorage.getItem("htmx-history-cache"))||[];for(let n=0;n<t.length;n++)if(t[n].url===e)return t[n];return null}function Kt(e){const t=Q.config.requestClass,n=e.cloneNode(!0);return ie(x(n,"."+t),function(e){G(e,t)}),ie(x(n,"[data-disabled-by-htmx]"),function(e){e.removeAttribute("disabled")}),n.innerHTML}function Gt(){const e=_t();let t=jt;X()&&(t=sessionStorage.getItem("htmx-current-path-for-history")),t=t||location.pathname+location.search;te().querySelector('[hx-history="false" i],[data-hx-history="false" i]')||(ae(te().body,"htmx:beforeHistorySave",{path:t,historyElt:e}),zt(t,e)),Q.config.historyEnabled&&history.replaceState({htmx:!0},te().title,location.href)}function Wt(e){Q.config.getCacheBusterParam&&(Y(e=e.replace(/org\.htmx\.cache-buster=[^&]*&?/,""),"&")||Y(e,"?"))&&(e=e.slice(0,-1)),Q.config.historyEnabled&&history.pushState({htmx:!0},"",e),$t(e)}function Zt(e){Q.config.historyEnabled&&history.replaceState({htmx:!0},"",e),$t(e)}function Yt(e){ie(e,function(e){e.call(void 0)})}function Qt(e){const t=new XMLHttpRequest,n={swapStyle:"innerHTML",swapDelay:0,settleDelay:0},r={path:e,xhr:t,historyElt:_t(),swapSpec:n};t.open("GET",e,!0),Q.config.historyRestoreAsHxRequest&&t.setRequestHeader("HX-Request","true"),t.setRequestHeader("HX-History-Restore-Request","true"),t.setRequestHeader("HX-Current-URL",location.href),t.onload=function(){this.status>=200&&this.status<400?(r.response=this.response,ae(te().body,"htmx:historyCacheMissLoad",r),ze(r.historyElt,r.response,n,{contextElement:r.historyElt,historyRequest:!0}),$t(r.path),ae(te().body,"htmx:historyRestore",{path:e,cacheMiss:!0,serverResponse:r.response})):fe(te().body,"htmx:historyCacheMissLoadError",r)},ae(te().body,"htmx:historyCacheMiss",r)&&t.send()}function en(e){Gt();const t=Jt(e=e||location.pathname+location.search);if(t){const n={swapStyle:"innerHTML",swapDelay:0,settleDelay:0,scroll:t.scroll},r={path:e,item:t,historyElt:_t(),swapSpec:n};ae(te().body,"htmx:historyCacheHit",r)&&(ze(r.historyElt,t.content,n,{contextElement:r.historyElt,title:t.title}),$t(r.path),ae(te().body,"htmx:historyRestore",r))}else Q.config.refreshOnHistoryMiss?Q.location.reload(!0):Qt(e)}function tn(e){let t=we(e,"hx-indicator");return null==t&&(t=[e]),ie(t,function(e){const t=oe(e);t.requestCount=(t.requestCount||0)+1,e.classList.add.call(e.classList,Q.config.requestClass)}),t}function nn(e){let t=we(e,"hx-disabled-elt");return null==t&&(t=[]),ie(t,function(e){const t=oe(e);t.requestCount=(t.requestCount||0)+1,e.setAttribute("disabled",""),e.setAttribute("data-disabled-by-htmx","")}),t}function rn(e,t){ie(e.concat(t),function(e){const t=oe(e);t.requestCount=(t.requestCount||1)-1}),ie(e,function(e){0===oe(e).requestCount&&e.classList.remove.call(e.classList,Q.config.requestClass)}),ie(t,function(e){0===oe(e).requestCount&&(e.removeAttribute("disabled"),e.removeAttribute("data-disabled-by-htmx"))})}function on(e,t){for(let n=0;n<e.length;n++){if(e[n].isSameNode(t))return!0}return!1}function sn(e){const t=e;return""!==t.name&&null!=t.name&&!t.disabled&&!g(t,"fieldset[disabled]")&&("button"!==t.type&&"submit"!==t.type&&"image"!==t.tagName&&"reset"!==t.tagName&&"file"!==t.tagName&&("checkbox"!==t.type&&"radio"!==t.type||t.checked))}function ln(e,t,n){null!=e&&null!=t&&(Array.isArray(t)?t.forEach(function(t){n.append(e,t)}):n.append(e,t))}function cn(e,t,n){if(null!=e&&null!=t){let r=n.getAll(e);r=Array.isArray(t)?r.filter(e=>t.indexOf(e)<0):r.filter(e=>e!==t),n.delete(e),ie(r,t=>n.append(e,t))}}function un(e){return e instanceof HTMLSelectElement&&e.multiple?M(e.querySelectorAll("option:checked")).map(function(e){return e.value}):e instanceof HTMLInputElement&&e.files?M(e.files):e.value}function fn(e,t,n,r,o){if(null!=r&&!on(e,r)){if(e.push(r),sn(r)){ln(ee(r,"name"),un(r),t),o&&an(r,n)}r instanceof HTMLFormElement&&(ie(r.elements,function(r){e.indexOf(r)>=0?cn(r.name,un(r),t):e.push(r),o&&an(r,n)}),new FormData(r).forEach(function(e,n){e instanceof File&&""===e.name||ln(n,e,t)}))}}function an(e,t){const n=e;n.willValidate&&(ae(n,"htmx:validation:validate"),n.checkValidity()||(ae(n,"htmx:validation:failed",{message:n.validationMessage,validity:n.validity})&&!t.length&&Q.config.reportValidityOfForms&&n.reportValidity(),t.push({elt:n,message:n.validationMessage,validity:n.validity})))}function hn(e,t){for(const n of t.keys())e.delete(n);return t.forEach(function(t,n){e.append(n,t)}),e}function dn(e,t){const n=[],r=new FormData,o=new FormData,i=[],s=oe(e);s.lastButtonClicked&&!se(s.lastButtonClicked)&&(s.lastButtonClicked=null);let l=e instanceof HTMLFormElement&&!0!==e.noValidate||"true"===a(e,"hx-validate");if(s.lastButtonClicked&&(l=l&&!0!==s.lastButtonClicked.formNoValidate),"get"!==t&&fn(n,o,i,Lt(e),l),fn(n,r,i,e,l),s.lastButtonClicked||"BUTTON"===e.tagName||"INPUT"===e.tagName&&"submit"===ee(e,"type")){const t=s.lastButtonClicked||e;ln(ee(t,"name"),t.value,o)}return ie(we(e,"hx-include"),function(e){fn(n,r,i,ce(e),l),h(e,"form")||ie(p(e).querySelectorAll(ot),function(e){fn(n,r,i,e,l)})}),hn(r,o),{errors:i,formData:r,values:kn(r)}}function pn(e,t,n){""!==e&&(e+="&"),"[object Object]"===String(n)&&(n=JSON.stringify(n));const r=encodeURIComponent(n);return e+=encodeURIComponent(t)+"="+r}function gn(e){e=Dn(e);let t="";return e.forEach(function(e,n){t=pn(t,n,e)}),t}function mn(e,t,n){const r={"HX-Request":"true","HX-Trigger":ee(e,"id"),"HX-Trigger-Name":ee(e,"name"),"HX-Target":a(t,"id"),"HX-Current-URL":location.href};return Cn(e,"hx-headers",!1,r),void 0!==n&&(r["HX-Prompt"]=n),oe(e).boosted&&(r["HX-Boosted"]="true"),r}function yn(e,t){const n=ne(t,"hx-params");if(n){if("none"===n)return new FormData;if("*"===n)return e;if(0===n.indexOf("not "))return ie(n.slice(4).split(","),function(t){t=t.trim(),e.delete(t)}),e;{const t=new FormData;return ie(n.split(","),function(n){n=n.trim(),e.has(n)&&e.getAll(n).forEach(function(e){t.append(n,e)})}),t}}return e}function xn(e){return!!ee(e,"href")&&ee(e,"href").indexOf("#")>=0}function bn(e,t){const n=t||ne(e,"hx-swap"),r={swapStyle:oe(e).boosted?"innerHTML":Q.config.defaultSwapStyle,swapDelay:Q.config.defaultSwapDelay,settleDelay:Q.config.defaultSettleDelay};if(Q.config.scrollIntoViewOnBoost&&oe(e).boosted&&!xn(e)&&(r.show="top"),n){const e=B(n);if(e.length>0)for(let t=0;t<e.length;t++){const n=e[t];if(0===n.indexOf("swap:"))r.swapDelay=d(n.slice(5));else if(0===n.indexOf("settle:"))r.settleDelay=d(n.slice(7));else if(0===n.indexOf("transition:"))r.transition="true"===n.slice(11);else if(0===n.indexOf("ignoreTitle:"))r.ignoreTitle="true"===n.slice(12);else if(0===n.indexOf("scroll:")){const e=(i=n.slice(7).split(":")).pop();var o=i.length>0?i.join(":"):null;r.scroll=e,r.scrollTarget=o}else if(0===n.indexOf("show:")){var i;const e=(i=n.slice(5).split(":")).pop();o=i.length>0?i.join(":"):null;r.show=e,r.showTarget=o}else if(0===n.indexOf("focus-scroll:")){const e=n.slice(13);r.focusScroll="true"==e}else 0==t?r.swapStyle=n:H("Unknown modifier in hx-swap: "+n)}}return r}function vn(e){return"multipart/form-data"===ne(e,"hx-encoding")||h(e,"form")&&"multipart/form-data"===ee(e,"enctype")}function wn(e,t,n){let r=null;return Vt(t,function(o){null==r&&(r=o.encodeParameters(e,n,t))}),null!=r?r:vn(t)?hn(new FormData,Dn(n)):gn(n)}function Sn(e){return{tasks:[],elts:[e]}}function En(e,t){const n=e[0],r=e[e.length-1];if(t.scroll){var o=null;t.scrollTarget&&(o=ce(ue(n,t.scrollTarget))),"top"===t.scroll&&(n||o)&&((o=o||n).scrollTop=0),"bottom"===t.scroll&&(r||o)&&((o=o||r).scrollTop=o.scrollHeight),"number"==typeof t.scroll&&b().setTimeout(function(){window.scrollTo(0,t.scroll)},0)}if(t.show){o=null;if(t.showTarget){let e=t.showTarget;"window"===t.showTarget&&(e="body"),o=ce(ue(n,e))}"top"===t.show&&(n||o)&&(o=o||n).scrollIntoView({block:"start",behavior:Q.config.scrollBehavior}),"bottom"===t.show&&(r||o)&&(o=o||r).scrollIntoView({block:"end",behavior:Q.config.scrollBehavior})}}function Cn(e,t,n,r,o){if(null==r&&(r={}),null==e)return r;const i=a(e,t);if(i){let t,s=i.trim(),l=n;if("unset"===s)return null;0===s.indexOf("javascript:")?(s=s.slice(11),l=!0):0===s.indexOf("js:")&&(s=s.slice(3),l=!0),0!==s.indexOf("{")&&(s="{"+s+"}"),t=l?On(e,function(){return o?Function("event","return ("+s+")").call(e,o):Function("return ("+s+")").call(e)},{}):v(s);for(const e in t)t.hasOwnProperty(e)&&null==r[e]&&(r[e]=t[e])}return Cn(ce(u(e)),t,n,r,o)}function On(e,t,n){return Q.config.allowEval?t():(fe(e,"htmx:evalDisallowedError"),n)}function Hn(e,t,n){return Cn(e,"hx-vars",!0,n,t)}function Tn(e,t,n){return Cn(e,"hx-vals",!1,n,t)}function Rn(e,t){return le(Hn(e,t),Tn(e,t))}function qn(e,t,n){if(null!==n)try{e.setRequestHeader(t,n)}catch(r){e.setRequestHeader(t,encodeURIComponent(n)),e.setRequestHeader(t+"-URI-AutoEncoded","true")}}function An(e){if(e.responseURL)try{const t=new URL(e.responseURL);return t.pathname+t.search}catch(t){fe(te().body,"htmx:badResponseUrl",{url:e.responseURL})}}function T(e,t){return t.test(e.getAllResponseHeaders())}function Ln(e,t,n){if(e=e.toLowerCase(),n){if(n instanceof Element||"string"==typeof n)return he(e,t,null,null,{targetOverride:w(n)||ve,returnPromise:!0});{let r=w(n.target);return(n.target&&!r||n.source&&!r&&!w(n.source))&&(r=ve),he(e,t,w(n.source),n.event,{handler:n.handler,headers:n.headers,values:n.values,targetOverride:r,swapOverride:n.swap,select:n.select,returnPromise:!0,push:n.push,replace:n.replace,selectOOB:n.selectOOB})}}return he(e,t,null,null,{returnPromise:!0})}function Nn(e){const t=[];for(;e;)t.push(e),e=e.parentElement;return t}function In(e,t,n){const r=new URL(t,"about:"!==location.protocol?location.href:window.origin),o=("about:"!==location.protocol?location.origin:window.origin)===r.origin;return!(Q.config.selfRequestsOnly&&!o)&&ae(e,"htmx:validateUrl",le({url:r,sameHost:o},n))}function Dn(e){if(e instanceof FormData)return e;const t=new FormData;for(const n in e)e.hasOwnProperty(n)&&(e[n]&&"function"==typeof e[n].forEach?e[n].forEach(function(e){t.append(n,e)}):"object"!=typeof e[n]||e[n]instanceof Blob?t.append(n,e[n]):t.append(n,JSON.stringify(e[n])));return t}function Pn(e,t,n){return new Proxy(n,{get:function(n,r){return"number"==typeof r?n[r]:"length"===r?n.length:"push"===r?function(r){n.push(r),e.append(t,r)}:"function"==typeof n[r]?function(){n[r].apply(n,arguments),e.delete(t),n.forEach(function(n){e.append(t,n)})}:n[r]&&1===n[r].length?n[r][0]:n[r]},set:function(n,r,o){return n[r]=o,e.delete(t),n.forEach(function(n){e.append(t,n)}),!0}})}function kn(e){return new Proxy(e,{get:function(t,n){if("symbol"==typeof n){const r=Reflect.get(t,n);return"function"==typeof r?function(){return r.apply(e,arguments)}:r}if("toJSON"===n)return()=>Object.fromEntries(e);if(n in t&&"function"==typeof t[n])return function(){return e[n].apply(e,arguments)};const r=e.getAll(n);return 0===r.length?void 0:1===r.length?r[0]:Pn(t,n,r)},set:function(e,t,n){return"string"==typeof t&&(e.delete(t),n&&"function"==typeof n.forEach?n.forEach(function(n){e.append(t,n)}):"object"!=typeof n||n instanceof Blob?e.append(t,n):e.append(t,JSON.stringify(n)),!0)},deleteProperty:function(e,t){return"string"==typeof t&&e.delete(t),!0},ownKeys:function(e){return Reflect.ownKeys(Object.fromEntries(e))},getOwnPropertyDescriptor:function(e,t){return Reflect.getOwnPropertyDescriptor(Object.fromEntries(e),t)}})}function he(e,t,n,r,o,i){let s=null,l=null;if((o=null!=o?o:{}).returnPromise&&"undefined"!=typeof Promise)var a=new Promise(function(e,t){s=e,l=t});null==n&&(n=te().body);const c=o.handler||Vn,u=o.select||null;if(!se(n))return re(s),a;const f=o.targetOverride||ce(Ee(n));if(null==f||f==ve)return fe(n,"htmx:targetError",{target:ne(n,"hx-target")}),re(l),a;let h=oe(n);const d=h.lastButtonClicked;if(d){const n=ee(d,"formaction");null!=n&&(t=n);const r=ee(d,"formmethod");if(null!=r){if(!de.includes(r.toLowerCase()))return re(s),a;e=r}}const p=ne(n,"hx-confirm");if(void 0===i){const i=function(i){return he(e,t,n,r,o,!!i)};if(!1===ae(n,"htmx:confirm",{target:f,elt:n,path:t,verb:e,triggeringEvent:r,etc:o,issueRequest:i,question:p}))return re(s),a}let g=n,m=ne(n,"hx-sync"),x=null,y=!1;if(m){const e=m.split(":"),t=e[0].trim();if(g="this"===t?Se(n,"hx-sync"):ce(ue(n,t)),m=(e[1]||"drop").trim(),h=oe(g),"drop"===m&&h.xhr&&!0!==h.abortable)return re(s),a;if("abort"===m){if(h.xhr)return re(s),a;y=!0}else if("replace"===m)ae(g,"htmx:abort");else if(0===m.indexOf("queue")){x=(m.split(" ")[1]||"last").trim()}}if(h.xhr){if(!h.abortable){if(null==x){if(r){const e=oe(r);e&&e.triggerSpec&&e.triggerSpec.queue&&(x=e.triggerSpec.queue)}null==x&&(x="last")}return null==h.queuedRequests&&(h.queuedRequests=[]),"first"===x&&0===h.queuedRequests.length||"all"===x?h.queuedRequests.push(function(){he(e,t,n,r,o)}):"last"===x&&(h.queuedRequests=[],h.queuedRequests.push(function(){he(e,t,n,r,o)})),re(s),a}ae(g,"htmx:abort")}const b=new XMLHttpRequest;h.xhr=b,h.abortable=y;const v=function(){if(h.xhr=null,h.abortable=!1,null!=h.queuedRequests&&h.queuedRequests.length>0){h.queuedRequests.shift()()}},w=ne(n,"hx-prompt");if(w){var S=prompt(w);if(null===S||!ae(n,"htmx:prompt",{prompt:S,target:f}))return re(s),v(),a}if(p&&!i&&!confirm(p))return re(s),v(),a;let E=mn(n,f,S);"get"===e||vn(n)||(E["Content-Type"]="application/x-www-form-urlencoded"),o.headers&&(E=le(E,o.headers));const O=dn(n,e);let C=O.errors;const H=O.formData;o.values&&hn(H,Dn(o.values));const T=hn(H,Dn(Rn(n,r)));let R=yn(T,n);Q.config.getCacheBusterParam&&"get"===e&&R.set("org.htmx.cache-buster",ee(f,"id")||"true"),null!=t&&""!==t||(t=location.href);const q=Cn(n,"hx-request"),L=oe(n).boosted;let A=Q.config.methodsThatUseUrlParams.indexOf(e)>=0;const N={boosted:L,useUrlParams:A,formData:R,parameters:kn(R),unfilteredFormData:T,unfilteredParameters:kn(T),headers:E,elt:n,target:f,verb:e,errors:C,withCredentials:o.credentials||q.credentials||Q.config.withCredentials,timeout:o.timeout||q.timeout||Q.config.timeout,path:t,triggeringEvent:r};if(!ae(n,"htmx:configRequest",N))return re(s),v(),a;if(t=N.path,e=N.verb,E=N.headers,R=Dn(N.parameters),C=N.errors,A=N.useUrlParams,C&&C.length>0)return ae(n,"htmx:validation:halted",N),re(s),v(),a;const I=t.split("#"),D=I[0],M=I[1];let P=t;if(A){P=D;!R.keys().next().done&&(P.indexOf("?")<0?P+="?":P+="&",P+=gn(R),M&&(P+="#"+M))}if(!In(n,P,N))return fe(n,"htmx:invalidPath",N),re(l),v(),a;if(b.open(e.toUpperCase(),P,!0),b.overrideMimeType("text/html"),b.withCredentials=N.withCredentials,b.timeout=N.timeout,q.noHeaders);else for(const e in E)if(E.hasOwnProperty(e)){const t=E[e];qn(b,e,t)}const k={xhr:b,target:f,requestConfig:N,etc:o,boosted:L,select:u,pathInfo:{requestPath:t,finalRequestPath:P,responsePath:null,anchor:M}};if(b.onload=function(){try{const e=Nn(n);if(k.pathInfo.responsePath=An(b),c(n,k),!0!==k.keepIndicators&&rn(F,X),ae(n,"htmx:afterRequest",k),ae(n,"htmx:afterOnLoad",k),!se(n)){let t=null;for(;e.length>0&&null==t;){const n=e.shift();se(n)&&(t=n)}t&&(ae(t,"htmx:afterRequest",k),ae(t,"htmx:afterOnLoad",k))}re(s)}catch(e){throw fe(n,"htmx:onLoadError",le({error:e},k)),e}finally{v()}},b.onerror=function(){rn(F,X),fe(n,"htmx:afterRequest",k),fe(n,"htmx:sendError",k),re(l),v()},b.onabort=function(){rn(F,X),fe(n,"htmx:afterRequest",k),fe(n,"htmx:sendAbort",k),re(l),v()},b.ontimeout=function(){rn(F,X),fe(n,"htmx:afterRequest",k),fe(n,"htmx:timeout",k),re(l),v()},!ae(n,"htmx:beforeRequest",k))return re(s),v(),a;var F=tn(n),X=nn(n);ie(["loadstart","loadend","progress","abort"],function(e){ie([b,b.upload],function(t){t.addEventListener(e,function(t){ae(n,"htmx:xhr:"+e,{lengthComputable:t.lengthComputable,loaded:t.loaded,total:t.total})})})}),ae(n,"htmx:beforeSend",k);const B=A?null:wn(b,n,R);return b.send(B),a}function Mn(e,t){const n=t.xhr;let r=null,o=null;if(T(n,/HX-Push:/i)?(r=n.getResponseHeader("HX-Push"),o="push"):T(n,/HX-Push-Url:/i)?(r=n.getResponseHeader("HX-Push-Url"),o="push"):T(n,/HX-Replace-Url:/i)&&(r=n.getResponseHeader("HX-Replace-Url"),o="replace"),r)return"false"===r?{}:{type:o,path:r};const i=t.pathInfo.finalRequestPath,s=t.pathInfo.responsePath,l=t.etc.push||ne(e,"hx-push-url"),a=t.etc.replace||ne(e,"hx-replace-url"),c=oe(e).boosted;let u=null,f=null;return l?(u="push",f=l):a?(u="replace",f=a):c&&(u="push",f=s||i),f?"false"===f?{}:("true"===f&&(f=s||i),t.pathInfo.anchor&&-1===f.indexOf("#")&&(f=f+"#"+t.pathInfo.anchor),{type:u,path:f}):{}}function Fn(e,t){return new RegExp(e.code).test(t.toString(10))}function Bn(e){for(var t=0;t<Q.config.responseHandling.length;t++){var n=Q.config.responseHandling[t];if(Fn(n,e.status))return n}return{swap:!1}}function Xn(e){if(e){const t=f("title");t?t.textContent=e:window.document.title=e}}function Un(e,t){if("this"===t)return e;const n=ce(ue(e,t));if(null==n)throw fe(e,"htmx:targetError",{target:t}),new Error(`Invalid re-target ${t}`);return n}function Vn(e,t){const n=t.xhr;let r=t.target;const o=t.etc,i=t.select;if(!ae(e,"htmx:beforeOnLoad",t))return;if(T(n,/HX-Trigger:/i)&&Je(n,"HX-Trigger",e),T(n,/HX-Location:/i)){let e=n.getResponseHeader("HX-Location");var s={};return 0===e.indexOf("{")&&(e=(s=v(e)).path,delete s.path),s.push=s.push||"true",void Ln("get",e,s)}const l=T(n,/HX-Refresh:/i)&&"true"===n.getResponseHeader("HX-Refresh");if(T(n,/HX-Redirect:/i))return t.keepIndicators=!0,Q.location.href=n.getResponseHeader("HX-Redirect"),void(l&&Q.location.reload());if(l)return t.keepIndicators=!0,void Q.location.reload();const a=Mn(e,t),c=Bn(n),u=c.swap;let f=!!c.error,h=Q.config.ignoreTitle||c.ignoreTitle,d=c.select;c.target&&(t.target=Un(e,c.target));var p=o.swapOverride;null==p&&c.swapOverride&&(p=c.swapOverride),T(n,/HX-Retarget:/i)&&(t.target=Un(e,n.getResponseHeader("HX-Retarget"))),T(n,/HX-Reswap:/i)&&(p=n.getResponseHeader("HX-Reswap"));var g=n.response,m=le({shouldSwap:u,serverResponse:g,isError:f,ignoreTitle:h,selectOverride:d,swapOverride:p},t);if((!c.event||ae(r,c.event,m))&&ae(r,"htmx:beforeSwap",m)){if(r=m.target,g=m.serverResponse,f=m.isError,h=m.ignoreTitle,d=m.selectOverride,p=m.swapOverride,t.target=r,t.failed=f,t.successful=!f,m.shouldSwap){286===n.status&&lt(e),Vt(e,function(t){g=t.transformResponse(g,n,e)}),a.type&&Gt();var x=bn(e,p);x.hasOwnProperty("ignoreTitle")||(x.ignoreTitle=h),r.classList.add(Q.config.swappingClass),i&&(d=i),T(n,/HX-Reselect:/i)&&(d=n.getResponseHeader("HX-Reselect"));const s=o.selectOOB||ne(e,"hx-select-oob"),l=ne(e,"hx-select");ze(r,g,x,{select:"unset"===d?null:d||l,selectOOB:s,eventInfo:t,anchor:t.pathInfo.anchor,contextElement:e,afterSwapCallback:function(){if(T(n,/HX-Trigger-After-Swap:/i)){let t=e;se(e)||(t=te().body),Je(n,"HX-Trigger-After-Swap",t)}},afterSettleCallback:function(){if(T(n,/HX-Trigger-After-Settle:/i)){let t=e;se(e)||(t=te().body),Je(n,"HX-Trigger-After-Settle",t)}},beforeSwapCallback:function(){a.type&&(ae(te().body,"htmx:beforeHistoryUpdate",le({history:a},t)),"push"===a.type?(Wt(a.path),ae(te().body,"htmx:pushedIntoHistory",{path:a.path})):(Zt(a.path),ae(te().body,"htmx:replacedInHistory",{path:a.path})))}})}f&&fe(e,"htmx:responseError",le({error:"Response Status Error Code "+n.status+" from "+t.pathInfo.requestPath},t))}}$t(location.pathname+location.search);const jn={};function $n(){return{init:function(e){return null},getSelectors:function(){return null},onEvent:function(e,t){return!0},transformResponse:function(e,t,n){return e},isInlineSwap:function(e){return!1},handleSwap:function(e,t,n,r){return!1},encodeParameters:function(e,t,n){return null}}}function _n(e,t){t.init&&t.init(n),jn[e]=le($n(),t)}function zn(e){delete jn[e]}function Jn(e,t,n){if(null==t&&(t=[]),null==e)return t;null==n&&(n=[]);const r=a(e,"hx-ext");return r&&ie(r.split(","),function(e){if("ignore:"!=(e=e.replace(/ /g,"")).slice(0,7)){if(n.indexOf(e)<0){const n=jn[e];n&&t.indexOf(n)<0&&t.push(n)}}else n.push(e.slice(7))}),Jn(ce(u(e)),t,n)}var Kn=!1;function Gn(e){Kn||"complete"===te().readyState?e():te().addEventListener("DOMContentLoaded",e)}function Wn(){if(!1!==Q.config.includeIndicatorStyles){const e=Q.config.inlineStyleNonce?` nonce="${Q.config.inlineStyleNonce}"`:"",t=Q.config.indicatorClass,n=Q.config.requestClass;te().head.insertAdjacentHTML("beforeend",`<style${e}>.${t}{opacity:0;visibility: hidden} .${n} .${t}, .${n}.${t}{opacity:1;visibility: visible;transition: opacity 200ms ease-in}</style>`)}}function Zn(){const e=te().querySelector('meta[name="htmx-config"]');return e?v(e.content):null}function Yn(){const e=Zn();e&&(Q.config=le(Q.config,e))}return te().addEventListener("DOMContentLoaded",function(){Kn=!0}),Gn(function(){Yn(),Wn();let e=te().body;Ft(e);const t=te().querySelectorAll("[hx-trigger='restored'],[data-hx-trigger='restored']");e.addEventListener("htmx:abort",function(e){const t=oe(e.detail.elt||e.target);t&&t.xhr&&t.xhr.abort()});const n=window.onpopstate?window.onpopstate.bind(window):null;window.onpopstate=function(e){e.state&&e.state.htmx?(en(),ie(t,function(e){ae(e,"htmx:restored",{document:te(),triggerEvent:ae})})):n&&n(e)},b().setTimeout(function(){ae(e,"htmx:load",{}),e=null},0)}),Q}();!function(){var e=null;function t(){}function n(n,r){if(n&&n.indexOf("<head")>-1){const x=document.createElement("html");var o=n.replace(/<svg(\s[^>]*>|>)([\s\S]*?)<\/svg>/gim,"").match(/(<head(\s[^>]*>|>)([\s\S]*?)<\/head>)/im);if(o){var i=[],s=[],l=[],a=[];x.innerHTML=o;var c=x.querySelector("head"),u=document.head;if(null==c)return;var f=new Map;for(const e of c.children)f.set(e.outerHTML,e);var h=e.getAttributeValue(c,"hx-head")||r;for(const t of u.children){var d=f.has(t.outerHTML),p="re-eval"===t.getAttribute("hx-head"),g="true"===e.getAttributeValue(t,"hx-preserve");d||g?p?s.push(t):(f.delete(t.outerHTML),l.push(t)):"append"===h?p&&(s.push(t),a.push(t)):!1!==e.triggerEvent(document.body,"htmx:removingHeadElement",{headElement:t})&&s.push(t)}a.push(...f.values());for(const n of a){t();var m=document.createRange().createContextualFragment(n.outerHTML);t(),!1!==e.triggerEvent(document.body,"htmx:addingHeadElement",{headElement:m})&&(u.appendChild(m),i.push(m))}for(const t of s)!1!==e.triggerEvent(document.body,"htmx:removingHeadElement",{headElement:t})&&u.removeChild(t);e.triggerEvent(document.body,"htmx:afterHeadMerge",{added:i,kept:l,removed:s})}}}htmx.defineExtension("head-support",{init:function(t){e=t,htmx.on("htmx:afterSwap",function(t){let r=t.detail.xhr;if(r){var o=r.response;e.triggerEvent(document.body,"htmx:beforeHeadMerge",t.detail)&&n(o,t.detail.boosted?"merge":"append")}}),htmx.on("htmx:historyRestore",function(t){e.triggerEvent(document.body,"htmx:beforeHeadMerge",t.detail)&&(t.detail.cacheMiss?n(t.detail.serverResponse,"merge"):n(t.detail.item.head,"merge"))}),htmx.on("htmx:historyItemCreated",function(e){e.detail.item.head=document.head.outerHTML})}})}();
\ No newline at end of file
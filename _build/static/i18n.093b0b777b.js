@@ -0,0 +1,509 @@
+/**
+ * Lightweight i18n for static site.
+ * Loads one translation bundle per language from /locales/{lang}.{hash}.json
+ * (see data-bundles on the script tag); bundles already contain the English
+ * fallback for missing keys.
+ * Uses browser language by default, falls back to English.
+ *
+ * Pages built with --localized are already translated (<html
+ * data-i18n-prerendered>); on those, switching language navigates to the
+ * page's hreflang alternate instead of rewriting the DOM.
+ */
+(function() {
+  'use strict';
+
+  var FALLBACK_LANG = 'en';
+  var LANG_COOKIE = 'lang';
+  var BUNDLE_SCRIPT = document.currentScript;
+  var BUNDLES = JSON.parse((BUNDLE_SCRIPT && BUNDLE_SCRIPT.getAttribute('data-bundles')) || '{}');
+  var RTL_LANGUAGES = ['ar', 'he', 'fa'];
+  var SUPPORTED_LANGUAGES = [
+    'en', 'ar', 'bn', 'de', 'es', 'fa', 'fr', 'he', 'hi', 'id',
+    'it', 'ja', 'ko', 'ms', 'nl', 'no', 'pt', 'ru', 'sv', 'sw',
+    'ta', 'te', 'th', 'tr', 'uk', 'vi', 'zh'
+  ];
+
+  var translations = {};
+  var currentLang = FALLBACK_LANG;
+  var ready = false;
+  var readyCallbacks = [];
+  var dateFormatters = {};
+
+  // Keep the site's existing day-month English style. Other languages use
+  // their native Intl conventions.
+  var DATE_LOCALES = { en: 'en-GB' };
+
+  // DOMPurify configuration for translation content
+  var PURIFY_CONFIG = {
+    ALLOWED_TAGS: ['a', 'span', 'em', 'strong', 'br', 'p', 'b', 'i', 'ul', 'ol', 'li'],
+    ALLOWED_ATTR: ['href', 'target', 'rel', 'class']
+  };
+
+  // Get translation by key (e.g., "common.site.title")
+  function t(key, values) {
+    var bundle = translations[currentLang];
+    var message = bundle ? bundle[key] : null;
+    
+    if (!message) return key;
+    
+    // Simple interpolation: {name} -> values.name
+    if (values) {
+      message = message.replace(/\{(\w+)\}/g, function(match, name) {
+        return values[name] !== undefined ? values[name] : match;
+      });
+    }
+    
+    return message;
+  }
+
+  // Load the translation bundle for a language
+  function loadLanguage(lang) {
+    if (translations[lang]) {
+      return Promise.resolve();
+    }
+    if (!BUNDLES[lang]) {
+      translations[lang] = {};
+      return Promise.resolve();
+    }
+    
+    return fetch('/locales/' + lang + '.' + BUNDLES[lang] + '.json')
+      .then(function(res) {
+        if (!res.ok) throw new Error('Not found');
+        return res.json();
+      })
+      .then(function(data) {
+        translations[lang] = data;
+      })
+      .catch(function() {
+        translations[lang] = {};
+      });
+  }
+
+  // Get language from cookie
+  function getLangFromCookie() {
+    var match = document.cookie.match(new RegExp('(?:^|;\\s*)' + LANG_COOKIE + '=([^;]*)'));
+    return match ? match[1] : null;
+  }
+
+  // Save language to cookie
+  function saveLangCookie(lang) {
+    document.cookie = LANG_COOKIE + '=' + lang + ';path=/;max-age=' + (60 * 60 * 24 * 365);
+  }
+
+  // Get browser language preference
+  function getBrowserLang() {
+    var langs = navigator.languages || [navigator.language];
+    for (var i = 0; i < langs.length; i++) {
+      var baseLang = langs[i].split('-')[0].toLowerCase();
+      if (SUPPORTED_LANGUAGES.indexOf(baseLang) !== -1) {
+        return baseLang;
+      }
+    }
+    return null;
+  }
+
+  // Apply RTL direction if needed
+  function applyDirection(lang) {
+    var isRtl = RTL_LANGUAGES.indexOf(lang) !== -1;
+    document.documentElement.dir = isRtl ? 'rtl' : 'ltr';
+    document.documentElement.lang = lang;
+  }
+
+  function getDateFormatter(lang) {
+    if (typeof Intl === 'undefined' || !Intl.DateTimeFormat) return null;
+
+    var locale = DATE_LOCALES[lang] || lang;
+    if (!(locale in dateFormatters)) {
+      try {
+        dateFormatters[locale] = new Intl.DateTimeFormat(locale, {
+          weekday: 'short',
+          day: '2-digit',
+          month: 'short',
+          year: 'numeric',
+          calendar: 'gregory',
+          timeZone: 'UTC'
+        });
+      } catch (err) {
+        dateFormatters[locale] = null;
+      }
+    }
+    return dateFormatters[locale];
+  }
+
+  function parseISODate(value) {
+    var match = /^(\d{4})-(\d{2})-(\d{2})$/.exec(value || '');
+    if (!match) return null;
+
+    var year = Number(match[1]);
+    var month = Number(match[2]);
+    var day = Number(match[3]);
+    var date = new Date(Date.UTC(year, month - 1, day));
+    if (
+      date.getUTCFullYear() !== year ||
+      date.getUTCMonth() !== month - 1 ||
+      date.getUTCDate() !== day
+    ) {
+      return null;
+    }
+    return date;
+  }
+
+  // Dates are data, not translated strings. Format them for the active
+  // language while retaining the server-rendered English fallback when Intl
+  // is unavailable.
+  function updateDates() {
+    var formatter = getDateFormatter(currentLang);
+    if (!formatter) return;
+
+    var dateElements = document.querySelectorAll('[data-i18n-date]');
+    dateElements.forEach(function(el) {
+      var date = parseISODate(el.getAttribute('datetime'));
+      if (date) {
+        el.textContent = formatter.format(date);
+      }
+    });
+  }
+
+  // Update all elements with data-i18n attribute
+  function updateDOM() {
+    var elements = document.querySelectorAll('[data-i18n]');
+    elements.forEach(function(el) {
+      var key = el.getAttribute('data-i18n');
+      var text = t(key);
+      if (text !== key) {
+        el.textContent = text;
+      }
+    });
+    
+    // Update HTML content (for rich text with links etc)
+    // Security: Content sanitized via DOMPurify before insertion
+    var htmlElements = document.querySelectorAll('[data-i18n-html]');
+    htmlElements.forEach(function(el) {
+      var key = el.getAttribute('data-i18n-html');
+      var html = t(key);
+      if (html !== key) {
+        // Convert newlines to paragraph/line breaks
+        html = html.replace(/\n\n/g, '</p><p>').replace(/\n/g, '<br>');
+        // Sanitize with DOMPurify and set content
+        el.innerHTML = DOMPurify.sanitize(html, PURIFY_CONFIG);
+      }
+    });
+    
+    // Update placeholders
+    var placeholders = document.querySelectorAll('[data-i18n-placeholder]');
+    placeholders.forEach(function(el) {
+      var key = el.getAttribute('data-i18n-placeholder');
+      var text = t(key);
+      if (text !== key) {
+        el.placeholder = text;
+      }
+    });
+    
+    // Update aria-labels
+    var ariaLabels = document.querySelectorAll('[data-i18n-aria]');
+    ariaLabels.forEach(function(el) {
+      var key = el.getAttribute('data-i18n-aria');
+      var text = t(key);
+      if (text !== key) {
+        el.setAttribute('aria-label', text);
+      }
+    });
+
+    // Update title/tooltip attributes
+    var tooltips = document.querySelectorAll('[data-i18n-tooltip]');
+    tooltips.forEach(function(el) {
+      var key = el.getAttribute('data-i18n-tooltip');
+      var text = t(key);
+      if (text !== key) {
+        el.setAttribute('title', text);
+      }
+    });
+
+    updateDates();
+
+    // Update document title (browser tab)
+    // Format string from data-i18n-doc-title is interpolated with the
+    // translated page title (data-i18n-title-key) or the server-rendered
+    // default (data-i18n-default-title).
+    var docTitle = document.querySelector('title[data-i18n-doc-title]');
+    if (docTitle) {
+      var formatKey = docTitle.getAttribute('data-i18n-doc-title');
+      var pageTitleKey = docTitle.getAttribute('data-i18n-title-key');
+      var defaultTitle = docTitle.getAttribute('data-i18n-default-title') || '';
+      var format = t(formatKey);
+      if (format !== formatKey) {
+        var pageTitle = defaultTitle;
+        if (pageTitleKey) {
+          var translatedTitle = t(pageTitleKey);
+          if (translatedTitle !== pageTitleKey) {
+            pageTitle = translatedTitle;
+          }
+        }
+        docTitle.textContent = format.replace(/\{title\}/g, pageTitle);
+      }
+    }
+  }
+
+  function isPrerendered() {
+    return document.documentElement.hasAttribute('data-i18n-prerendered');
+  }
+
+  // Path of this page's pre-rendered version in another language
+  function alternatePath(lang) {
+    var link = document.querySelector('link[rel="alternate"][hreflang="' + lang + '"]');
+    if (!link) return null;
+    return new URL(link.href).pathname + window.location.search + window.location.hash;
+  }
+
+  // Change language
+  function changeLanguage(lang) {
+    if (SUPPORTED_LANGUAGES.indexOf(lang) === -1) {
+      console.warn('Unsupported language:', lang);
+      return Promise.resolve();
+    }
+    
+    var path = isPrerendered() && alternatePath(lang);
+    if (path) {
+      saveLangCookie(lang);
+      window.location.href = path;
+      return Promise.resolve();
+    }
+    
+    return loadLanguage(lang).then(function() {
+      currentLang = lang;
+      saveLangCookie(lang);
+      applyDirection(lang);
+      updateDOM();
+      
+      // Dispatch event for other scripts to react
+      window.dispatchEvent(new CustomEvent('languagechange', { detail: { lang: lang } }));
+    });
+  }
+
+  // Initialize
+  function init() {
+    // Priority: cookie > browser > fallback
+    var lang = getLangFromCookie() || getBrowserLang() || FALLBACK_LANG;
+    var prerendered = isPrerendered() && document.documentElement.lang;
+    
+    if (prerendered && prerendered !== lang) {
+      var path = alternatePath(lang);
+      if (path) {
+        window.location.replace(path);
+        return new Promise(function() {});
+      }
+    }
+    
+    return loadLanguage(lang).then(function() {
+      currentLang = lang;
+      applyDirection(lang);
+      ready = true;
+      // Pre-rendered pages only need the bundle for scripted messages.
+      if (prerendered !== lang) {
+        updateDOM();
+      }
+      
+      // Call ready callbacks
+      readyCallbacks.forEach(function(cb) { cb(); });
+      readyCallbacks = [];
+    });
+  }
+
+  // Register callback for when i18n is ready
+  function onReady(callback) {
+    if (ready) {
+      callback();
+    } else {
+      readyCallbacks.push(callback);
+    }
+  }
+
+  // Language names for the picker
+  var LANGUAGE_NAMES = {
+    en: 'English',
+    ar: 'العربية',
+    bn: 'বাংলা',
+    de: 'Deutsch',
+    es: 'Español',
+    fa: 'فارسی',
+    fr: 'Français',
+    he: 'עברית',
+    hi: 'हिन्दी',
+    id: 'Bahasa Indonesia',
+    it: 'Italiano',
+    ja: '日本語',
+    ko: '한국어',
+    ms: 'Bahasa Melayu',
+    nl: 'Nederlands',
+    no: 'Norsk',
+    pt: 'Português',
+    ru: 'Русский',
+    sv: 'Svenska',
+    sw: 'Kiswahili',
+    ta: 'தமிழ்',
+    te: 'తెలుగు',
+    th: 'ไทย',
+    tr: 'Türkçe',
+    uk: 'Українська',
+    vi: 'Tiếng Việt',
+    zh: '中文'
+  };
+
+  // Short native labels for the picker toggle (first 2 chars of native name)
+  var LANGUAGE_SHORT = {
+    en: 'EN',
+    ar: 'عر',
+    bn: 'বা',
+    de: 'DE',
+    es: 'ES',
+    fa: 'فا',
+    fr: 'FR',
+    he: 'עב',
+    hi: 'हि',
+    id: 'ID',
+    it: 'IT',
+    ja: '日本',
+    ko: '한국',
+    ms: 'MS',
+    nl: 'NL',
+    no: 'NO',
+    pt: 'PT',
+    ru: 'РУ',
+    sv: 'SV',
+    sw: 'SW',
+    ta: 'தமி',
+    te: 'తె',
+    th: 'ไท',
+    tr: 'TR',
+    uk: 'УК',
+    vi: 'VI',
+    zh: '中文'
+  };
+
+  // Initialize language picker UI
+  function initLanguagePicker() {
+    var toggle = document.getElementById('lang-toggle');
+    var menu = document.getElementById('lang-menu');
+    var currentDisplay = toggle ? toggle.querySelector('.lang-current') : null;
+    
+    if (!toggle || !menu) return;
+    
+    // Populate menu
+    menu.innerHTML = '';
+    SUPPORTED_LANGUAGES.forEach(function(code) {
+      var li = document.createElement('li');
+      var btn = document.createElement('button');
+      btn.type = 'button';
+      btn.setAttribute('role', 'option');
+      btn.setAttribute('data-lang', code);
+      btn.innerHTML = '<span class="lang-name">' + LANGUAGE_NAMES[code] + '</span><span class="lang-check" aria-hidden="true">✓</span><span class="lang-code">' + LANGUAGE_SHORT[code] + '</span>';
+      btn.addEventListener('click', function() {
+        changeLanguage(code);
+        closeMenu();
+      });
+      li.appendChild(btn);
+      menu.appendChild(li);
+    });
+    
+    // Update current display
+    function updateCurrentDisplay() {
+      if (currentDisplay) {
+        currentDisplay.textContent = LANGUAGE_SHORT[currentLang] || currentLang.toUpperCase();
+      }
+      // Update selected state in menu
+      var buttons = menu.querySelectorAll('button');
+      buttons.forEach(function(btn) {
+        btn.setAttribute('aria-selected', btn.getAttribute('data-lang') === currentLang ? 'true' : 'false');
+      });
+    }
+    
+    // Toggle menu
+    function toggleMenu() {
+      var isOpen = !menu.hidden;
+      if (isOpen) {
+        closeMenu();
+      } else {
+        openMenu();
+      }
+    }
+    
+    function openMenu() {
+      menu.hidden = false;
+      toggle.setAttribute('aria-expanded', 'true');
+      updateCurrentDisplay();
+      // Focus current language
+      var currentBtn = menu.querySelector('[data-lang="' + currentLang + '"]');
+      if (currentBtn) {
+        setTimeout(function() { currentBtn.focus(); }, 10);
+      }
+    }
+    
+    function closeMenu() {
+      menu.hidden = true;
+      toggle.setAttribute('aria-expanded', 'false');
+    }
+    
+    // Event listeners
+    toggle.addEventListener('click', function(e) {
+      e.stopPropagation();
+      toggleMenu();
+    });
+    
+    // Close on outside click
+    document.addEventListener('click', function(e) {
+      if (!menu.hidden && !menu.contains(e.target) && e.target !== toggle) {
+        closeMenu();
+      }
+    });
+    
+    // Close on Escape
+    document.addEventListener('keydown', function(e) {
+      if (e.key === 'Escape' && !menu.hidden) {
+        closeMenu();
+        toggle.focus();
+      }
+    });
+    
+    // Keyboard navigation in menu
+    menu.addEventListener('keydown', function(e) {
+      var buttons = Array.from(menu.querySelectorAll('button'));
+      var currentIndex = buttons.indexOf(document.activeElement);
+      
+      if (e.key === 'ArrowDown') {
+        e.preventDefault();
+        var nextIndex = (currentIndex + 1) % buttons.length;
+        buttons[nextIndex].focus();
+      } else if (e.key === 'ArrowUp') {
+        e.preventDefault();
+        var prevIndex = (currentIndex - 1 + buttons.length) % buttons.length;
+        buttons[prevIndex].focus();
+      }
+    });
+    
+    // Update display on language change
+    window.addEventListener('languagechange', updateCurrentDisplay);
+    
+    // Initial update
+    updateCurrentDisplay();
+  }
+
+  // Export
+  window.i18n = {
+    t: t,
+    changeLanguage: changeLanguage,
+    getLanguage: function() { return currentLang; },
+    onReady: onReady,
+    updateDOM: updateDOM,
+    SUPPORTED_LANGUAGES: SUPPORTED_LANGUAGES,
+    LANGUAGE_NAMES: LANGUAGE_NAMES
+  };
+
+  // Auto-init when DOM is ready
+  if (document.readyState === 'loading') {
+    document.addEventListener('DOMContentLoaded', function() {
+      init().then(initLanguagePicker);
+    });
+  } else {
+    init().then(initLanguagePicker);
+  }
+})();
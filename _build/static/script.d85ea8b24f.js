@@ -0,0 +1,1786 @@
+// Shared UI runtime namespace, populated by the IIFEs below.
+window.__earendilUiRuntime = window.__earendilUiRuntime || {};
+
+// Site menu toggle (top-right navigation)
+(function() {
+  var uiRuntime = window.__earendilUiRuntime;
+  var menuRuntime = uiRuntime.menu || (uiRuntime.menu = {});
+
+  function rectanglesOverlap(a, b, epsilon) {
+    if (!a || !b) return false;
+    var overlapX = Math.min(a.right, b.right) - Math.max(a.left, b.left);
+    var overlapY = Math.min(a.bottom, b.bottom) - Math.max(a.top, b.top);
+    return overlapX > epsilon && overlapY > epsilon;
+  }
+
+  function updateMenuOverlapBackdrop(menu) {
+    if (!menu) return;
+
+    var links = menu.querySelector('.menu-links');
+    var isOpen = menu.classList.contains('is-open') && links && !links.hidden;
+    if (!isOpen) {
+      menu.classList.remove('has-overlap-backdrop');
+      return;
+    }
+
+    var pageSurface = document.querySelector('.content-page .content-surface');
+    if (!pageSurface) {
+      menu.classList.remove('has-overlap-backdrop');
+      return;
+    }
+
+    var menuRect = menu.getBoundingClientRect();
+    var surfaceRect = pageSurface.getBoundingClientRect();
+    var shouldShowBackdrop = rectanglesOverlap(menuRect, surfaceRect, 1);
+    menu.classList.toggle('has-overlap-backdrop', shouldShowBackdrop);
+  }
+
+  function scheduleMenuOverlapBackdropUpdate(menu) {
+    if (!menu) return;
+    if (typeof window.requestAnimationFrame === 'function') {
+      window.requestAnimationFrame(function() {
+        updateMenuOverlapBackdrop(menu);
+      });
+    } else {
+      setTimeout(function() {
+        updateMenuOverlapBackdrop(menu);
+      }, 0);
+    }
+  }
+
+  function syncMobileMenuState(menu) {
+    var isMobile = window.matchMedia('(max-width: 800px)').matches;
+    var isOpen = !!(menu && menu.classList.contains('is-open'));
+    document.body.classList.toggle('mobile-menu-open', isMobile && isOpen);
+  }
+
+  function setMenuExpanded(menu, isOpen) {
+    if (!menu) return;
+    var links = menu.querySelector('.menu-links');
+    var triggerButton = menu.querySelector('.menu-trigger-toggle');
+    var isMobile = window.matchMedia('(max-width: 800px)').matches;
+
+    if (menu._closeTimer) {
+      clearTimeout(menu._closeTimer);
+      menu._closeTimer = null;
+    }
+
+    if (isOpen) {
+      menu.classList.remove('is-closing');
+      if (links) links.hidden = false;
+      menu.classList.add('is-open');
+    } else {
+      menu.classList.remove('is-open');
+      if (links && !links.hidden && isMobile) {
+        menu.classList.add('is-closing');
+        menu._closeTimer = setTimeout(function() {
+          links.hidden = true;
+          menu.classList.remove('is-closing');
+          menu._closeTimer = null;
+        }, 180);
+      } else {
+        if (links) links.hidden = true;
+        menu.classList.remove('is-closing');
+      }
+    }
+
+    if (triggerButton) {
+      triggerButton.setAttribute('aria-expanded', isOpen ? 'true' : 'false');
+      var menuKey = isOpen ? 'common.aria.closeMenu' : 'common.aria.openMenu';
+      triggerButton.setAttribute('aria-label', window.i18n.t(menuKey));
+    }
+    syncMobileMenuState(menu);
+    updateMenuOverlapBackdrop(menu);
+    scheduleMenuOverlapBackdropUpdate(menu);
+  }
+
+  function initSiteMenu() {
+    var menu = document.querySelector('[data-site-menu]');
+    if (!menu) return;
+
+    var triggerButton = menu.querySelector('.menu-trigger-toggle');
+    if (!triggerButton) return;
+
+    if (!triggerButton.dataset.initialized) {
+      triggerButton.dataset.initialized = 'true';
+
+      function toggleMenu() {
+        var isOpen = !menu.classList.contains('is-open');
+        setMenuExpanded(menu, isOpen);
+      }
+
+      function closeMenuOnMobile() {
+        if (!window.matchMedia('(max-width: 800px)').matches) return;
+        setMenuExpanded(menu, false);
+      }
+
+      triggerButton.addEventListener('click', toggleMenu);
+
+      var menuPanel = menu.querySelector('.menu-links');
+      if (menuPanel && !menuPanel.dataset.initialized) {
+        menuPanel.dataset.initialized = 'true';
+        menuPanel.addEventListener('click', function(event) {
+          // Delegated so search results added later close the menu too.
+          if (event.target.closest('a')) {
+            closeMenuOnMobile();
+            return;
+          }
+          if (event.target !== menuPanel) return;
+          setMenuExpanded(menu, false);
+          triggerButton.focus();
+        });
+      }
+
+      if (!menuRuntime.mobileMenuKeyboardBound) {
+        menuRuntime.mobileMenuKeyboardBound = true;
+        document.addEventListener('keydown', function(event) {
+          if (!window.matchMedia('(max-width: 800px)').matches) return;
+          var navMenu = document.querySelector('[data-site-menu].is-open');
+          if (!navMenu) return;
+
+          var navTrigger = navMenu.querySelector('.menu-trigger-toggle');
+          if (event.key === 'Escape') {
+            event.preventDefault();
+            setMenuExpanded(navMenu, false);
+            if (navTrigger) navTrigger.focus();
+            return;
+          }
+
+          if (event.key !== 'Tab') return;
+          var focusable = Array.prototype.slice.call(
+            navMenu.querySelectorAll('.menu-trigger-toggle, .menu-links a')
+          ).filter(function(element) {
+            return !element.hidden && element.getClientRects().length > 0;
+          });
+          if (!focusable.length) return;
+
+          var first = focusable[0];
+          var last = focusable[focusable.length - 1];
+          if (event.shiftKey && document.activeElement === first) {
+            event.preventDefault();
+            last.focus();
+          } else if (!event.shiftKey && document.activeElement === last) {
+            event.preventDefault();
+            first.focus();
+          }
+        });
+      }
+
+      if (!menuRuntime.overlapBackdropBound) {
+        menuRuntime.overlapBackdropBound = true;
+
+        function refreshMenuOverlapBackdrop() {
+          var navMenu = document.querySelector('[data-site-menu]');
+          if (!navMenu) return;
+          syncMobileMenuState(navMenu);
+          updateMenuOverlapBackdrop(navMenu);
+          scheduleMenuOverlapBackdropUpdate(navMenu);
+        }
+
+        window.addEventListener('resize', refreshMenuOverlapBackdrop);
+        document.body.addEventListener('htmx:afterSettle', refreshMenuOverlapBackdrop);
+      }
+    }
+
+    updateMenuOverlapBackdrop(menu);
+    scheduleMenuOverlapBackdropUpdate(menu);
+  }
+
+  // Re-sync menu state when the active language changes, so the aria-label
+  // reflects the current open/close state in the new language.
+  window.addEventListener('languagechange', function() {
+    var menuList = document.querySelectorAll('[data-site-menu]');
+    menuList.forEach(function(navMenu) {
+      var triggerBtn = navMenu.querySelector('.menu-trigger-toggle');
+      if (!triggerBtn) return;
+      var open = navMenu.classList.contains('is-open');
+      var menuKey = open ? 'common.aria.closeMenu' : 'common.aria.openMenu';
+      triggerBtn.setAttribute('aria-label', window.i18n.t(menuKey));
+    });
+  });
+
+  initSiteMenu();
+  document.body.addEventListener('htmx:afterSettle', initSiteMenu);
+})();
+
+// Subscribe form handling (updates page email flow)
+(function() {
+  function initUpdatesForm() {
+    var form = document.querySelector('[data-subscribe-form]');
+    if (!form || form.dataset.initialized) return;
+    form.dataset.initialized = 'true';
+
+    var input = document.getElementById('updates-email');
+    if (!input) return;
+
+    var enterBtn = document.getElementById('updates-enter');
+    var messageEl = document.getElementById('updates-message');
+    var wrapper = form.querySelector('.updates-input-wrapper');
+    var isPlaceholder = input.value === '';
+    var wasValid = false;
+
+    // Create hidden measuring element for auto-sizing
+    var measure = document.createElement('span');
+    measure.className = 'updates-measure';
+    measure.setAttribute('aria-hidden', 'true');
+    wrapper.appendChild(measure);
+
+    function updateInputWidth() {
+      var text = input.value || input.placeholder || '';
+      measure.textContent = text;
+      // Add a small buffer for the caret
+      var width = measure.offsetWidth + 2;
+      input.style.width = width + 'px';
+    }
+
+    // Valid email: user@domain.tld where tld has 2+ chars after final dot
+    function isValidEmail(email) {
+      var atIndex = email.indexOf('@');
+      if (atIndex < 1) return false;
+      var domain = email.slice(atIndex + 1);
+      var lastDot = domain.lastIndexOf('.');
+      if (lastDot < 1) return false;
+      var tld = domain.slice(lastDot + 1);
+      return tld.length >= 2;
+    }
+
+    function showValidGlow() {
+      // Remove and re-add to restart animation
+      input.classList.remove('valid-glow');
+      void input.offsetWidth; // Force reflow
+      input.classList.add('valid-glow');
+    }
+
+    function hideValidGlow() {
+      input.classList.remove('valid-glow');
+    }
+
+    function updateState() {
+      var val = input.value;
+      var isEmpty = val === '';
+      var isValid = isValidEmail(val);
+
+      updateInputWidth();
+
+      if (isEmpty) {
+        isPlaceholder = true;
+        input.classList.add('placeholder-text');
+        hideValidGlow();
+        if (enterBtn) enterBtn.hidden = true;
+        wasValid = false;
+      } else if (isValid) {
+        isPlaceholder = false;
+        input.classList.remove('placeholder-text');
+        // Trigger glow animation when becoming valid
+        if (!wasValid) {
+          showValidGlow();
+        }
+        if (enterBtn) enterBtn.hidden = false;
+        wasValid = true;
+      } else {
+        isPlaceholder = false;
+        input.classList.remove('placeholder-text');
+        hideValidGlow();
+        if (enterBtn) enterBtn.hidden = true;
+        wasValid = false;
+      }
+    }
+
+    input.addEventListener('focus', function() {
+      hideValidGlow();
+      // Keep wasValid in sync so we don't replay animation
+      wasValid = isValidEmail(input.value);
+      updateState();
+    });
+
+    input.addEventListener('input', function() {
+      updateState();
+    });
+
+    input.addEventListener('blur', function() {
+      if (input.value === '') {
+        isPlaceholder = true;
+        hideValidGlow();
+        input.classList.add('placeholder-text');
+        if (enterBtn) enterBtn.hidden = true;
+        wasValid = false;
+      } else if (isValidEmail(input.value)) {
+        showValidGlow();
+        if (enterBtn) enterBtn.hidden = false;
+        wasValid = true;
+      }
+    });
+
+    if (wrapper) {
+      wrapper.addEventListener('click', function(e) {
+        if (e.target !== input) input.focus();
+      });
+    }
+
+    input.addEventListener('keydown', function(e) {
+      if (e.key === 'Enter' && isValidEmail(input.value)) {
+        e.preventDefault();
+        submit();
+      }
+    });
+
+    if (enterBtn) {
+      enterBtn.addEventListener('click', function() {
+        if (isValidEmail(input.value)) submit();
+      });
+    }
+
+    function submit() {
+      var email = input.value;
+      if (isPlaceholder || !isValidEmail(email)) {
+        updateState();
+        return;
+      }
+
+      if (wrapper) {
+        wrapper.style.transition = 'opacity 0.25s ease';
+        wrapper.style.opacity = '0';
+      }
+      setTimeout(function() {
+        if (wrapper) wrapper.style.display = 'none';
+        if (messageEl) {
+          showAnimatedMessage(window.i18n ? window.i18n.t('subscribe.subscribe.loading') : 'Storing at the speed of light');
+        }
+      }, 250);
+
+      fetch('https://lefos.com/api/newsletter/subscribe', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({
+          email: email,
+          segmentSlug: 'earendil-newsletter'
+        })
+      })
+      .then(function(response) {
+        if (!response.ok) {
+          throw new Error('subscribe_failed');
+        }
+        return response.json().catch(function() { return { ok: true }; });
+      })
+      .then(function(payload) {
+        if (!payload || payload.ok !== true) {
+          throw new Error('subscribe_failed');
+        }
+        showAnimatedMessage(window.i18n ? window.i18n.t('subscribe.subscribe.success') : 'Welcome aboard');
+      })
+      .catch(function() {
+        showAnimatedMessage(window.i18n ? window.i18n.t('subscribe.subscribe.error') : 'Something went wrong');
+        setTimeout(function() {
+          if (wrapper) {
+            wrapper.style.display = '';
+            wrapper.style.opacity = '1';
+          }
+          if (messageEl) {
+            messageEl.hidden = true;
+            messageEl.classList.remove('valid');
+          }
+          updateState();
+        }, 2000);
+      });
+    }
+
+    function showAnimatedMessage(text) {
+      if (!messageEl) return;
+      messageEl.textContent = text;
+      messageEl.classList.remove('valid');
+      void messageEl.offsetWidth; // Force reflow to restart animation
+      messageEl.classList.add('valid');
+      messageEl.hidden = false;
+    }
+
+    // Initialize
+    updateState();
+
+    // Auto-focus the email input
+    input.focus();
+  }
+
+  initUpdatesForm();
+  document.body.addEventListener('htmx:afterSettle', initUpdatesForm);
+})();
+
+// Reveal ◊-delimited chunks in marked code blocks as each block enters the
+// viewport. CSS owns the fade and stagger; JavaScript only toggles visibility.
+(function() {
+  var codeRevealObserver = null;
+
+  function revealCodeBlock(codeBlock) {
+    codeBlock.classList.add('is-revealed');
+    if (codeRevealObserver) codeRevealObserver.unobserve(codeBlock);
+  }
+
+  function getCodeRevealObserver() {
+    if (codeRevealObserver || typeof IntersectionObserver !== 'function') {
+      return codeRevealObserver;
+    }
+
+    codeRevealObserver = new IntersectionObserver(function(entries) {
+      entries.forEach(function(entry) {
+        if (entry.isIntersecting) revealCodeBlock(entry.target);
+      });
+    }, {
+      threshold: 0.2,
+      rootMargin: '0px 0px -8% 0px'
+    });
+
+    return codeRevealObserver;
+  }
+
+  function initCodeReveals() {
+    document.querySelectorAll('[data-code-reveal]').forEach(function(codeBlock) {
+      if (codeBlock.dataset.revealInitialized) return;
+      codeBlock.dataset.revealInitialized = 'true';
+      codeBlock.classList.add('is-reveal-ready');
+
+      var observer = getCodeRevealObserver();
+      if (observer) {
+        observer.observe(codeBlock);
+      } else {
+        revealCodeBlock(codeBlock);
+      }
+    });
+  }
+
+  initCodeReveals();
+  document.body.addEventListener('htmx:afterSettle', initCodeReveals);
+})();
+
+// WebGL ocean rendering (runs once)
+(function() {
+if (window.__earendilInitialized) return;
+window.__earendilInitialized = true;
+
+const canvas = document.getElementById('canvas');
+const logo = document.getElementById('logo');
+const themeToggle = document.getElementById('theme-toggle');
+const gl = canvas.getContext('webgl');
+
+const LOGO_SVG_URL = (logo && logo.getAttribute('src')) || '/static/earendil-emblem.svg';
+
+const THEME_STORAGE_KEY = 'earendil-theme-mode';
+const THEME_MODES = ['auto', 'night', 'day'];
+function getThemeLabel(mode) {
+  if (window.i18n) {
+    var keys = { auto: 'common.theme.auto', night: 'common.theme.dark', day: 'common.theme.light' };
+    return window.i18n.t(keys[mode] || keys.auto);
+  }
+  var fallbacks = { auto: 'AUTO', night: 'DARK', day: 'LIGHT' };
+  return fallbacks[mode] || fallbacks.auto;
+}
+
+// Quality settings for slower computers
+const QUALITY_LEVELS = ['low', 'medium', 'high'];
+const QUALITY_SETTINGS = {
+  low: {
+    scale: 0.25,
+    lowDpiScale: 0.425,  // 1.7x for low DPI screens
+    raymarchSteps: 20,
+    waveIterRaymarch: 4,
+    waveIterNormal: 16,
+    fbmOctaves: 2
+  },
+  medium: {
+    scale: 0.35,
+    lowDpiScale: 0.595,  // 1.7x for low DPI screens
+    raymarchSteps: 24,
+    waveIterRaymarch: 6,
+    waveIterNormal: 16,
+    fbmOctaves: 3
+  },
+  high: {
+    scale: 0.4,
+    lowDpiScale: 0.68,   // 1.7x for low DPI screens
+    raymarchSteps: 32,
+    waveIterRaymarch: 8,
+    waveIterNormal: 16,
+    fbmOctaves: 4
+  }
+};
+
+// Low DPI threshold and noise scale multiplier
+const LOW_DPI_THRESHOLD = 1.5;
+const LOW_DPI_NOISE_SCALE = 1.7;
+
+let currentQuality = 'high';
+
+// Reduced motion keeps the ocean alive as a quiet ambient surface rather than
+// freezing it. Apply the same treatment automatically whenever a content-page
+// background is present so the ocean is less distracting while reading. Film
+// grain is only slowed slightly because it does not create the same sense of
+// spatial movement as the waves.
+const motionPreferenceQuery = window.matchMedia
+  ? window.matchMedia('(prefers-reduced-motion: reduce)')
+  : null;
+const REDUCED_MOTION_WAVE_SPEED = 0.15;
+const REDUCED_MOTION_GRAIN_SPEED = 0.75;
+const AMBIENT_MOTION_SPEED_TRANSITION_DURATION = 3.0;
+const CONTENT_PAGE_RENDER_FPS = 15;
+const CONTENT_PAGE_RENDER_INTERVAL = 1000 / CONTENT_PAGE_RENDER_FPS;
+const CONTENT_PAGE_RESOLUTION_SCALE = 0.5;
+
+function isContentPage() {
+  return !!document.querySelector('.content-page');
+}
+
+// Direct content-page loads begin with slow ambient motion, so they can use the
+// reduced resolution from the first frame.
+let contentPageResolutionReduced = isContentPage();
+
+function shouldReduceAmbientMotion(contentPage) {
+  const userPrefersReducedMotion = motionPreferenceQuery
+    ? motionPreferenceQuery.matches
+    : false;
+  return userPrefersReducedMotion || contentPage;
+}
+
+// Adaptive quality settings
+const AUTO_QUALITY_FPS_LOW = 28;      // Drop quality if FPS below this
+const AUTO_QUALITY_FPS_HIGH = 55;     // Increase quality if FPS above this
+const AUTO_QUALITY_SAMPLE_TIME = 2000; // Time window to average FPS (ms)
+const AUTO_QUALITY_COOLDOWN = 4000;   // Minimum time between quality changes (ms)
+let autoQualityFpsHistory = [];
+let lastQualityChangeTime = 0;
+
+function loadThemeMode() {
+  try {
+    const stored = localStorage.getItem(THEME_STORAGE_KEY);
+    if (THEME_MODES.includes(stored)) {
+      return stored;
+    }
+  } catch (error) {
+    console.warn('Unable to access localStorage for theme mode.', error);
+  }
+  return 'auto';
+}
+
+let themeMode = loadThemeMode();
+
+const colorSchemeQuery = window.matchMedia
+  ? window.matchMedia('(prefers-color-scheme: dark)')
+  : null;
+let prefersNight = colorSchemeQuery ? colorSchemeQuery.matches : false;
+
+if (colorSchemeQuery) {
+  const onSchemeChange = (event) => {
+    prefersNight = event.matches;
+    applyThemePreference();
+  };
+  if (colorSchemeQuery.addEventListener) {
+    colorSchemeQuery.addEventListener('change', onSchemeChange);
+  } else if (colorSchemeQuery.addListener) {
+    colorSchemeQuery.addListener(onSchemeChange);
+  }
+}
+
+function getNightPreference() {
+  if (themeMode === 'auto') {
+    return prefersNight;
+  }
+  return themeMode === 'night';
+}
+
+function applyThemePreference() {
+  const isNight = getNightPreference();
+  document.body.classList.toggle('theme-night', isNight);
+}
+
+function updateThemeToggle() {
+  const valueSpan = themeToggle.querySelector('.value');
+  valueSpan.textContent = getThemeLabel(themeMode);
+  themeToggle.setAttribute('aria-label', window.i18n.t('common.aria.appearanceLabel', { state: getThemeLabel(themeMode) }));
+  applyThemePreference();
+}
+
+function persistThemeMode() {
+  try {
+    localStorage.setItem(THEME_STORAGE_KEY, themeMode);
+  } catch (error) {
+    console.warn('Unable to persist theme mode.', error);
+  }
+}
+
+themeToggle.addEventListener('click', () => {
+  const currentIndex = THEME_MODES.indexOf(themeMode);
+  const nextIndex = currentIndex === -1 ? 0 : (currentIndex + 1) % THEME_MODES.length;
+  themeMode = THEME_MODES[nextIndex];
+  persistThemeMode();
+  updateThemeToggle();
+});
+
+// Update theme toggle when language changes
+window.addEventListener('languagechange', updateThemeToggle);
+
+// Initial update (with fallback labels)
+updateThemeToggle();
+
+// Enable CSS theme interpolation only after the initial preference is applied,
+// so a stored dark preference does not animate on first paint.
+requestAnimationFrame(() => {
+  document.body.classList.add('theme-transition-ready');
+});
+
+// Update again once i18n is ready (with translated labels)
+if (window.i18n) {
+  window.i18n.onReady(updateThemeToggle);
+}
+
+
+
+// Keep in sync with --theme-transition-duration in styles.css.
+const THEME_FADE_DURATION = 900;
+let nightBlend = getNightPreference() ? 1.0 : 0.0;
+let nightFadeStart = null;
+let nightFadeFrom = nightBlend;
+let nightFadeTo = nightBlend;
+
+// Camera projection values are shared by the shader, pointer projection, and
+// DOM horizon tracking. Keeping one source of truth prevents the hero from
+// drifting away from the rendered horizon.
+const CAMERA_PROJECTION_DEPTH = 1.5;
+const BASE_CAMERA_TILT = 0.14;
+
+// 404 page camera animation
+const CAMERA_404_DURATION = 3000; // 3 seconds
+const CAMERA_404_Y_OFFSET = 1.0;  // Move camera up
+const CAMERA_404_Z_OFFSET = -8.0; // Move camera back (towards viewer)
+const CAMERA_404_TILT_OFFSET = -0.7; // Tilt camera down (radians)
+let camera404AnimStart = null;
+let camera404AnimFrom = { y: 0, z: 0, tilt: 0 };
+let camera404AnimTo = { y: 0, z: 0, tilt: 0 };
+let cameraYOffset = 0;
+let cameraZOffset = 0;
+let cameraTiltOffset = 0;
+
+function is404Page() {
+  const page = document.querySelector('.page');
+  return page && page.dataset.pageType === '404';
+}
+
+// Initialize target based on initial page state
+if (is404Page()) {
+  camera404AnimTo = { y: CAMERA_404_Y_OFFSET, z: CAMERA_404_Z_OFFSET, tilt: CAMERA_404_TILT_OFFSET };
+}
+
+function easeInOut(t) {
+  return t * t * (3.0 - 2.0 * t);
+}
+
+function check404PageState() {
+  const is404Now = is404Page();
+  const targetY = is404Now ? CAMERA_404_Y_OFFSET : 0;
+  const targetZ = is404Now ? CAMERA_404_Z_OFFSET : 0;
+  const targetTilt = is404Now ? CAMERA_404_TILT_OFFSET : 0;
+  
+  // If target changed, start new animation from current position
+  if (camera404AnimTo.y !== targetY || camera404AnimTo.z !== targetZ || camera404AnimTo.tilt !== targetTilt) {
+    camera404AnimFrom = { y: cameraYOffset, z: cameraZOffset, tilt: cameraTiltOffset };
+    camera404AnimTo = { y: targetY, z: targetZ, tilt: targetTilt };
+    camera404AnimStart = null; // Will be set on next render frame
+  }
+}
+
+function updateCamera404(time) {
+  // Already at target
+  if (cameraYOffset === camera404AnimTo.y && cameraZOffset === camera404AnimTo.z && cameraTiltOffset === camera404AnimTo.tilt) {
+    return false;
+  }
+
+  if (camera404AnimStart === null) {
+    camera404AnimStart = time;
+  }
+
+  const elapsed = time - camera404AnimStart;
+  const progress = Math.min(elapsed / CAMERA_404_DURATION, 1);
+  const eased = easeInOut(progress);
+
+  cameraYOffset = camera404AnimFrom.y + (camera404AnimTo.y - camera404AnimFrom.y) * eased;
+  cameraZOffset = camera404AnimFrom.z + (camera404AnimTo.z - camera404AnimFrom.z) * eased;
+  cameraTiltOffset = camera404AnimFrom.tilt + (camera404AnimTo.tilt - camera404AnimFrom.tilt) * eased;
+  
+  // Snap to final values when done
+  if (progress >= 1) {
+    cameraYOffset = camera404AnimTo.y;
+    cameraZOffset = camera404AnimTo.z;
+    cameraTiltOffset = camera404AnimTo.tilt;
+  }
+
+  return true;
+}
+
+let lastSceneHorizonFromBottom = null;
+let sceneHorizonGeometry = null;
+let observedSceneHorizonHero = null;
+
+const sceneHorizonResizeObserver = typeof ResizeObserver === 'function'
+  ? new ResizeObserver(function() {
+      syncSceneHorizonPosition(true);
+    })
+  : null;
+
+if (sceneHorizonResizeObserver) {
+  sceneHorizonResizeObserver.observe(canvas);
+}
+
+function measureSceneHorizonGeometry() {
+  const hero = document.querySelector('.home-hero');
+
+  if (sceneHorizonResizeObserver && hero !== observedSceneHorizonHero) {
+    if (observedSceneHorizonHero) {
+      sceneHorizonResizeObserver.unobserve(observedSceneHorizonHero);
+    }
+    if (hero) {
+      sceneHorizonResizeObserver.observe(hero);
+    }
+    observedSceneHorizonHero = hero;
+  }
+
+  if (!hero) {
+    sceneHorizonGeometry = null;
+    return;
+  }
+
+  const canvasRect = canvas.getBoundingClientRect();
+  const heroRect = hero.getBoundingClientRect();
+  if (!canvasRect.height || !heroRect.height) {
+    sceneHorizonGeometry = null;
+    return;
+  }
+
+  sceneHorizonGeometry = {
+    canvasBottom: canvasRect.bottom,
+    canvasHeight: canvasRect.height,
+    heroBottom: heroRect.bottom
+  };
+}
+
+function syncSceneHorizonPosition(refreshGeometry) {
+  if (refreshGeometry || !sceneHorizonGeometry) {
+    measureSceneHorizonGeometry();
+  }
+  if (!sceneHorizonGeometry) return;
+
+  // getRay() changes from water to sky when its rotated Y component reaches
+  // zero. Solve that same projection here, then express the horizon relative
+  // to the hero's bottom edge for CSS bottom positioning.
+  const tilt = BASE_CAMERA_TILT + cameraTiltOffset;
+  const horizonFromCanvasBottomRatio =
+    (1 - CAMERA_PROJECTION_DEPTH * Math.tan(tilt)) / 2;
+  const horizonY = sceneHorizonGeometry.canvasBottom -
+    sceneHorizonGeometry.canvasHeight * horizonFromCanvasBottomRatio;
+  const horizonFromHeroBottom = sceneHorizonGeometry.heroBottom - horizonY;
+
+  if (lastSceneHorizonFromBottom === null ||
+      Math.abs(horizonFromHeroBottom - lastSceneHorizonFromBottom) >= 0.1) {
+    document.documentElement.style.setProperty(
+      '--scene-horizon-from-bottom',
+      horizonFromHeroBottom.toFixed(2) + 'px'
+    );
+    lastSceneHorizonFromBottom = horizonFromHeroBottom;
+  }
+}
+
+// Re-measure after HTMX replaces the page; if the camera is transitioning
+// back from the 404 scene, render() updates only the projection value per frame.
+document.body.addEventListener('htmx:afterSettle', function() {
+  check404PageState();
+  requestAnimationFrame(function() {
+    syncSceneHorizonPosition(true);
+  });
+});
+
+function updateNightBlend(time) {
+  const desired = getNightPreference() ? 1.0 : 0.0;
+  if (desired !== nightFadeTo) {
+    nightFadeFrom = nightBlend;
+    nightFadeTo = desired;
+    nightFadeStart = time;
+  }
+
+  if (nightFadeStart !== null) {
+    const progress = Math.min((time - nightFadeStart) / THEME_FADE_DURATION, 1);
+    const eased = easeInOut(progress);
+    nightBlend = nightFadeFrom + (nightFadeTo - nightFadeFrom) * eased;
+    if (progress >= 1) {
+      nightFadeStart = null;
+      nightBlend = nightFadeTo;
+    }
+  } else {
+    nightBlend = nightFadeTo;
+  }
+
+  return nightBlend;
+}
+
+const vertexShaderSource = `
+  attribute vec2 position;
+  void main() {
+    gl_Position = vec4(position, 0.0, 1.0);
+  }
+`;
+
+const LOGO_FADE_DELAY = 150;
+const LOGO_FADE_DURATION = 900;
+const LOGO_FADE_TARGET = 0.85;
+
+// based on afl_ext's ocean weaves shader (MIT licensed)
+function buildFragmentShader(quality) {
+  const settings = QUALITY_SETTINGS[quality];
+  return `
+  precision highp float;
+  uniform vec2 iResolution;
+  uniform float iTime;
+  uniform float u_waveTime;
+  uniform float u_grainTime;
+  uniform float u_noiseScale;
+  uniform sampler2D u_logo;
+  uniform vec2 u_logoCenter;
+  uniform vec2 u_logoSize;
+  uniform float u_logoFade;
+  uniform vec4 u_ripples[10]; // (worldX, worldZ, birthTime, amplitude)
+  uniform int u_rippleCount;
+  uniform float u_night;
+  uniform float u_cameraYOffset;
+  uniform float u_cameraZOffset;
+  uniform float u_cameraTiltOffset;
+
+  // afl_ext 2017-2024
+  // MIT License
+  #define PI 3.14159265359
+
+  #define DRAG_MULT 0.38
+  #define WATER_DEPTH 1.0
+  #define CAMERA_HEIGHT 1.5
+  #define ITERATIONS_RAYMARCH ${settings.waveIterRaymarch}
+  #define ITERATIONS_NORMAL ${settings.waveIterNormal}
+  #define RAYMARCH_STEPS ${settings.raymarchSteps}
+  #define FBM_OCTAVES ${settings.fbmOctaves}
+  #define LOGO_INTENSITY 3.5
+  #define NIGHT_EPS 0.001
+
+  float hash21(vec2 p) {
+    return fract(sin(dot(p, vec2(127.1, 311.7))) * 43758.5453);
+  }
+
+  float noise21(vec2 p) {
+    vec2 i = floor(p);
+    vec2 f = fract(p);
+    f = f * f * (3.0 - 2.0 * f);
+    float a = hash21(i);
+    float b = hash21(i + vec2(1.0, 0.0));
+    float c = hash21(i + vec2(0.0, 1.0));
+    float d = hash21(i + vec2(1.0, 1.0));
+    return mix(mix(a, b, f.x), mix(c, d, f.x), f.y);
+  }
+
+  float fbm(vec2 p) {
+    float value = 0.0;
+    float amplitude = 0.5;
+    float frequency = 1.0;
+    for (int i = 0; i < FBM_OCTAVES; i++) {
+      value += amplitude * noise21(p * frequency);
+      frequency *= 2.0;
+      amplitude *= 0.5;
+    }
+    return value;
+  }
+
+  mat3 createRotationMatrixAxisAngle(vec3 axis, float angle);
+
+  vec2 dirToScreenUV(vec3 dir) {
+    vec3 unrotated = createRotationMatrixAxisAngle(vec3(1.0, 0.0, 0.0), -(${BASE_CAMERA_TILT} + u_cameraTiltOffset)) * dir;
+    if (unrotated.z <= 0.0) return vec2(-1.0);
+    vec2 uv = (unrotated.xy / unrotated.z) * ${CAMERA_PROJECTION_DEPTH};
+    vec2 ndc = uv / vec2(iResolution.x / iResolution.y, 1.0);
+    return ndc * 0.5 + 0.5;
+  }
+
+  float star(vec2 screenUv, vec2 cellId, vec2 grid) {
+    float rnd = hash21(cellId);
+    if (rnd > 0.8) return 0.0;
+    vec2 starPos = vec2(hash21(cellId + 0.1), hash21(cellId + 0.2));
+    vec2 starUv = (cellId + starPos) / grid;
+    vec2 deltaPx = (screenUv - starUv) * iResolution.xy;
+    float sizePx = 0.25 + hash21(cellId + 0.3) * 0.45;
+    float d = length(deltaPx);
+    float core = smoothstep(sizePx, sizePx * 0.2, d);
+    float flickerPhase = hash21(cellId + 0.4) * 6.28318;
+    float flickerSpeed = 0.2 + hash21(cellId + 0.5) * 0.3;
+    float flickerAmount = mix(0.1, 0.35, hash21(cellId + 0.7));
+    float flicker = mix(1.0 - flickerAmount, 1.0 + flickerAmount, 0.5 + 0.5 * sin(iTime * flickerSpeed + flickerPhase));
+    float lumens = mix(1.0, 12.0, hash21(cellId + 0.6));
+    float brightness = mix(0.6, 1.4, lumens / 12.0);
+    return core * flicker * brightness;
+  }
+
+  vec2 wavedx(vec2 position, vec2 direction, float frequency, float timeshift) {
+    float x = dot(direction, position) * frequency + timeshift;
+    float wave = exp(sin(x) - 1.0);
+    float dx = wave * cos(x);
+    return vec2(wave, -dx);
+  }
+
+  float getripples(vec2 position) {
+    float rippleSum = 0.0;
+    for (int i = 0; i < 10; i++) {
+      if (i >= u_rippleCount) break;
+      vec4 ripple = u_ripples[i];
+      vec2 ripplePos = ripple.xy;
+      float birthTime = ripple.z;
+      float amplitude = ripple.w;
+      
+      float age = u_waveTime - birthTime;
+      if (age < 0.0 || age > 12.0) continue;
+      
+      float dist = length(position - ripplePos);
+      float frequency = 4.0;
+      float speed = 3.2;
+      float decay = 0.45;
+      float spatialDecay = 0.16;
+      
+      // Circular wave propagating outward with decay
+      float phase = dist * frequency - age * speed;
+      float envelope = exp(-decay * age) * exp(-dist * spatialDecay);
+      // Smooth start to avoid pop-in
+      float fadeIn = smoothstep(0.0, 0.3, age);
+      rippleSum += amplitude * envelope * fadeIn * sin(phase);
+    }
+    return rippleSum;
+  }
+
+  // Base wave calculation without ripples (used for raymarching)
+  float getwaves_base(vec2 position, int iterations) {
+    float wavePhaseShift = length(position) * 0.1;
+    vec2 swellDir = normalize(vec2(-0.25, 1.0));
+    float swellBias = 0.35;
+    float iter = 0.0;
+    float frequency = 1.0;
+    float timeMultiplier = 2.0;
+    float weight = 1.0;
+    float sumOfValues = 0.0;
+    float sumOfWeights = 0.0;
+    for(int i=0; i < 16; i++) {
+      if(i >= iterations) break;
+      vec2 p = normalize(mix(vec2(sin(iter), cos(iter)), swellDir, swellBias));
+      vec2 res = wavedx(position, p, frequency, u_waveTime * timeMultiplier + wavePhaseShift);
+      position += p * res.y * weight * DRAG_MULT;
+      sumOfValues += res.x * weight;
+      sumOfWeights += weight;
+      weight = mix(weight, 0.0, 0.2);
+      frequency *= 1.18;
+      timeMultiplier *= 1.07;
+      iter += 1232.399963;
+    }
+    float baseWaves = sumOfValues / sumOfWeights;
+
+    float swellPhase = dot(position, swellDir) * 0.18 - u_waveTime * 0.08;
+    // Center swell around 0 so it adds and subtracts from the surface.
+    float swell = sin(swellPhase);
+    vec2 cameraPos = vec2(u_waveTime * 0.2, 1.0);
+    float swellFade = smoothstep(28.0, 4.0, length(position - cameraPos));
+
+    return baseWaves + swell * swellFade * 0.35;
+  }
+
+  // Full wave calculation with ripples (used for normal calculation)
+  float getwaves(vec2 position, int iterations) {
+    return getwaves_base(position, iterations) + getripples(position);
+  }
+
+  float raymarchwater(vec3 camera, vec3 start, vec3 end, float depth) {
+    vec3 pos = start;
+    vec3 dir = normalize(end - start);
+    for(int i=0; i < RAYMARCH_STEPS; i++) {
+      float height = getwaves(pos.xz, ITERATIONS_RAYMARCH) * depth - depth;
+      if(height + 0.01 > pos.y) {
+        return distance(pos, camera);
+      }
+      pos += dir * (pos.y - height);
+    }
+    return distance(start, camera);
+  }
+
+  vec3 normal(vec2 pos, float e, float depth) {
+    vec2 ex = vec2(e, 0);
+    float H = getwaves(pos.xy, ITERATIONS_NORMAL) * depth;
+    vec3 a = vec3(pos.x, H, pos.y);
+    return normalize(
+      cross(
+        a - vec3(pos.x - e, getwaves(pos.xy - ex.xy, ITERATIONS_NORMAL) * depth, pos.y), 
+        a - vec3(pos.x, getwaves(pos.xy + ex.yx, ITERATIONS_NORMAL) * depth, pos.y + e)
+      )
+    );
+  }
+
+  mat3 createRotationMatrixAxisAngle(vec3 axis, float angle) {
+    float s = sin(angle);
+    float c = cos(angle);
+    float oc = 1.0 - c;
+    return mat3(
+      oc * axis.x * axis.x + c, oc * axis.x * axis.y - axis.z * s, oc * axis.z * axis.x + axis.y * s, 
+      oc * axis.x * axis.y + axis.z * s, oc * axis.y * axis.y + c, oc * axis.y * axis.z - axis.x * s, 
+      oc * axis.z * axis.x - axis.y * s, oc * axis.y * axis.z + axis.x * s, oc * axis.z * axis.z + c
+    );
+  }
+
+  vec3 getRay(vec2 fragCoord) {
+    vec2 uv = ((fragCoord.xy / iResolution.xy) * 2.0 - 1.0) * vec2(iResolution.x / iResolution.y, 1.0);
+    vec3 proj = normalize(vec3(uv.x, uv.y, ${CAMERA_PROJECTION_DEPTH}));
+    // Fixed camera angle (no mouse movement) - tilted up to show more sky
+    // u_cameraTiltOffset adds additional tilt (negative = look down more)
+    return createRotationMatrixAxisAngle(vec3(0.0, -1.0, 0.0), 0.0)
+      * createRotationMatrixAxisAngle(vec3(1.0, 0.0, 0.0), ${BASE_CAMERA_TILT} + u_cameraTiltOffset)
+      * proj;
+  }
+
+  float intersectPlane(vec3 origin, vec3 direction, vec3 point, vec3 normal) { 
+    return clamp(dot(point - origin, normal) / dot(direction, normal), -1.0, 9991999.0); 
+  }
+
+  vec3 extra_cheap_atmosphere(vec3 raydir, vec3 sundir) {
+    float special_trick = 1.0 / (raydir.y * 1.0 + 0.1);
+    float special_trick2 = 1.0 / (sundir.y * 11.0 + 1.0);
+    float raysundt = pow(abs(dot(sundir, raydir)), 2.0);
+    float sundt = pow(max(0.0, dot(sundir, raydir)), 8.0);
+    float mymie = sundt * special_trick * 0.2;
+    vec3 suncolor = mix(vec3(1.0), max(vec3(0.0), vec3(1.0) - vec3(5.5, 13.0, 22.4) / 22.4), special_trick2);
+    vec3 bluesky= vec3(12.0, 12.0, 13.0) / 22.4 * suncolor;
+    vec3 bluesky2 = max(vec3(0.0), bluesky - vec3(12.0, 12.0, 13.0) * 0.002 * (special_trick + -6.0 * sundir.y * sundir.y));
+    bluesky2 *= special_trick * (0.24 + raysundt * 0.24);
+    return bluesky2 * (1.0 + 1.0 * pow(1.0 - raydir.y, 3.0));
+  } 
+
+  vec3 getSunDirection() {
+    // Static sun position (no movement)
+    return normalize(vec3(-0.0773502691896258, 0.6, 0.5773502691896258));
+  }
+
+  vec3 getAtmosphere(vec3 dir) {
+     return extra_cheap_atmosphere(dir, getSunDirection()) * 0.5;
+  }
+
+  float getSun(vec3 dir) { 
+    // No visible sun disc
+    return 0.0;
+  }
+
+  vec2 skyUV(vec3 dir) {
+    float u = atan(dir.z, dir.x) / (2.0 * PI) + 0.5;
+    float v = clamp(dir.y * 0.5 + 0.5, 0.0, 1.0);
+    return vec2(u, v);
+  }
+
+  vec3 getDaySky(vec3 dir) {
+    return getAtmosphere(dir);
+  }
+
+  vec3 getNightSky(vec3 dir) {
+    vec2 uv = skyUV(dir);
+    vec3 topColor = vec3(0.015, 0.02, 0.04);
+    vec3 bottomColor = vec3(0.03, 0.035, 0.05);
+    vec3 color = mix(bottomColor, topColor, uv.y);
+
+    vec2 screenUv = dirToScreenUV(dir);
+    if (screenUv.x >= 0.0 && screenUv.x <= 1.0 && screenUv.y >= 0.0 && screenUv.y <= 1.0) {
+      if (screenUv.y > 0.35) {
+        float gridX = 40.0;
+        float gridY = 30.0;
+        vec2 grid = vec2(gridX, gridY);
+        vec2 baseCell = floor(vec2(screenUv.x * gridX, screenUv.y * gridY));
+        float s = 0.0;
+        for (int yi = -1; yi <= 1; yi++) {
+          for (int xi = -1; xi <= 1; xi++) {
+            vec2 cell = baseCell + vec2(float(xi), float(yi));
+            if (cell.y < 0.0 || cell.y >= gridY) continue;
+            cell.x = mod(cell.x + gridX, gridX);
+            s += star(screenUv, cell, grid);
+          }
+        }
+        float horizonFade = smoothstep(0.35, 0.55, screenUv.y);
+        vec3 starColor = vec3(1.0, 0.97, 0.9);
+        color += starColor * s * horizonFade;
+      }
+
+    }
+
+    return color;
+  }
+
+  float sampleLogo(vec2 uv) {
+    vec2 local = (uv - u_logoCenter) / u_logoSize + 0.5;
+    float inside = step(0.0, local.x) * step(local.x, 1.0) * step(0.0, local.y) * step(local.y, 1.0);
+    float alpha = texture2D(u_logo, local).a * inside;
+    return alpha * u_logoFade;
+  }
+
+  vec3 aces_tonemap(vec3 color) {  
+    mat3 m1 = mat3(
+      0.59719, 0.07600, 0.02840,
+      0.35458, 0.90834, 0.13383,
+      0.04823, 0.01566, 0.83777
+    );
+    mat3 m2 = mat3(
+      1.60475, -0.10208, -0.00327,
+      -0.53108,  1.10813, -0.07276,
+      -0.07367, -0.00605,  1.07602
+    );
+    vec3 v = m1 * color;  
+    vec3 a = v * (v + 0.0245786) - 0.000090537;
+    vec3 b = v * (0.983729 * v + 0.4329510) + 0.238081;
+    return pow(clamp(m2 * (a / b), 0.0, 1.0), vec3(1.0 / 2.2));  
+  }
+
+  // Film grain based on Martin Upitis's shader. Keeping this in the ocean
+  // pass avoids materializing and sampling a full-screen intermediate texture.
+  float gaussian(float z, float u, float o) {
+    return (1.0 / (o * sqrt(2.0 * 3.1415))) * exp(-(((z - u) * (z - u)) / (2.0 * (o * o))));
+  }
+
+  vec4 applyFilmGrain(vec3 color, vec2 fragCoord) {
+    float gray = dot(color, vec3(0.299, 0.587, 0.114));
+    vec2 uv = fragCoord * u_noiseScale / iResolution;
+    float seed = dot(uv, vec2(12.9898, 78.233));
+    float noise = fract(sin(seed) * 43758.5453 + u_grainTime * 1.5);
+    float variance = mix(0.75, 0.6, u_night);
+    noise = gaussian(noise, 0.0, variance * variance);
+
+    float grainIntensity = mix(0.4, 0.065, u_night);
+    gray += noise * (1.0 - gray) * grainIntensity;
+    gray = clamp(gray, 0.0, 1.0);
+
+    vec3 dark = mix(vec3(0.62), vec3(0.05), u_night);
+    vec3 light = mix(vec3(0.97), vec3(1.0), u_night);
+    return vec4(mix(dark, light, gray), 1.0);
+  }
+
+  void mainImage(out vec4 fragColor, in vec2 fragCoord) {
+    vec3 ray = getRay(fragCoord);
+    if(ray.y >= 0.0) {
+      vec3 C;
+      float horizonFactor = smoothstep(0.02, 0.25, ray.y);
+      float nightBlend = pow(u_night, mix(0.35, 1.0, horizonFactor));
+      if (u_night <= NIGHT_EPS) {
+        C = getDaySky(ray);
+      } else if (u_night >= 1.0 - NIGHT_EPS) {
+        C = getNightSky(ray);
+      } else {
+        vec3 daySky = getDaySky(ray);
+        vec3 nightSky = getNightSky(ray);
+        C = mix(daySky, nightSky, nightBlend);
+      }
+      fragColor = vec4(aces_tonemap(C * 2.0), 1.0);   
+      return;
+    }
+
+    vec3 waterPlaneHigh = vec3(0.0, 0.0, 0.0);
+    vec3 waterPlaneLow = vec3(0.0, -WATER_DEPTH, 0.0);
+    vec3 origin = vec3(u_waveTime * 0.2, CAMERA_HEIGHT + u_cameraYOffset, 1.0 + u_cameraZOffset);
+
+    float highPlaneHit = intersectPlane(origin, ray, waterPlaneHigh, vec3(0.0, 1.0, 0.0));
+    float lowPlaneHit = intersectPlane(origin, ray, waterPlaneLow, vec3(0.0, 1.0, 0.0));
+    vec3 highHitPos = origin + ray * highPlaneHit;
+    vec3 lowHitPos = origin + ray * lowPlaneHit;
+
+    float dist = raymarchwater(origin, highHitPos, lowHitPos, WATER_DEPTH);
+    vec3 waterHitPos = origin + ray * dist;
+
+    float eps = max(0.01, dist * 0.004);
+    vec3 N = normal(waterHitPos.xz, eps, WATER_DEPTH);
+    N = mix(N, vec3(0.0, 1.0, 0.0), 0.8 * min(1.0, sqrt(dist*0.01) * 1.1));
+
+    float fresnelSharp = 0.04 + 0.96 * pow(1.0 - max(0.0, dot(-N, ray)), 5.0);
+    // At distance, converge Fresnel to the smooth flat-normal value to kill speckle
+    float fresnelFlat = 0.04 + 0.96 * pow(1.0 - max(0.0, dot(vec3(0.0, 1.0, 0.0), -ray)), 5.0);
+    float fresnelBlend = min(1.0, sqrt(dist * 0.01) * 1.1);
+    float fresnel = mix(fresnelSharp, fresnelFlat, fresnelBlend);
+
+    vec3 R = normalize(reflect(ray, N));
+    R.y = abs(R.y);
+    
+    float reflectedLogo = sampleLogo(skyUV(R));
+    vec3 reflection;
+    float reflectionHorizon = smoothstep(0.02, 0.25, R.y);
+    float nightReflectionBlend = pow(u_night, mix(0.35, 1.0, reflectionHorizon));
+    if (u_night <= NIGHT_EPS) {
+      reflection = getDaySky(R);
+    } else if (u_night >= 1.0 - NIGHT_EPS) {
+      reflection = getNightSky(R);
+    } else {
+      vec3 dayReflection = getDaySky(R);
+      vec3 nightReflection = getNightSky(R);
+      reflection = mix(dayReflection, nightReflection, nightReflectionBlend);
+    }
+    reflection += vec3(1.0) * (reflectedLogo * LOGO_INTENSITY);
+    vec3 scatteringBase = mix(vec3(0.08, 0.08, 0.09), vec3(0.02, 0.02, 0.03), u_night);
+    vec3 scattering = scatteringBase * (0.2 + (waterHitPos.y + WATER_DEPTH) / WATER_DEPTH);
+
+    vec3 C = fresnel * reflection + scattering;
+    
+    // Add distance fog
+    vec3 fogColor = mix(vec3(0.55, 0.55, 0.58), vec3(0.03, 0.035, 0.05), u_night);
+    float fogAmount = 1.0 - exp(-dist * 0.02);
+    C = mix(C, fogColor, fogAmount);
+    
+    // Darken waves in light mode
+    float waveBrightness = mix(1.4, 1.9, u_night);
+    fragColor = vec4(aces_tonemap(C * waveBrightness), 1.0);
+  }
+
+  void main() {
+    vec4 sceneColor;
+    mainImage(sceneColor, gl_FragCoord.xy);
+    gl_FragColor = applyFilmGrain(sceneColor.rgb, gl_FragCoord.xy);
+  }
+`;
+}
+
+let fragmentShaderSource = buildFragmentShader(currentQuality);
+
+function createShader(gl, type, source) {
+  const shader = gl.createShader(type);
+  gl.shaderSource(shader, source);
+  gl.compileShader(shader);
+  if (!gl.getShaderParameter(shader, gl.COMPILE_STATUS)) {
+    console.error(gl.getShaderInfoLog(shader));
+    gl.deleteShader(shader);
+    return null;
+  }
+  return shader;
+}
+
+function createProgram(gl, vertexShader, fragmentShader) {
+  const program = gl.createProgram();
+  gl.attachShader(program, vertexShader);
+  gl.attachShader(program, fragmentShader);
+  gl.linkProgram(program);
+  if (!gl.getProgramParameter(program, gl.LINK_STATUS)) {
+    console.error(gl.getProgramInfoLog(program));
+    gl.deleteProgram(program);
+    return null;
+  }
+  return program;
+}
+
+// Ocean wave program
+const vertexShader = createShader(gl, gl.VERTEX_SHADER, vertexShaderSource);
+let oceanFragmentShader = createShader(gl, gl.FRAGMENT_SHADER, fragmentShaderSource);
+let program = createProgram(gl, vertexShader, oceanFragmentShader);
+
+const positionBuffer = gl.createBuffer();
+gl.bindBuffer(gl.ARRAY_BUFFER, positionBuffer);
+gl.bufferData(gl.ARRAY_BUFFER, new Float32Array([
+  -1, -1, 1, -1, -1, 1,
+  -1, 1, 1, -1, 1, 1
+]), gl.STATIC_DRAW);
+
+let positionLocation = gl.getAttribLocation(program, 'position');
+let resolutionLocation = gl.getUniformLocation(program, 'iResolution');
+let timeLocation = gl.getUniformLocation(program, 'iTime');
+let waveTimeLocation = gl.getUniformLocation(program, 'u_waveTime');
+let grainTimeLocation = gl.getUniformLocation(program, 'u_grainTime');
+let noiseScaleLocation = gl.getUniformLocation(program, 'u_noiseScale');
+let logoTextureLocation = gl.getUniformLocation(program, 'u_logo');
+let logoCenterLocation = gl.getUniformLocation(program, 'u_logoCenter');
+let logoSizeLocation = gl.getUniformLocation(program, 'u_logoSize');
+let logoFadeLocation = gl.getUniformLocation(program, 'u_logoFade');
+let ripplesLocation = gl.getUniformLocation(program, 'u_ripples');
+let rippleCountLocation = gl.getUniformLocation(program, 'u_rippleCount');
+let nightLocation = gl.getUniformLocation(program, 'u_night');
+let cameraYOffsetLocation = gl.getUniformLocation(program, 'u_cameraYOffset');
+let cameraZOffsetLocation = gl.getUniformLocation(program, 'u_cameraZOffset');
+let cameraTiltOffsetLocation = gl.getUniformLocation(program, 'u_cameraTiltOffset');
+
+function rebuildOceanProgram() {
+  fragmentShaderSource = buildFragmentShader(currentQuality);
+  if (oceanFragmentShader) gl.deleteShader(oceanFragmentShader);
+  if (program) gl.deleteProgram(program);
+  
+  oceanFragmentShader = createShader(gl, gl.FRAGMENT_SHADER, fragmentShaderSource);
+  program = createProgram(gl, vertexShader, oceanFragmentShader);
+  
+  positionLocation = gl.getAttribLocation(program, 'position');
+  resolutionLocation = gl.getUniformLocation(program, 'iResolution');
+  timeLocation = gl.getUniformLocation(program, 'iTime');
+  waveTimeLocation = gl.getUniformLocation(program, 'u_waveTime');
+  grainTimeLocation = gl.getUniformLocation(program, 'u_grainTime');
+  noiseScaleLocation = gl.getUniformLocation(program, 'u_noiseScale');
+  logoTextureLocation = gl.getUniformLocation(program, 'u_logo');
+  logoCenterLocation = gl.getUniformLocation(program, 'u_logoCenter');
+  logoSizeLocation = gl.getUniformLocation(program, 'u_logoSize');
+  logoFadeLocation = gl.getUniformLocation(program, 'u_logoFade');
+  ripplesLocation = gl.getUniformLocation(program, 'u_ripples');
+  rippleCountLocation = gl.getUniformLocation(program, 'u_rippleCount');
+  nightLocation = gl.getUniformLocation(program, 'u_night');
+  cameraYOffsetLocation = gl.getUniformLocation(program, 'u_cameraYOffset');
+  cameraZOffsetLocation = gl.getUniformLocation(program, 'u_cameraZOffset');
+  cameraTiltOffsetLocation = gl.getUniformLocation(program, 'u_cameraTiltOffset');
+}
+
+function setQuality(quality) {
+  if (!QUALITY_LEVELS.includes(quality) || quality === currentQuality) return;
+  currentQuality = quality;
+  rebuildOceanProgram();
+  resize();
+  lastQualityChangeTime = performance.now();
+}
+
+function updateAutoQuality(time, fps) {
+  // Add FPS sample with timestamp
+  autoQualityFpsHistory.push({ time, fps });
+
+  // Remove old samples outside the window
+  const cutoff = time - AUTO_QUALITY_SAMPLE_TIME;
+  while (autoQualityFpsHistory.length > 0 && autoQualityFpsHistory[0].time < cutoff) {
+    autoQualityFpsHistory.shift();
+  }
+
+  // Need enough samples before making decisions
+  if (autoQualityFpsHistory.length < 3) return;
+
+  // Check cooldown
+  if (time - lastQualityChangeTime < AUTO_QUALITY_COOLDOWN) return;
+
+  // Calculate average FPS
+  const avgFps = autoQualityFpsHistory.reduce((sum, s) => sum + s.fps, 0) / autoQualityFpsHistory.length;
+  const currentIndex = QUALITY_LEVELS.indexOf(currentQuality);
+
+  if (avgFps < AUTO_QUALITY_FPS_LOW && currentIndex > 0) {
+    // FPS too low, reduce quality
+    setQuality(QUALITY_LEVELS[currentIndex - 1]);
+    autoQualityFpsHistory = []; // Reset history after change
+  } else if (avgFps > AUTO_QUALITY_FPS_HIGH && currentIndex < QUALITY_LEVELS.length - 1) {
+    // FPS high enough, try increasing quality
+    setQuality(QUALITY_LEVELS[currentIndex + 1]);
+    autoQualityFpsHistory = []; // Reset history after change
+  }
+}
+
+const logoCenter = [0.53, 0.72];
+let logoSize = [0.18, 0.18 / 1.32];
+let logoFadeStart = null;
+const logoTexture = gl.createTexture();
+gl.bindTexture(gl.TEXTURE_2D, logoTexture);
+gl.texImage2D(gl.TEXTURE_2D, 0, gl.RGBA, 1, 1, 0, gl.RGBA, gl.UNSIGNED_BYTE, new Uint8Array([0, 0, 0, 0]));
+gl.texParameteri(gl.TEXTURE_2D, gl.TEXTURE_MIN_FILTER, gl.LINEAR);
+gl.texParameteri(gl.TEXTURE_2D, gl.TEXTURE_MAG_FILTER, gl.LINEAR);
+gl.texParameteri(gl.TEXTURE_2D, gl.TEXTURE_WRAP_S, gl.CLAMP_TO_EDGE);
+gl.texParameteri(gl.TEXTURE_2D, gl.TEXTURE_WRAP_T, gl.CLAMP_TO_EDGE);
+
+function setupLogoTexture() {
+  const img = new Image();
+  img.onload = () => {
+    const logoAspect = img.naturalWidth && img.naturalHeight
+      ? img.naturalWidth / img.naturalHeight
+      : 1.32;
+    const baseSize = 0.18;
+    logoSize = [baseSize, baseSize / logoAspect];
+
+    const width = 512;
+    const height = Math.max(1, Math.round(width / logoAspect));
+    const logoCanvas = document.createElement('canvas');
+    logoCanvas.width = width;
+    logoCanvas.height = height;
+    const ctx = logoCanvas.getContext('2d');
+    ctx.clearRect(0, 0, width, height);
+    ctx.drawImage(img, 0, 0, width, height);
+    gl.bindTexture(gl.TEXTURE_2D, logoTexture);
+    gl.pixelStorei(gl.UNPACK_PREMULTIPLY_ALPHA_WEBGL, true);
+    gl.texImage2D(gl.TEXTURE_2D, 0, gl.RGBA, gl.RGBA, gl.UNSIGNED_BYTE, logoCanvas);
+    updateLogoPlacement();
+  };
+
+  img.onerror = () => {
+    console.warn('Unable to load logo SVG for texture.');
+  };
+
+  img.src = LOGO_SVG_URL;
+}
+
+function resize() {
+  // Use the canvas's CSS layout size (set by 100vw × 100dvh in CSS),
+  // which remains stable during pinch/browser zoom.
+  const width = canvas.clientWidth;
+  const height = canvas.clientHeight;
+  if (!width || !height) return;
+  // Render at reduced resolution based on quality setting
+  // Use higher scale on low DPI screens for sharper rendering
+  const isLowDpi = window.devicePixelRatio < LOW_DPI_THRESHOLD;
+  const settings = QUALITY_SETTINGS[currentQuality];
+  const qualityScale = isLowDpi ? settings.lowDpiScale : settings.scale;
+  const resolutionScale = contentPageResolutionReduced
+    ? CONTENT_PAGE_RESOLUTION_SCALE
+    : 1.0;
+  const scale = qualityScale * resolutionScale;
+  canvas.width = Math.round(width * window.devicePixelRatio * scale);
+  canvas.height = Math.round(height * window.devicePixelRatio * scale);
+  updateLogoPlacement();
+  syncSceneHorizonPosition(true);
+}
+
+window.addEventListener('resize', resize);
+resize();
+setupLogoTexture();
+// Recalculate logo reflection placement once the logo image has its intrinsic dimensions
+if (logo.complete) {
+  updateLogoPlacement();
+} else {
+  logo.addEventListener('load', updateLogoPlacement);
+}
+
+// FPS tracking
+let frameCount = 0;
+let lastFpsUpdate = 0;
+
+// Separate accumulated clocks let the motion preference change at runtime
+// without jumping to a different point in either animation. Playback speed
+// eases between modes so leaving a content page does not abruptly accelerate
+// the ocean.
+let waveTime = 0;
+let grainTime = 0;
+let lastAmbientMotionTime = null;
+let ambientMotionIsReduced = null;
+let ambientSpeedTransitionElapsed = AMBIENT_MOTION_SPEED_TRANSITION_DURATION;
+let waveSpeed = 1.0;
+let grainSpeed = 1.0;
+let waveSpeedFrom = waveSpeed;
+let grainSpeedFrom = grainSpeed;
+let waveSpeedTo = waveSpeed;
+let grainSpeedTo = grainSpeed;
+let contentFrameRateCapActive = false;
+let nextContentRenderTime = null;
+
+function updateAmbientMotionClocks(time, contentPage) {
+  const reduced = shouldReduceAmbientMotion(contentPage);
+
+  if (lastAmbientMotionTime === null) {
+    waveTime = time * 0.001;
+    grainTime = time * 0.001;
+    waveSpeed = reduced ? REDUCED_MOTION_WAVE_SPEED : 1.0;
+    grainSpeed = reduced ? REDUCED_MOTION_GRAIN_SPEED : 1.0;
+    waveSpeedFrom = waveSpeedTo = waveSpeed;
+    grainSpeedFrom = grainSpeedTo = grainSpeed;
+    ambientMotionIsReduced = reduced;
+    lastAmbientMotionTime = time;
+    return;
+  }
+
+  const delta = Math.max(0, (time - lastAmbientMotionTime) * 0.001);
+  if (reduced !== ambientMotionIsReduced) {
+    ambientMotionIsReduced = reduced;
+    ambientSpeedTransitionElapsed = 0;
+    waveSpeedFrom = waveSpeed;
+    grainSpeedFrom = grainSpeed;
+    waveSpeedTo = reduced ? REDUCED_MOTION_WAVE_SPEED : 1.0;
+    grainSpeedTo = reduced ? REDUCED_MOTION_GRAIN_SPEED : 1.0;
+  }
+
+  if (ambientSpeedTransitionElapsed < AMBIENT_MOTION_SPEED_TRANSITION_DURATION) {
+    ambientSpeedTransitionElapsed = Math.min(
+      ambientSpeedTransitionElapsed + delta,
+      AMBIENT_MOTION_SPEED_TRANSITION_DURATION
+    );
+    const progress = ambientSpeedTransitionElapsed / AMBIENT_MOTION_SPEED_TRANSITION_DURATION;
+    const eased = easeInOut(progress);
+    waveSpeed = waveSpeedFrom + (waveSpeedTo - waveSpeedFrom) * eased;
+    grainSpeed = grainSpeedFrom + (grainSpeedTo - grainSpeedFrom) * eased;
+  } else {
+    waveSpeed = waveSpeedTo;
+    grainSpeed = grainSpeedTo;
+  }
+
+  waveTime += delta * waveSpeed;
+  grainTime += delta * grainSpeed;
+  lastAmbientMotionTime = time;
+}
+
+// Keep the transition smooth at the display's native refresh rate and full
+// resolution, then reduce GPU work once a content page has settled into its
+// slower ambient motion.
+function shouldRenderAmbientFrame(time, contentPage) {
+  const shouldReduceContentResources = contentPage &&
+    ambientMotionIsReduced &&
+    ambientSpeedTransitionElapsed >= AMBIENT_MOTION_SPEED_TRANSITION_DURATION;
+
+  if (contentPageResolutionReduced !== shouldReduceContentResources) {
+    contentPageResolutionReduced = shouldReduceContentResources;
+    resize();
+  }
+
+  if (!shouldReduceContentResources) {
+    contentFrameRateCapActive = false;
+    nextContentRenderTime = null;
+    return true;
+  }
+
+  if (!contentFrameRateCapActive || nextContentRenderTime === null) {
+    contentFrameRateCapActive = true;
+    nextContentRenderTime = time + CONTENT_PAGE_RENDER_INTERVAL;
+    return true;
+  }
+
+  // Allow a small tolerance for requestAnimationFrame timestamp rounding.
+  if (time + 0.5 < nextContentRenderTime) return false;
+
+  const elapsedIntervals = Math.floor(
+    (time + 0.5 - nextContentRenderTime) / CONTENT_PAGE_RENDER_INTERVAL
+  ) + 1;
+  nextContentRenderTime += elapsedIntervals * CONTENT_PAGE_RENDER_INTERVAL;
+  return true;
+}
+
+// Ripple system
+const MAX_RIPPLES = 10;
+const RIPPLE_LIFETIME = 12;
+const ripples = []; // Array of {x, z, time, amplitude}
+const rippleUniformData = new Float32Array(MAX_RIPPLES * 4);
+
+function screenToWaterHit(clientX, clientY, time) {
+  const rect = canvas.getBoundingClientRect();
+  const ndcX = (clientX - rect.left) / rect.width * 2 - 1;
+  const ndcY = -((clientY - rect.top) / rect.height * 2 - 1);
+  
+  const aspect = canvas.width / canvas.height;
+  let rayX = ndcX * aspect;
+  let rayY = ndcY;
+  let rayZ = CAMERA_PROJECTION_DEPTH;
+  const len = Math.hypot(rayX, rayY, rayZ);
+  rayX /= len; rayY /= len; rayZ /= len;
+  
+  // Apply camera tilt around the X axis (matches the GLSL shader):
+  // newY = cos(a)*y + sin(a)*z
+  // newZ = -sin(a)*y + cos(a)*z
+  const tiltAngle = BASE_CAMERA_TILT + cameraTiltOffset;
+  const cosTilt = Math.cos(tiltAngle);
+  const sinTilt = Math.sin(tiltAngle);
+  const newY = rayY * cosTilt + rayZ * sinTilt;
+  const newZ = -rayY * sinTilt + rayZ * cosTilt;
+  rayY = newY;
+  rayZ = newZ;
+  
+  // Camera position (matches shader, including offsets)
+  const camX = time * 0.2;
+  const camY = 1.5 + cameraYOffset; // CAMERA_HEIGHT + offset
+  const camZ = 1.0 + cameraZOffset;
+  
+  // Intersect with y=0 plane
+  if (rayY >= 0) return null; // Looking up, no water hit
+  
+  const t = -camY / rayY;
+  return { x: camX + rayX * t, z: camZ + rayZ * t };
+}
+
+function addRipple(worldX, worldZ, time, amplitude = 0.22) {
+  ripples.push({ x: worldX, z: worldZ, time: time, amplitude: amplitude });
+  if (ripples.length > MAX_RIPPLES) {
+    ripples.shift();
+  }
+}
+
+function getRippleUniforms(time) {
+  // Expired ripples used to remain in the shader's dynamic loop forever.
+  // Birth times are ordered, so pruning is cheap and keeps the common idle
+  // path at zero iterations. Reuse the upload buffer to avoid per-frame GC.
+  while (ripples.length && time - ripples[0].time > RIPPLE_LIFETIME) {
+    ripples.shift();
+  }
+
+  for (let i = 0; i < ripples.length; i++) {
+    const r = ripples[i];
+    rippleUniformData[i * 4 + 0] = r.x;
+    rippleUniformData[i * 4 + 1] = r.z;
+    rippleUniformData[i * 4 + 2] = r.time;
+    rippleUniformData[i * 4 + 3] = r.amplitude;
+  }
+  return rippleUniformData;
+}
+
+function wrapUVDelta(a, b) {
+  let d = a - b;
+  if (d > 0.5) d -= 1.0;
+  if (d < -0.5) d += 1.0;
+  return d;
+}
+
+function screenPosToSkyUV(screenX, screenY, aspect) {
+  const uvX = screenX * 2 - 1;
+  const uvY = screenY * 2 - 1;
+  const projX = uvX * aspect;
+  const projY = uvY;
+  const projZ = CAMERA_PROJECTION_DEPTH;
+
+  const projLen = Math.hypot(projX, projY, projZ);
+  let rayX = projX / projLen;
+  let rayY = projY / projLen;
+  let rayZ = projZ / projLen;
+
+  // Apply camera tilt around the X axis (matches the GLSL shader)
+  const tiltAngle = BASE_CAMERA_TILT + cameraTiltOffset;
+  const cosTilt = Math.cos(tiltAngle);
+  const sinTilt = Math.sin(tiltAngle);
+  const rotatedY = rayY * cosTilt + rayZ * sinTilt;
+  const rotatedZ = -rayY * sinTilt + rayZ * cosTilt;
+  rayY = rotatedY;
+  rayZ = rotatedZ;
+
+  if (rayY < 0) return null;
+
+  const u = ((Math.atan2(rayZ, rayX) / (2 * Math.PI)) + 0.5) % 1;
+  const v = Math.min(1, Math.max(0, rayY * 0.5 + 0.5));
+  return { u, v };
+}
+
+function updateLogoPlacement() {
+  if (!logo) return;
+  const canvasRect = canvas.getBoundingClientRect();
+  const logoRect = logo.getBoundingClientRect();
+  if (!canvasRect.width || !canvasRect.height) return;
+  // Skip if logo hasn't loaded yet (height unknown)
+  if (!logoRect.height) return;
+
+  const centerX = (logoRect.left + logoRect.width / 2 - canvasRect.left) / canvasRect.width;
+  const centerY = 1 - (logoRect.top + logoRect.height / 2 - canvasRect.top) / canvasRect.height;
+  const aspect = canvas.width / canvas.height;
+  const centerUV = screenPosToSkyUV(centerX, centerY, aspect);
+  if (!centerUV) return;
+
+  const halfWidth = (logoRect.width / 2) / canvasRect.width;
+  const halfHeight = (logoRect.height / 2) / canvasRect.height;
+  const leftUV = screenPosToSkyUV(centerX - halfWidth, centerY, aspect);
+  const rightUV = screenPosToSkyUV(centerX + halfWidth, centerY, aspect);
+  const upUV = screenPosToSkyUV(centerX, centerY + halfHeight, aspect);
+  const downUV = screenPosToSkyUV(centerX, centerY - halfHeight, aspect);
+
+  let sizeU = logoSize[0];
+  let sizeV = logoSize[1];
+
+  if (leftUV && rightUV) {
+    sizeU = Math.abs(wrapUVDelta(rightUV.u, leftUV.u));
+  }
+  if (upUV && downUV) {
+    sizeV = Math.abs(upUV.v - downUV.v);
+  }
+
+  logoCenter[0] = centerUV.u;
+  logoCenter[1] = centerUV.v;
+  logoSize[0] = sizeU;
+  logoSize[1] = sizeV;
+}
+
+// Ripple on click
+canvas.addEventListener('click', (e) => {
+  const hit = screenToWaterHit(e.clientX, e.clientY, waveTime);
+  if (hit) {
+    addRipple(hit.x, hit.z, waveTime, 0.18);
+  }
+});
+
+// Mark shader as ready after first successful frame
+let shaderReady = false;
+function markShaderReady() {
+  if (!shaderReady && program) {
+    shaderReady = true;
+    canvas.classList.add('shader-ready');
+  }
+}
+
+function render(time) {
+  const contentPage = isContentPage();
+  updateAmbientMotionClocks(time, contentPage);
+
+  if (!shouldRenderAmbientFrame(time, contentPage)) {
+    requestAnimationFrame(render);
+    return;
+  }
+
+  // Measure FPS for adaptive quality. Ignore the intentional content-page cap
+  // so it is not mistaken for a performance problem.
+  if (contentFrameRateCapActive) {
+    frameCount = 0;
+    lastFpsUpdate = time;
+  } else {
+    frameCount++;
+    if (time - lastFpsUpdate >= 1000) {
+      const fps = frameCount;
+
+      // Update auto quality based on measured FPS
+      updateAutoQuality(time, fps);
+
+      frameCount = 0;
+      lastFpsUpdate = time;
+    }
+  }
+
+  if (logoFadeStart === null) {
+    logoFadeStart = time + LOGO_FADE_DELAY;
+  }
+  const logoProgress = Math.min(Math.max((time - logoFadeStart) / LOGO_FADE_DURATION, 0), 1);
+  const logoFade = logoProgress * LOGO_FADE_TARGET;
+  const nightValue = updateNightBlend(time);
+  const cameraChanged = updateCamera404(time);
+  if (cameraChanged && sceneHorizonGeometry) {
+    syncSceneHorizonPosition(false);
+  }
+
+  // Render the ocean and film grain directly to the canvas. The former
+  // three-pass pipeline performed two redundant full-screen draws and forced
+  // a tile-store/texture-load round trip on mobile and Apple GPUs.
+  gl.bindFramebuffer(gl.FRAMEBUFFER, null);
+  gl.viewport(0, 0, canvas.width, canvas.height);
+  gl.useProgram(program);
+  gl.enableVertexAttribArray(positionLocation);
+  gl.bindBuffer(gl.ARRAY_BUFFER, positionBuffer);
+  gl.vertexAttribPointer(positionLocation, 2, gl.FLOAT, false, 0, 0);
+  gl.uniform2f(resolutionLocation, canvas.width, canvas.height);
+  gl.uniform1f(timeLocation, time * 0.001);
+  gl.uniform1f(waveTimeLocation, waveTime);
+  gl.uniform1f(grainTimeLocation, grainTime);
+  const noiseScale = window.devicePixelRatio < LOW_DPI_THRESHOLD ? LOW_DPI_NOISE_SCALE : 1.0;
+  gl.uniform1f(noiseScaleLocation, noiseScale);
+  gl.uniform2f(logoCenterLocation, logoCenter[0], logoCenter[1]);
+  gl.uniform2f(logoSizeLocation, logoSize[0], logoSize[1]);
+  gl.uniform1f(logoFadeLocation, logoFade);
+  gl.uniform1f(nightLocation, nightValue);
+  gl.uniform1f(cameraYOffsetLocation, cameraYOffset);
+  gl.uniform1f(cameraZOffsetLocation, cameraZOffset);
+  gl.uniform1f(cameraTiltOffsetLocation, cameraTiltOffset);
+  gl.activeTexture(gl.TEXTURE0);
+  gl.bindTexture(gl.TEXTURE_2D, logoTexture);
+  gl.uniform1i(logoTextureLocation, 0);
+
+  gl.uniform4fv(ripplesLocation, getRippleUniforms(waveTime));
+  gl.uniform1i(rippleCountLocation, ripples.length);
+
+  gl.drawArrays(gl.TRIANGLES, 0, 6);
+  markShaderReady();
+  requestAnimationFrame(render);
+}
+
+requestAnimationFrame(render);
+
+// Logo fade-in animation (skip if not on home page)
+if (document.body.classList.contains('skip-intro')) {
+  // Non-home page: show immediately
+  document.body.classList.add('loaded');
+} else {
+  // Home page: fade in
+  setTimeout(() => {
+    const fadeDuration = LOGO_FADE_DURATION / 1000;
+    logo.style.transition = `opacity ${fadeDuration}s ease`;
+    logo.style.opacity = `${LOGO_FADE_TARGET}`;
+    const logoLinks = document.querySelector('.logo-links');
+    if (logoLinks) {
+      logoLinks.style.transition = `opacity ${fadeDuration}s ease`;
+      logoLinks.style.opacity = `${LOGO_FADE_TARGET}`;
+    }
+    // Mark body as loaded so HTMX swaps don't restart animation
+    setTimeout(() => {
+      document.body.classList.add('loaded');
+    }, fadeDuration * 1000);
+  }, LOGO_FADE_DELAY);
+}
+
+})();
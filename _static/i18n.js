@@ -1,14 +1,21 @@
 /**
  * Lightweight i18n for static site.
- * Loads translations from /locales/{lang}/*.json
+ * Loads one translation bundle per language from /locales/{lang}.{hash}.json
+ * (see data-bundles on the script tag); bundles already contain the English
+ * fallback for missing keys.
  * Uses browser language by default, falls back to English.
+ *
+ * Pages built with --localized are already translated (<html
+ * data-i18n-prerendered>); on those, switching language navigates to the
+ * page's hreflang alternate instead of rewriting the DOM.
  */
 (function() {
   'use strict';
 
   var FALLBACK_LANG = 'en';
   var LANG_COOKIE = 'lang';
-  var NAMESPACES = ['common', 'posts', 'subscribe', 'errors', 'content'];
+  var BUNDLE_SCRIPT = document.currentScript;
+  var BUNDLES = JSON.parse((BUNDLE_SCRIPT && BUNDLE_SCRIPT.getAttribute('data-bundles')) || '{}');
   var RTL_LANGUAGES = ['ar', 'he', 'fa'];
   var SUPPORTED_LANGUAGES = [
     'en', 'ar', 'bn', 'de', 'es', 'fa', 'fr', 'he', 'hi', 'id',
@@ -26,14 +33,6 @@
   // their native Intl conventions.
   var DATE_LOCALES = { en: 'en-GB' };
 
-  // Extract message from English format { message: "...", context: "..." } or plain string
-  function extractMessage(value) {
-    if (typeof value === 'object' && value !== null && 'message' in value) {
-      return value.message;
-    }
-    return typeof value === 'string' ? value : '';
-  }
-
   // DOMPurify configuration for translation content
   var PURIFY_CONFIG = {
     ALLOWED_TAGS: ['a', 'span', 'em', 'strong', 'br', 'p', 'b', 'i', 'ul', 'ol', 'li'],
@@ -42,19 +41,8 @@
 
   // Get translation by key (e.g., "common.site.title")
   function t(key, values) {
-    var parts = key.split('.');
-    var ns = parts[0];
-    var id = parts.slice(1).join('.');
-    
-    // Try current language
-    var nsData = translations[currentLang + ':' + ns];
-    var message = nsData ? extractMessage(nsData[id]) : null;
-    
-    // Fallback to English
-    if (!message && currentLang !== FALLBACK_LANG) {
-      nsData = translations[FALLBACK_LANG + ':' + ns];
-      message = nsData ? extractMessage(nsData[id]) : null;
-    }
+    var bundle = translations[currentLang];
+    var message = bundle ? bundle[key] : null;
     
     if (!message) return key;
     
@@ -68,40 +56,27 @@
     return message;
   }
 
-  // Load a namespace for a language
-  function loadNamespace(lang, ns) {
-    var key = lang + ':' + ns;
-    if (translations[key]) {
+  // Load the translation bundle for a language
+  function loadLanguage(lang) {
+    if (translations[lang]) {
+      return Promise.resolve();
+    }
+    if (!BUNDLES[lang]) {
+      translations[lang] = {};
       return Promise.resolve();
     }
     
-    return fetch('/locales/' + lang + '/' + ns + '.json')
+    return fetch('/locales/' + lang + '.' + BUNDLES[lang] + '.json')
       .then(function(res) {
         if (!res.ok) throw new Error('Not found');
         return res.json();
       })
       .then(function(data) {
-        translations[key] = data;
+        translations[lang] = data;
       })
       .catch(function() {
-        translations[key] = {};
-      });
-  }
-
-  // Load all namespaces for a language
-  function loadLanguage(lang) {
-    var promises = NAMESPACES.map(function(ns) {
-      return loadNamespace(lang, ns);
-    });
-    
-    // Always load English as fallback
-    if (lang !== FALLBACK_LANG) {
-      NAMESPACES.forEach(function(ns) {
-        promises.push(loadNamespace(FALLBACK_LANG, ns));
+        translations[lang] = {};
       });
-    }
-    
-    return Promise.all(promises);
   }
 
   // Get language from cookie
@@ -269,6 +244,17 @@
     }
   }
 
+  function isPrerendered() {
+    return document.documentElement.hasAttribute('data-i18n-prerendered');
+  }
+
+  // Path of this page's pre-rendered version in another language
+  function alternatePath(lang) {
+    var link = document.querySelector('link[rel="alternate"][hreflang="' + lang + '"]');
+    if (!link) return null;
+    return new URL(link.href).pathname + window.location.search + window.location.hash;
+  }
+
   // Change language
   function changeLanguage(lang) {
     if (SUPPORTED_LANGUAGES.indexOf(lang) === -1) {
@@ -276,6 +262,13 @@
       return Promise.resolve();
     }
     
+    var path = isPrerendered() && alternatePath(lang);
+    if (path) {
+      saveLangCookie(lang);
+      window.location.href = path;
+      return Promise.resolve();
+    }
+    
     return loadLanguage(lang).then(function() {
       currentLang = lang;
       saveLangCookie(lang);
@@ -291,12 +284,24 @@
   function init() {
     // Priority: cookie > browser > fallback
     var lang = getLangFromCookie() || getBrowserLang() || FALLBACK_LANG;
+    var prerendered = isPrerendered() && document.documentElement.lang;
+    
+    if (prerendered && prerendered !== lang) {
+      var path = alternatePath(lang);
+      if (path) {
+        window.location.replace(path);
+        return new Promise(function() {});
+      }
+    }
     
     return loadLanguage(lang).then(function() {
       currentLang = lang;
       applyDirection(lang);
       ready = true;
-      updateDOM();
+      // Pre-rendered pages only need the bundle for scripted messages.
+      if (prerendered !== lang) {
+        updateDOM();
+      }
       
       // Call ready callbacks
       readyCallbacks.forEach(function(cb) { cb(); });
@@ -120,18 +120,17 @@ window.__earendilUiRuntime = window.__earendilUiRuntime || {};
       if (menuPanel && !menuPanel.dataset.initialized) {
         menuPanel.dataset.initialized = 'true';
         menuPanel.addEventListener('click', function(event) {
+          // Delegated so search results added later close the menu too.
+          if (event.target.closest('a')) {
+            closeMenuOnMobile();
+            return;
+          }
           if (event.target !== menuPanel) return;
           setMenuExpanded(menu, false);
           triggerButton.focus();
         });
       }
 
-      menu.querySelectorAll('.menu-links a').forEach(function(link) {
-        if (link.dataset.mobileCloseBound) return;
-        link.dataset.mobileCloseBound = 'true';
-        link.addEventListener('click', closeMenuOnMobile);
-      });
-
       if (!menuRuntime.mobileMenuKeyboardBound) {
         menuRuntime.mobileMenuKeyboardBound = true;
         document.addEventListener('keydown', function(event) {
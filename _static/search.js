@@ -0,0 +1,221 @@
+/**
+ * Client-side search over the index written by build.py.
+ * Loads /search/{lang}/index.json, then only the shards that hold the query's
+ * terms. Tokenization mirrors search_terms() in build.py.
+ *
+ *   window.search.query('prompt cach').then(function(results) { ... });
+ *
+ * The last word of a query also matches as a prefix, for search as you type,
+ * even when it is a single letter. Also drives the search field in the site
+ * menu ([data-site-search]).
+ */
+(function() {
+  'use strict';
+
+  var FALLBACK_LANG = 'en';
+  var SEARCH_DELAY_MS = 120;
+  var MAX_RESULTS = 8;
+  var CJK = '\u3040-\u30ff\u31f0-\u31ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff';
+  var THAI = '\u0e00-\u0e7f';
+  var TOKEN_RE = new RegExp(
+    '([' + CJK + ']+)|([' + THAI + ']+)|((?:(?![' + CJK + THAI + '])[\\p{L}\\p{M}\\p{N}_])+)',
+    'gu'
+  );
+
+  var indexes = {};
+  var shards = {};
+
+  // With partial, a word still being typed at the end of text is kept even
+  // when it is too short to be indexed, so it can match as a prefix.
+  function terms(text, partial) {
+    var result = [];
+    var normalized = text.normalize('NFKC').toLowerCase();
+    var match;
+    TOKEN_RE.lastIndex = 0;
+    while ((match = TOKEN_RE.exec(normalized))) {
+      var token = match[0];
+      var chars = Array.from(token);
+      var typing = partial && TOKEN_RE.lastIndex === normalized.length;
+      if (match[3]) {
+        if (chars.length > 1 || typing || /^\p{N}+$/u.test(token)) result.push(token);
+      } else if (chars.length === 1) {
+        result.push(token);
+      } else {
+        for (var i = 0; i < chars.length - 1; i++) {
+          result.push(chars[i] + chars[i + 1]);
+        }
+      }
+    }
+    return result;
+  }
+
+  function shardName(term) {
+    var chars = Array.from(term);
+    var prefix = chars[0].charCodeAt(0) < 128 ? chars.slice(0, 2) : chars.slice(0, 1);
+    return prefix.map(function(char) {
+      return /^[a-z0-9]$/i.test(char) ? char : '_' + char.codePointAt(0).toString(16);
+    }).join('');
+  }
+
+  function fetchJSON(url) {
+    return fetch(url).then(function(res) {
+      if (!res.ok) throw new Error('Not found');
+      return res.json();
+    });
+  }
+
+  function loadIndex(lang) {
+    if (!indexes[lang]) {
+      indexes[lang] = fetchJSON('/search/' + lang + '/index.json').catch(function(err) {
+        if (lang === FALLBACK_LANG) throw err;
+        return loadIndex(FALLBACK_LANG).then(function(index) {
+          index.lang = FALLBACK_LANG;
+          return index;
+        });
+      }).then(function(index) {
+        index.lang = index.lang || lang;
+        return index;
+      });
+    }
+    return indexes[lang];
+  }
+
+  function loadShard(index, name) {
+    var hash = index.shards[name];
+    if (!hash) return Promise.resolve({});
+    var url = '/search/' + index.lang + '/' + name + '.' + hash + '.json';
+    if (!shards[url]) {
+      shards[url] = fetchJSON(url).catch(function() { return {}; });
+    }
+    return shards[url];
+  }
+
+  // Shards are keyed by two-letter prefixes of ASCII terms, so a one-letter
+  // prefix is spread over every shard that extends it.
+  function loadTermShards(index, term, prefix) {
+    var name = shardName(term);
+    var names = [name];
+    if (prefix && term.length === 1 && term.charCodeAt(0) < 128) {
+      names = Object.keys(index.shards).filter(function(candidate) {
+        return candidate.indexOf(name) === 0;
+      });
+    }
+    return Promise.all(names.map(function(candidate) {
+      return loadShard(index, candidate);
+    })).then(function(loaded) {
+      return Object.assign.apply(Object, [{}].concat(loaded));
+    });
+  }
+
+  // Frequencies per document for a term, or for every term it prefixes.
+  function postings(shard, term, prefix) {
+    var result = {};
+    Object.keys(shard).forEach(function(candidate) {
+      if (candidate !== term && !(prefix && candidate.indexOf(term) === 0)) return;
+      var list = shard[candidate];
+      for (var i = 0; i < list.length; i += 2) {
+        result[list[i]] = (result[list[i]] || 0) + list[i + 1];
+      }
+    });
+    return result;
+  }
+
+  // Documents containing every query term, ranked by tf-idf.
+  function query(text, lang) {
+    var queryTerms = terms(text, true);
+    if (!queryTerms.length) return Promise.resolve([]);
+    lang = lang || currentLanguage();
+
+    return loadIndex(lang).then(function(index) {
+      var total = Object.keys(index.docs).length;
+      return Promise.all(queryTerms.map(function(term, i) {
+        return loadTermShards(index, term, i === queryTerms.length - 1);
+      })).then(function(loaded) {
+        var scores = null;
+        queryTerms.forEach(function(term, i) {
+          var matches = postings(loaded[i], term, i === queryTerms.length - 1);
+          var ids = Object.keys(matches);
+          var idf = Math.log(1 + total / (ids.length || 1));
+          var next = {};
+          ids.forEach(function(id) {
+            if (scores === null || id in scores) {
+              next[id] = (scores ? scores[id] : 0) + matches[id] * idf;
+            }
+          });
+          scores = next;
+        });
+        return Object.keys(scores).map(function(id) {
+          return { url: index.docs[id][0], title: index.docs[id][1], score: scores[id] };
+        }).sort(function(a, b) {
+          return b.score - a.score;
+        });
+      });
+    });
+  }
+
+  function currentLanguage() {
+    return (window.i18n ? window.i18n.getLanguage() : document.documentElement.lang) || FALLBACK_LANG;
+  }
+
+  function initSearchField() {
+    var container = document.querySelector('[data-site-search]');
+    if (!container || container.dataset.initialized) return;
+    container.dataset.initialized = 'true';
+    var input = container.querySelector('input');
+    var results = container.querySelector('[data-search-results]');
+    var timer = null;
+    var latest = 0;
+
+    function render(found) {
+      results.textContent = '';
+      if (!input.value.trim()) {
+        results.hidden = true;
+        return;
+      }
+      if (!found.length) {
+        var empty = document.createElement('span');
+        empty.className = 'menu-search-empty';
+        empty.textContent = window.i18n ? window.i18n.t('common.search.noResults') : 'No results';
+        results.appendChild(empty);
+      }
+      found.slice(0, MAX_RESULTS).forEach(function(result) {
+        var link = document.createElement('a');
+        link.className = 'nav-link';
+        link.href = result.url;
+        link.textContent = result.title;
+        results.appendChild(link);
+      });
+      results.hidden = false;
+      if (window.htmx) window.htmx.process(results);
+    }
+
+    function search() {
+      var current = ++latest;
+      query(input.value).then(function(found) {
+        if (current === latest) render(found);
+      }, function() {
+        if (current === latest) render([]);
+      });
+    }
+
+    // Fetch the index as soon as the field is used, so the first query only
+    // waits for its shards.
+    input.addEventListener('focus', function() {
+      loadIndex(currentLanguage()).catch(function() {});
+    });
+    input.addEventListener('input', function() {
+      clearTimeout(timer);
+      timer = setTimeout(search, SEARCH_DELAY_MS);
+    });
+    window.addEventListener('languagechange', function() {
+      if (input.value.trim()) search();
+    });
+  }
+
+  initSearchField();
+
+  window.search = {
+    query: query,
+    terms: terms
+  };
+})();
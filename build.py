@@ -1,48 +1,222 @@
 #!/usr/bin/env -S uv run --script
 # /// script
-# dependencies = ["minijinja", "pyyaml", "markdown", "watchdog", "pillow"]
+# dependencies = ["minijinja", "pyyaml", "markdown", "watchdog", "pillow", "brotli", "babel", "fonttools", "pygments", "markdown-it-py", "mdit-py-plugins"]
 # ///
 from __future__ import annotations
 
 import argparse
+import cProfile
+import functools
+import gzip
+import hashlib
+import io
+import json
+import logging
 import os
+import posixpath
 import re
 import shutil
+import socket
+import sqlite3
+import sys
 import threading
 import time
 import traceback
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
+from html import escape, unescape
+from html.parser import HTMLParser
 from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
 from pathlib import Path
-from typing import Any, Callable, Tuple
+from typing import Any, Callable, Iterable, Iterator, TextIO, Tuple
 from urllib.parse import urljoin, urlparse
 from xml.etree import ElementTree
 
 from minijinja import Environment, safe, load_from_path
-from PIL import Image, ImageDraw, ImageFont
+from PIL import ExifTags, Image, ImageDraw, ImageFont, ImageOps
 
 import yaml
 import markdown as md_lib
+from markdown.extensions import Extension
+from markdown.extensions.attr_list import get_attrs_and_remainder
+from markdown.extensions.fenced_code import FencedBlockPreprocessor
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli variants are optional
+    brotli = None
+
+try:
+    import babel
+    import babel.dates
+except ImportError:  # pragma: no cover - localized dates are optional
+    babel = None
+
+try:
+    from fontTools import subset as font_subset
+    from fontTools.ttLib import TTFont
+except ImportError:  # pragma: no cover - fonts are copied as-is without fontTools
+    font_subset = None
+
+try:
+    import pygments
+    from pygments.lexers import get_lexer_by_name
+    from pygments.token import STANDARD_TYPES
+    from pygments.util import ClassNotFound
+except ImportError:  # pragma: no cover - code blocks stay plain without pygments
+    pygments = None
+
+try:
+    from markdown_it import MarkdownIt
+    from mdit_py_plugins.attrs import attrs_block_plugin
+    from mdit_py_plugins.deflist import deflist_plugin
+    from mdit_py_plugins.footnote import footnote_plugin
+except ImportError:  # pragma: no cover - only the python-markdown backend is needed
+    MarkdownIt = None
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
 
 ROOT = Path(__file__).resolve().parent
 TEMPLATES_DIR = ROOT / "_templates"
 STATIC_DIR = ROOT / "_static"
 LOCALES_DIR = ROOT / "locales"
 BUILD_DIR = ROOT / "_build"
+CACHE_DIR = ROOT / "_cache"
+MANIFEST_PATH = CACHE_DIR / "build-manifest.json"
+POST_INDEX_PATH = CACHE_DIR / "posts.sqlite3"
+MANIFEST_VERSION = 1
+PROFILE_REPORT_NAME = "build-profile.json"
+PROFILE_CPROFILE_NAME = "build-profile.prof"
+PROFILE_TOP_N = 10
+
+# Text formats only: fonts are served as WOFF2 slices and images are
+# already compressed.
+COMPRESSIBLE_SUFFIXES = {
+    ".atom", ".css", ".html", ".ico", ".js", ".json", ".rss", ".svg", ".txt",
+    ".webmanifest", ".xml",
+}
+COMPRESS_MIN_SIZE = 256
+# Suffix and Content-Encoding of each precompressed variant.
+COMPRESSED_VARIANTS = (("br", ".br"), ("gzip", ".gz"))
+BROTLI_QUALITY = 11
+# The dev server recompresses on every rebuild and only serves localhost.
+SERVE_BROTLI_QUALITY = 5
+
+STATIC_URL_PREFIX = "/static/"
+ASSET_MANIFEST_NAME = "assets.json"
+ASSET_HASH_LENGTH = 10
+CSS_URL_RE = re.compile(r"""url\(\s*(?P<quote>['"]?)(?P<url>[^'")]+)(?P=quote)\s*\)""")
+HTML_URL_ATTR_RE = re.compile(
+    r"""(?P<prefix>\b(?:href|src|content)\s*=\s*)(?P<quote>['"])(?P<url>[^'"]*)(?P=quote)""",
+    re.IGNORECASE,
+)
+IMG_TAG_RE = re.compile(r"<img\b[^>]*>", re.IGNORECASE)
+HTML_ATTR_RE = re.compile(
+    r"""(?P<name>[^\s"'>/=]+)(?:\s*=\s*(?:"(?P<double>[^"]*)"|'(?P<single>[^']*)'|(?P<bare>[^\s"'>]+)))?"""
+)
 
-FRONTMATTER_RE = re.compile(r"\A---\s*\n(.*?)\n---\s*\n?", re.DOTALL)
-CODE_BLOCK_RE = re.compile(
-    r"<pre><code(?P<attrs>[^>]*)>(?P<body>.*?)</code></pre>",
-    re.DOTALL,
+CSS_GROUP_AT_RULES = {"@media", "@supports", "@layer", "@container", "@document"}
+FONT_FAMILY_RE = re.compile(r"""font-family\s*:\s*(['"]?)(?P<family>[^;'"]+)\1""")
+FONT_UNICODE_RANGE_RE = re.compile(r"unicode-range\s*:\s*(?P<ranges>[^;}]+)")
+SELECTOR_TOKEN_RE = re.compile(
+    r"""::?(?P<pseudo>[\w-]+)(?P<open>\()?"""
+    r"""|\.(?P<class>[\w-]+)|\#(?P<id>[\w-]+)"""
+    r"""|\[\s*(?P<attr>[\w:-]+)\s*(?:(?P<op>[~|^$*]?=)\s*(?:"(?P<double>[^"]*)"|'(?P<single>[^']*)'|(?P<bare>[^\]\s]+)))?[^\]]*\]"""
+    r"""|(?P<tag>[a-zA-Z][\w-]*)"""
+)
+# Functional pseudo-classes that match when any selector in them does.
+SELECTOR_ANY_OF_PSEUDO_CLASSES = {"is", "where", "has", "matches", "-webkit-any", "-moz-any"}
+LINK_TAG_RE = re.compile(r"<link\b[^>]*>", re.IGNORECASE)
+SCRIPT_SRC_RE = re.compile(r"""<script\b[^>]*?\bsrc\s*=\s*(['"])(?P<src>[^'"]+)\1""", re.IGNORECASE)
+SCRIPT_CLASS_RE = re.compile(r"""classList\.(?:add|toggle)\(\s*(['"])(?P<name>[\w-]+)\1""")
+# Classes the inline page transition script of layout.html toggles, which
+# are not in the scripts SCRIPT_CLASS_RE scans.
+CRITICAL_CSS_SAFELIST = frozenset(
+    {".content-page-swap", ".is-content-entering", ".is-entering", ".is-leaving", ".skip-intro"}
+)
+# Adds the stylesheets preloaded with data-stylesheet once, marked so that
+# htmx's head-support keeps them across boosted navigations.
+ASYNC_STYLESHEET_LOADER = (
+    "<script>document.querySelectorAll('link[data-stylesheet]').forEach(function(preload){"
+    "var href=preload.getAttribute('href');"
+    "if(document.querySelector('link[rel=\"stylesheet\"][href=\"'+href+'\"]'))return;"
+    "var link=document.createElement('link');link.rel='stylesheet';link.href=href;"
+    "link.setAttribute('hx-preserve','true');document.head.appendChild(link);});</script>"
+)
+
+RESPONSIVE_IMAGE_DIR = "posts"
+RESPONSIVE_IMAGE_SUFFIXES = {".png", ".jpg", ".jpeg"}
+RESPONSIVE_IMAGE_WIDTHS = (400, 800, 1200, 1600)
+# Encoder effort is kept moderate: libavif's default speed takes about 3.5x
+# as long as speed 8 for ~8% smaller files, and WebP's method 6 can take
+# seconds per image with an alpha channel for no measurable gain over 4.
+RESPONSIVE_IMAGE_FORMATS = (
+    ("avif", "image/avif", {"quality": 60, "speed": 8}),
+    ("webp", "image/webp", {"quality": 82, "method": 4}),
+)
+RESPONSIVE_IMAGE_SIZES = "(max-width: 520px) calc(100vw - 56px), (max-width: 800px) calc(100vw - 80px), 760px"
+RESPONSIVE_IMAGE_DENSITY_SUFFIX = "@2x"
+
+FONT_STYLESHEETS = ("fonts/commit-mono.css", "fonts/departure-mono.css", "fonts/plantin-mt-pro.css")
+FONT_FILE_SUFFIXES = {".otf", ".ttf", ".woff", ".woff2"}
+CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+FONT_FACE_RE = re.compile(r"/\*.*?\*/|@font-face\s*\{(?P<body>[^}]*)\}", re.DOTALL)
+FONT_SRC_RE = re.compile(r"\bsrc\s*:(?P<value>[^;]*);")
+FONT_SRC_ENTRY_RE = re.compile(
+    r"""url\(\s*(?P<quote>['"]?)(?P<url>[^'")]+)(?P=quote)\s*\)(?:\s*format\(\s*['"]?(?P<format>[^'")]+)['"]?\s*\))?"""
+    r"""|local\([^)]*\)"""
 )
+# Slices a font is split into, by the first one that holds a character; the
+# remaining characters go into FONT_FALLBACK_SLICE.
+FONT_SLICES = (
+    (
+        "latin",
+        (
+            (0x0000, 0x00FF), (0x0131, 0x0131), (0x0152, 0x0153), (0x02BB, 0x02BC), (0x02C6, 0x02C6),
+            (0x02DA, 0x02DA), (0x02DC, 0x02DC), (0x2000, 0x206F), (0x20AC, 0x20AC), (0x2122, 0x2122),
+            (0x2212, 0x2215), (0xFEFF, 0xFEFF), (0xFFFD, 0xFFFD),
+        ),
+    ),
+    ("latin-ext", ((0x0100, 0x02FF), (0x1E00, 0x1EFF), (0x20A0, 0x20CF), (0x2C60, 0x2C7F), (0xA720, 0xA7FF))),
+    ("greek", ((0x0370, 0x03FF), (0x1F00, 0x1FFF))),
+    ("cyrillic", ((0x0400, 0x052F), (0x1C80, 0x1C8F), (0x2DE0, 0x2DFF), (0xA640, 0xA69F))),
+)
+FONT_FALLBACK_SLICE = "symbols"
+# Text inserted on the client (dates, search input) is not known at build
+# time, so every font keeps printable ASCII and Latin-1.
+FONT_BASELINE_RANGES = ((0x0020, 0x007E), (0x00A0, 0x00FF))
+
+FRONTMATTER_RE = re.compile(r"\A---\s*\n(.*?)\n---\s*\n?", re.DOTALL)
+TEMPLATE_REFERENCE_RE = re.compile(r"\{%-?\s*(?:extends|include|import|from)\s+(?P<args>.*?)-?%\}", re.DOTALL)
+TEMPLATE_NAME_RE = re.compile(r"""["']([^"']+)["']""")
 CODE_REVEAL_MARKER = "◊"
 CODE_REVEAL_INITIAL_DELAY_MS = 120
 CODE_REVEAL_STEP_DELAY_MS = 105
+# Bump when render_code_block emits different markup, so cached blocks are redone.
+CODE_BLOCK_MARKUP_VERSION = 1
+# Fenced code in these languages (or none) is not run through a lexer.
+PLAIN_CODE_LANGUAGES = frozenset({"", "text", "txt", "plain"})
 
 SITE_URL = "https://earendil.com/"
 UPDATES_FEED_LIMIT = 10
 UPDATE_IGNORED_FILES = {"_index.md", "subscribe.md"}
+POSTS_PER_PAGE = 20
+POSTS_FRAGMENT_TEMPLATE = "posts-fragment.html"
+# Written next to each index.html for htmx-boosted navigation: the page's
+# <div class="page"> plus the head tags that change between pages.
+PAGE_FRAGMENT_NAME = "content.html"
+PAGE_DIV_RE = re.compile(r"""<div\b[^>]*\bclass\s*=\s*(['"])page\1[^>]*>""", re.IGNORECASE)
+DIV_TAG_RE = re.compile(r"<(/?)div\b[^>]*>", re.IGNORECASE)
+PAGE_HEAD_TAG_RE = re.compile(
+    r"<title\b.*?</title>|<meta\b[^>]*\b(?:name|property)\s*=[^>]*>|<link\b[^>]*\bhreflang\s*=[^>]*>",
+    re.IGNORECASE | re.DOTALL,
+)
 
 OG_IMAGE_SIZE = (1200, 630)
 OG_TITLE_MAX_WIDTH = 1000
@@ -52,6 +226,15 @@ OG_TEXT_COLOR = "#353431"
 OG_PAPER_PATH = STATIC_DIR / "paper.png"
 OG_LOGO_PATH = STATIC_DIR / "og" / "earendil-logo.png"
 OG_TITLE_FONT_PATH = STATIC_DIR / "fonts" / "PlantinNowVariable-Upright.woff2"
+OG_CACHE_DIR = CACHE_DIR / "og"
+COMPRESSED_CACHE_DIR = CACHE_DIR / "compressed"
+IMAGE_CACHE_DIR = CACHE_DIR / "images"
+FONT_CACHE_DIR = CACHE_DIR / "fonts"
+GLYPH_CACHE_DIR = CACHE_DIR / "glyphs"
+HIGHLIGHT_CACHE_DIR = CACHE_DIR / "highlight"
+SEARCH_CACHE_DIR = CACHE_DIR / "search"
+SEARCH_TITLE_WEIGHT = 5
+SEARCH_DOC_ID_LENGTH = 8
 
 
 def parse_frontmatter(raw: str) -> Tuple[dict[str, Any], str]:
@@ -74,45 +257,199 @@ def parse_frontmatter(raw: str) -> Tuple[dict[str, Any], str]:
     return data, body
 
 
-def _render_code_reveals(html: str) -> str:
-    """Turn ◊-delimited code chunks into viewport-reveal steps.
+def _escape_code(text: str) -> str:
+    # Matches the escaping of markdown's own fenced_code extension.
+    return escape(text, quote=False).replace('"', "&quot;")
 
-    The marker only has meaning inside a fenced code block. Text before the
-    first marker stays visible; each marked chunk becomes the next reveal.
-    Without the site CSS or JavaScript all chunks remain ordinary code text.
+
+def _highlight_runs(code: str, language: str) -> list[tuple[str, str]]:
+    """Split code into (Pygments short class, text) runs, merging neighbours.
+
+    Plain text has an empty class. Unknown languages, and everything without
+    pygments installed, come back as a single plain run.
     """
-    def replace_code_block(match: re.Match[str]) -> str:
-        body = match.group("body")
-        if CODE_REVEAL_MARKER not in body:
-            return match.group(0)
+    if pygments is None or language in PLAIN_CODE_LANGUAGES:
+        return [("", code)]
+    try:
+        lexer = get_lexer_by_name(language, stripnl=False, ensurenl=False)
+    except ClassNotFound:
+        return [("", code)]
+    runs: list[tuple[str, str]] = []
+    for token_type, value in lexer.get_tokens(code):
+        while token_type not in STANDARD_TYPES:
+            token_type = token_type.parent
+        css_class = STANDARD_TYPES[token_type]
+        if css_class == "w":
+            css_class = ""
+        if runs and runs[-1][0] == css_class:
+            runs[-1] = (css_class, runs[-1][1] + value)
+        else:
+            runs.append((css_class, value))
+    if "".join(value for _, value in runs) != code:
+        # The lexer normalised something (like line endings); keep the source.
+        return [("", code)]
+    return runs
+
+
+def _render_runs(runs: Iterable[tuple[str, str]]) -> str:
+    return "".join(
+        f'<span class="{css_class}">{_escape_code(text)}</span>' if css_class else _escape_code(text)
+        for css_class, text in runs
+    )
 
-        chunks = body.split(CODE_REVEAL_MARKER)
-        rendered_chunks = [chunks[0]]
+
+def _split_runs(runs: list[tuple[str, str]], lengths: list[int]) -> list[list[tuple[str, str]]]:
+    """Cut runs at the boundaries of consecutive chunks of the given lengths."""
+    chunks: list[list[tuple[str, str]]] = [[] for _ in lengths]
+    index, remaining = 0, lengths[0]
+    for css_class, text in runs:
+        while text:
+            while remaining == 0 and index < len(lengths) - 1:
+                index += 1
+                remaining = lengths[index]
+            take = len(text) if index == len(lengths) - 1 else min(len(text), remaining)
+            chunks[index].append((css_class, text[:take]))
+            text = text[take:]
+            remaining -= take
+    return chunks
+
+
+def render_code_block(code: str, language: str) -> str:
+    """Render a fenced code block as highlighted, revealable HTML.
+
+    Tokens become static <span class="..."> elements using Pygments' short
+    class names (styled in prose.css), so there is no highlighting work in
+    the browser. ◊ markers split the block into viewport-reveal steps: text
+    before the first marker stays visible and each marked chunk becomes the
+    next step, with tokens that straddle a marker cut in two. Without the
+    site CSS or JavaScript all chunks remain ordinary code text.
+
+    Results are cached by language, code, highlighter version and the reveal
+    markup (its version and delays).
+    """
+    version = pygments.__version__ if pygments is not None else ""
+    markup = repr((CODE_BLOCK_MARKUP_VERSION, CODE_REVEAL_INITIAL_DELAY_MS, CODE_REVEAL_STEP_DELAY_MS))
+    cached_path = HIGHLIGHT_CACHE_DIR / f"{content_digest(language, code, version, markup)}.html"
+    if cached_path.exists():
+        return cached_path.read_text(encoding="utf-8")
+
+    chunks = code.split(CODE_REVEAL_MARKER)
+    runs = _highlight_runs("".join(chunks), language)
+    code_attrs = f' class="language-{_escape_code(language)}"' if language else ""
+    if len(chunks) == 1:
+        html = f"<pre><code{code_attrs}>{_render_runs(runs)}</code></pre>"
+    else:
+        rendered_chunks = []
         reveal_index = 0
-        for chunk in chunks[1:]:
-            if not chunk:
+        for chunk_index, chunk_runs in enumerate(_split_runs(runs, [len(chunk) for chunk in chunks])):
+            if chunk_index == 0:
+                rendered_chunks.append(_render_runs(chunk_runs))
+                continue
+            if not chunk_runs:
                 continue
             delay = CODE_REVEAL_INITIAL_DELAY_MS + reveal_index * CODE_REVEAL_STEP_DELAY_MS
             rendered_chunks.append(
-                f'<span class="code-reveal__step" style="--reveal-delay: {delay}ms">{chunk}</span>'
+                f'<span class="code-reveal__step" style="--reveal-delay: {delay}ms">{_render_runs(chunk_runs)}</span>'
             )
             reveal_index += 1
-
-        attrs = match.group("attrs")
-        return (
+        html = (
             f'<pre class="code-reveal" data-code-reveal data-reveal-steps="{reveal_index}">'
-            f"<code{attrs}>{''.join(rendered_chunks)}</code></pre>"
+            f"<code{code_attrs}>{''.join(rendered_chunks)}</code></pre>"
         )
 
-    return CODE_BLOCK_RE.sub(replace_code_block, html)
+    cached_path.parent.mkdir(parents=True, exist_ok=True)
+    cached_path.write_text(html, encoding="utf-8")
+    return html
+
+
+class CodeBlockPreprocessor(FencedBlockPreprocessor):
+    """Fenced code blocks rendered by render_code_block.
+
+    Replaces markdown's fenced_code preprocessor, so highlighting and ◊
+    reveals happen while the block is extracted instead of in a second pass
+    over the finished HTML. Only the language of a block is used.
+    """
+
+    def run(self, lines: list[str]) -> list[str]:
+        text = "\n".join(lines)
+        index = 0
+        while match := self.FENCED_BLOCK_RE.search(text, index):
+            language = match.group("lang") or ""
+            if match.group("attrs"):
+                attrs, remainder = get_attrs_and_remainder(match.group("attrs"))
+                if remainder:
+                    index = match.end("attrs")
+                    continue
+                _, classes, _ = self.handle_attrs(attrs)
+                language = classes[0] if classes else ""
+            placeholder = self.md.htmlStash.store(render_code_block(match.group("code"), language))
+            text = f"{text[: match.start()]}\n{placeholder}\n{text[match.end() :]}"
+            index = match.start() + 1 + len(placeholder)
+        return text.split("\n")
+
+
+class CodeBlockExtension(Extension):
+    def extendMarkdown(self, md: md_lib.Markdown) -> None:
+        # Registered under fenced_code's name and priority to replace it.
+        md.preprocessors.register(CodeBlockPreprocessor(md, {}), "fenced_code_block", 25)
+
+
+def _python_markdown_converter() -> Callable[[str], str]:
+    # One Markdown instance per process, reset between documents, instead of
+    # setting up the extensions again for every call.
+    converter = md_lib.Markdown(extensions=["extra", CodeBlockExtension()])
+
+    def convert(text: str) -> str:
+        try:
+            return converter.convert(text)
+        finally:
+            converter.reset()
+
+    return convert
+
+
+def _markdown_it_converter() -> Callable[[str], str]:
+    # CommonMark plus the parts of python-markdown's "extra" the site uses.
+    # Fences go through render_code_block like they do with python-markdown.
+    parser = (
+        MarkdownIt("commonmark", {"html": True, "highlight": lambda code, lang, attrs: render_code_block(code, lang)})
+        .enable("table")
+        .use(footnote_plugin)
+        .use(deflist_plugin)
+        .use(attrs_block_plugin)
+    )
+    return parser.render
+
+
+MARKDOWN_BACKENDS: dict[str, Callable[[], Callable[[str], str]]] = {
+    "python-markdown": _python_markdown_converter,
+    "markdown-it": _markdown_it_converter,
+}
+DEFAULT_MARKDOWN_BACKEND = "python-markdown"
+# Bump when render_markdown's output changes, so caches of rendered text are redone.
+MARKDOWN_RENDER_VERSION = 1
 
 
-def render_markdown(text: str) -> str:
+def markdown_backend_available(name: str) -> bool:
+    return name == "python-markdown" or (name == "markdown-it" and MarkdownIt is not None)
+
+
+@functools.cache
+def _markdown_converter(name: str) -> Callable[[str], str]:
+    return MARKDOWN_BACKENDS[name]()
+
+
+def render_markdown(text: str, backend: str = DEFAULT_MARKDOWN_BACKEND) -> str:
+    """Convert markdown to HTML with one of MARKDOWN_BACKENDS.
+
+    python-markdown is the reference; markdown-it (with markdown-it-py and
+    mdit-py-plugins installed) is several times faster but renders some
+    constructs differently, see scripts/markdown_diff.py.
+    """
     text = text.strip()
     if not text:
         return ""
-    html = md_lib.markdown(text, extensions=["extra"])
-    return _render_code_reveals(html)
+    return _markdown_converter(backend)(text)
 
 
 def parse_post_date(date_str: str) -> datetime | None:
@@ -165,165 +502,274 @@ def output_path_for(path: Path, build_dir: Path, frontmatter: dict[str, Any] | N
     return build_dir / without_ext / "index.html"
 
 
-def _og_text_width(draw: ImageDraw.ImageDraw, text: str, font: ImageFont.FreeTypeFont) -> int:
-    bbox = draw.textbbox((0, 0), text, font=font)
-    return bbox[2] - bbox[0]
+def output_url(output: str) -> str:
+    """Map an output path relative to the build directory to its URL."""
+    if output == "index.html":
+        return "/"
+    if output.endswith("/index.html"):
+        return "/" + output[: -len("index.html")]
+    return "/" + output
 
 
-def _wrap_og_title(draw: ImageDraw.ImageDraw, title: str, font: ImageFont.FreeTypeFont) -> list[str]:
-    """Wrap a title to the available card width, including long words."""
-    lines: list[str] = []
-    current_line = ""
-    for word in title.split():
-        candidate = f"{current_line} {word}".strip()
-        if _og_text_width(draw, candidate, font) <= OG_TITLE_MAX_WIDTH:
-            current_line = candidate
-            continue
+OG_FONT_SIZES = tuple(range(80, 41, -2))
+OG_FALLBACK_FONT_SIZE = 40
+OG_FALLBACK_SPACING = 7
+OG_TITLE_AREA_TOP = 240
+# Bump when OGCardRenderer draws cards differently, so cached cards are redrawn.
+OG_RENDER_VERSION = 1
 
-        if current_line:
-            lines.append(current_line)
-            current_line = ""
 
-        while _og_text_width(draw, word, font) > OG_TITLE_MAX_WIDTH:
-            split_at = len(word)
-            while split_at > 1 and _og_text_width(draw, word[:split_at], font) > OG_TITLE_MAX_WIDTH:
-                split_at -= 1
-            lines.append(word[:split_at])
-            word = word[split_at:]
-        current_line = word
+class OGCardRenderer:
+    """Render paper, logo, and article-title social cards.
+
+    The tiled paper and logo background is composed once, fonts are loaded
+    once per size, and text widths are memoized per size, so rendering many
+    cards only pays for their title layout and PNG encoding.
+    """
 
-    if current_line:
-        lines.append(current_line)
-    return lines
+    def __init__(
+        self,
+        font_path: Path | None = None,
+        paper_path: Path | None = None,
+        logo_path: Path | None = None,
+    ):
+        self.font_path = font_path or OG_TITLE_FONT_PATH
+        self.paper_path = paper_path or OG_PAPER_PATH
+        self.logo_path = logo_path or OG_LOGO_PATH
+        self._background: Image.Image | None = None
+        self._fonts: dict[int, ImageFont.FreeTypeFont] = {}
+        self._widths: dict[int, dict[str, int]] = {}
+        # Text metrics do not depend on the pixels, only on the image mode.
+        self._draw = ImageDraw.Draw(Image.new("RGB", (1, 1)))
+
+    def background(self) -> Image.Image:
+        if self._background is None:
+            width, height = OG_IMAGE_SIZE
+            paper = Image.open(self.paper_path).convert("RGB")
+            image = Image.new("RGB", OG_IMAGE_SIZE, "#faf9f6")
+            for y in range(0, height, paper.height):
+                for x in range(0, width, paper.width):
+                    image.paste(paper, (x, y))
+
+            logo = Image.open(self.logo_path).convert("RGBA")
+            logo.thumbnail((180, 137), Image.Resampling.LANCZOS)
+            image.paste(logo, ((width - logo.width) // 2, 48), logo)
+            self._background = image
+        return self._background
+
+    def font(self, size: int) -> ImageFont.FreeTypeFont:
+        font = self._fonts.get(size)
+        if font is None:
+            font = self._fonts[size] = ImageFont.truetype(str(self.font_path), size)
+        return font
+
+    def text_width(self, text: str, size: int) -> int:
+        widths = self._widths.setdefault(size, {})
+        width = widths.get(text)
+        if width is None:
+            bbox = self._draw.textbbox((0, 0), text, font=self.font(size))
+            width = widths[text] = bbox[2] - bbox[0]
+        return width
+
+    def _split_long_word(self, word: str, size: int) -> int:
+        """Return the longest prefix length of word that fits on one line."""
+        low, high = 1, len(word)
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self.text_width(word[:middle], size) <= OG_TITLE_MAX_WIDTH:
+                low = middle
+            else:
+                high = middle - 1
+        return low
+
+    def wrap_title(self, title: str, size: int) -> list[str]:
+        """Wrap a title to the available card width, including long words."""
+        lines: list[str] = []
+        current_line = ""
+        for word in title.split():
+            candidate = f"{current_line} {word}".strip()
+            if self.text_width(candidate, size) <= OG_TITLE_MAX_WIDTH:
+                current_line = candidate
+                continue
 
+            if current_line:
+                lines.append(current_line)
+                current_line = ""
 
-def _avoid_og_orphan(
-    draw: ImageDraw.ImageDraw,
-    lines: list[str],
-    font: ImageFont.FreeTypeFont,
-) -> list[str]:
-    """Move a word from the previous line when the final line is an orphan."""
-    balanced = list(lines)
-    if len(balanced) < 2 or len(balanced[-1].split()) != 1:
-        return balanced
+            while self.text_width(word, size) > OG_TITLE_MAX_WIDTH:
+                split_at = self._split_long_word(word, size)
+                lines.append(word[:split_at])
+                word = word[split_at:]
+            current_line = word
 
-    previous_words = balanced[-2].split()
-    if len(previous_words) < 2:
+        if current_line:
+            lines.append(current_line)
+        return lines
+
+    def avoid_orphan(self, lines: list[str], size: int) -> list[str]:
+        """Move a word from the previous line when the final line is an orphan."""
+        balanced = list(lines)
+        if len(balanced) < 2 or len(balanced[-1].split()) != 1:
+            return balanced
+
+        previous_words = balanced[-2].split()
+        if len(previous_words) < 2:
+            return balanced
+
+        final_line = f"{previous_words[-1]} {balanced[-1]}"
+        if self.text_width(final_line, size) <= OG_TITLE_MAX_WIDTH:
+            balanced[-2] = " ".join(previous_words[:-1])
+            balanced[-1] = final_line
         return balanced
 
-    final_line = f"{previous_words[-1]} {balanced[-1]}"
-    if _og_text_width(draw, final_line, font) <= OG_TITLE_MAX_WIDTH:
-        balanced[-2] = " ".join(previous_words[:-1])
-        balanced[-1] = final_line
-    return balanced
+    def truncate_lines(self, lines: list[str], size: int) -> list[str]:
+        """Clamp wrapped title lines and mark omitted text with an ellipsis."""
+        omitted_text = len(lines) > OG_TITLE_MAX_LINES
+        truncated = self.avoid_orphan(lines[:OG_TITLE_MAX_LINES], size)
+
+        # If two words cannot share the final line, omit the orphan rather than
+        # allowing it to sit by itself.
+        if len(truncated) > 1 and len(truncated[-1].split()) == 1:
+            truncated.pop()
+            omitted_text = True
+
+        if not omitted_text:
+            return truncated
+
+        last_line = truncated[-1].rstrip()
+        ellipsis = "…"
+        while last_line and self.text_width(last_line + ellipsis, size) > OG_TITLE_MAX_WIDTH:
+            last_line = last_line[:-1].rstrip()
+        truncated[-1] = last_line + ellipsis
+        return truncated
 
+    def _text_bbox(self, lines: list[str], size: int, spacing: int) -> tuple[int, int, int, int]:
+        return self._draw.multiline_textbbox(
+            (0, 0),
+            "\n".join(lines),
+            font=self.font(size),
+            spacing=spacing,
+            align="center",
+        )
 
-def _truncate_og_lines(
-    draw: ImageDraw.ImageDraw,
-    lines: list[str],
-    font: ImageFont.FreeTypeFont,
-) -> list[str]:
-    """Clamp wrapped title lines and mark omitted text with an ellipsis."""
-    omitted_text = len(lines) > OG_TITLE_MAX_LINES
-    truncated = _avoid_og_orphan(draw, lines[:OG_TITLE_MAX_LINES], font)
+    def layout_title(self, title: str) -> tuple[int, list[str], int, tuple[int, int, int, int]]:
+        """Pick the largest font size whose wrapped title fits the card.
+
+        Returns the font size, lines, line spacing and text bounding box.
+        """
+        candidates: dict[int, tuple[list[str], int, tuple[int, int, int, int]]] = {}
+
+        def candidate(size: int) -> tuple[list[str], int, tuple[int, int, int, int]]:
+            if size not in candidates:
+                lines = self.avoid_orphan(self.wrap_title(title, size), size)
+                spacing = round(size * 0.18)
+                candidates[size] = (lines, spacing, self._text_bbox(lines, size, spacing))
+            return candidates[size]
+
+        def fits(size: int) -> bool:
+            lines, _, bbox = candidate(size)
+            return len(lines) <= OG_TITLE_MAX_LINES and bbox[3] - bbox[1] <= OG_TITLE_MAX_HEIGHT
+
+        # Wrapped line count and text height only grow with the font size, so
+        # bisect for the largest size that fits. Orphans do not follow the size
+        # monotonically, so step down from there until one is avoided.
+        low, high = 0, len(OG_FONT_SIZES)
+        while low < high:
+            middle = (low + high) // 2
+            if fits(OG_FONT_SIZES[middle]):
+                high = middle
+            else:
+                low = middle + 1
+
+        for size in OG_FONT_SIZES[low:]:
+            lines, spacing, bbox = candidate(size)
+            has_orphan = len(lines) > 1 and len(lines[-1].split()) == 1
+            if fits(size) and not has_orphan:
+                return size, lines, spacing, bbox
+
+        size = OG_FALLBACK_FONT_SIZE
+        lines = self.truncate_lines(self.wrap_title(title, size), size)
+        return size, lines, OG_FALLBACK_SPACING, self._text_bbox(lines, size, OG_FALLBACK_SPACING)
+
+    def render(self, title: str, output_path: Path) -> None:
+        width, _ = OG_IMAGE_SIZE
+        image = self.background().copy()
+        size, lines, spacing, bbox = self.layout_title(title)
+        text_width = bbox[2] - bbox[0]
+        text_height = bbox[3] - bbox[1]
+        title_x = (width - text_width) // 2 - bbox[0]
+        title_y = OG_TITLE_AREA_TOP + (OG_TITLE_MAX_HEIGHT - text_height) // 2 - bbox[1]
+        ImageDraw.Draw(image).multiline_text(
+            (title_x, title_y),
+            "\n".join(lines),
+            fill=OG_TEXT_COLOR,
+            font=self.font(size),
+            spacing=spacing,
+            align="center",
+        )
 
-    # If two words cannot share the final line, omit the orphan rather than
-    # allowing it to sit by itself.
-    if len(truncated) > 1 and len(truncated[-1].split()) == 1:
-        truncated.pop()
-        omitted_text = True
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        image.save(output_path, "PNG", optimize=True)
 
-    if not omitted_text:
-        return truncated
 
-    last_line = truncated[-1].rstrip()
-    ellipsis = "…"
-    while last_line and _og_text_width(draw, last_line + ellipsis, font) > OG_TITLE_MAX_WIDTH:
-        last_line = last_line[:-1].rstrip()
-    truncated[-1] = last_line + ellipsis
-    return truncated
+_OG_RENDERER: OGCardRenderer | None = None
 
 
 def generate_og_image(title: str, output_path: Path) -> None:
     """Generate a simple paper, logo, and article-title social card."""
-    width, height = OG_IMAGE_SIZE
-    paper = Image.open(OG_PAPER_PATH).convert("RGB")
-    image = Image.new("RGB", OG_IMAGE_SIZE, "#faf9f6")
-    for y in range(0, height, paper.height):
-        for x in range(0, width, paper.width):
-            image.paste(paper, (x, y))
-
-    logo = Image.open(OG_LOGO_PATH).convert("RGBA")
-    logo.thumbnail((180, 137), Image.Resampling.LANCZOS)
-    image.paste(logo, ((width - logo.width) // 2, 48), logo)
-
-    draw = ImageDraw.Draw(image)
-    title_lines: list[str] = []
-    title_font = None
-    title_spacing = 0
-    title_bbox = (0, 0, 0, 0)
-    for font_size in range(80, 41, -2):
-        candidate_font = ImageFont.truetype(str(OG_TITLE_FONT_PATH), font_size)
-        candidate_lines = _avoid_og_orphan(
-            draw,
-            _wrap_og_title(draw, title, candidate_font),
-            candidate_font,
-        )
-        candidate_spacing = round(font_size * 0.18)
-        candidate_text = "\n".join(candidate_lines)
-        candidate_bbox = draw.multiline_textbbox(
-            (0, 0),
-            candidate_text,
-            font=candidate_font,
-            spacing=candidate_spacing,
-            align="center",
-        )
-        candidate_height = candidate_bbox[3] - candidate_bbox[1]
-        has_orphan = len(candidate_lines) > 1 and len(candidate_lines[-1].split()) == 1
-        if (
-            len(candidate_lines) <= OG_TITLE_MAX_LINES
-            and candidate_height <= OG_TITLE_MAX_HEIGHT
-            and not has_orphan
-        ):
-            title_lines = candidate_lines
-            title_font = candidate_font
-            title_spacing = candidate_spacing
-            title_bbox = candidate_bbox
-            break
+    global _OG_RENDERER
+    if _OG_RENDERER is None:
+        _OG_RENDERER = OGCardRenderer()
+    _OG_RENDERER.render(title, output_path)
+
+
+def og_inputs_digest(file_hash: Callable[[Path], str]) -> str:
+    """Hash everything besides the title that shapes an OG card."""
+    return content_digest(
+        file_hash(OG_TITLE_FONT_PATH),
+        file_hash(OG_PAPER_PATH),
+        file_hash(OG_LOGO_PATH),
+        repr(
+            (
+                OG_RENDER_VERSION,
+                OG_IMAGE_SIZE,
+                OG_TITLE_MAX_WIDTH,
+                OG_TITLE_MAX_HEIGHT,
+                OG_TITLE_MAX_LINES,
+                OG_TEXT_COLOR,
+                OG_FONT_SIZES,
+                OG_FALLBACK_FONT_SIZE,
+                OG_FALLBACK_SPACING,
+                OG_TITLE_AREA_TOP,
+            )
+        ),
+    )
 
-    if title_font is None:
-        title_font = ImageFont.truetype(str(OG_TITLE_FONT_PATH), 40)
-        title_lines = _truncate_og_lines(
-            draw,
-            _wrap_og_title(draw, title, title_font),
-            title_font,
-        )
-        title_spacing = 7
-        title_bbox = draw.multiline_textbbox(
-            (0, 0),
-            "\n".join(title_lines),
-            font=title_font,
-            spacing=title_spacing,
-            align="center",
-        )
 
-    title_text = "\n".join(title_lines)
-    text_width = title_bbox[2] - title_bbox[0]
-    text_height = title_bbox[3] - title_bbox[1]
-    title_area_top = 240
-    title_x = (width - text_width) // 2 - title_bbox[0]
-    title_y = title_area_top + (OG_TITLE_MAX_HEIGHT - text_height) // 2 - title_bbox[1]
-    draw.multiline_text(
-        (title_x, title_y),
-        title_text,
-        fill=OG_TEXT_COLOR,
-        font=title_font,
-        spacing=title_spacing,
-        align="center",
-    )
+def link_or_copy(source: Path, target: Path) -> None:
+    target.parent.mkdir(parents=True, exist_ok=True)
+    if target.exists():
+        target.unlink()
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copy2(source, target)
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    image.save(output_path, "PNG", optimize=True)
+
+def generate_og_image_cached(title: str, output_path: Path, inputs_hash: str) -> bool:
+    """Place the OG card for title at output_path, rendering it only once.
+
+    Cards are stored in a content-addressed cache keyed by the title and
+    og_inputs_digest(). Returns whether the card came from the cache.
+    """
+    cached_path = OG_CACHE_DIR / f"{content_digest(title, inputs_hash)}.png"
+    hit = cached_path.exists()
+    if not hit:
+        partial_path = cached_path.with_name(f"{cached_path.stem}.{os.getpid()}.tmp")
+        generate_og_image(title, partial_path)
+        partial_path.replace(cached_path)
+    link_or_copy(cached_path, output_path)
+    return hit
 
 
 def iter_markdown_files() -> list[Path]:
@@ -344,40 +790,302 @@ def iter_markdown_files() -> list[Path]:
     return markdown_files
 
 
-def collect_update_entries() -> list[dict[str, Any]]:
-    """Collect update files with metadata and rendered content."""
-    updates_dir = ROOT / "posts"
-    updates = []
-    if not updates_dir.exists():
-        return updates
-    for md_path in updates_dir.glob("*.md"):
-        if md_path.name in UPDATE_IGNORED_FILES:
-            continue
-        raw = md_path.read_text()
-        frontmatter, body = parse_frontmatter(raw)
-        slug = slug_for_path(md_path)
-        base_name = md_path.stem  # e.g., "memorandum"
-        date_str = frontmatter.get("date", "")
-        parsed_date = parse_post_date(date_str)
-        date_prefix = parsed_date.strftime("%Y%m%d-") if parsed_date else ""
-        updates.append({
-            "name": date_prefix + base_name,
-            "slug": slug,
-            "title": frontmatter.get("title", base_name),
-            "date": date_str,
-            "date_day": parsed_date.strftime("%a, %d %b %Y") if parsed_date else date_str,
-            "date_iso": parsed_date.date().isoformat() if parsed_date else "",
-            "parsed_date": parsed_date,
-            "subject": frontmatter.get("subject", ""),
-            "i18n_key": frontmatter.get("i18n_key", ""),
-            "content": render_markdown(body),
-        })
-    # Sort by date, newest first
-    updates.sort(
-        key=lambda u: u["parsed_date"] or datetime.min.replace(tzinfo=timezone.utc),
-        reverse=True,
-    )
-    return updates
+def read_frontmatter(path: Path) -> dict[str, Any]:
+    """Parse the frontmatter of a markdown file without reading its body."""
+    with path.open() as f:
+        head = f.readline()
+        if head.startswith("---"):
+            for line in f:
+                head += line
+                if line.startswith("---"):
+                    break
+    frontmatter, _ = parse_frontmatter(head)
+    return frontmatter
+
+
+def read_markdown_body(path: Path) -> str:
+    return parse_frontmatter(path.read_text())[1]
+
+
+class DocumentStore:
+    """Markdown sources of one build, each parsed and rendered at most once.
+
+    The posts listing, page rendering and feeds all read their documents
+    through the same store, so a post that appears in all three is only
+    converted to HTML once. Documents only hold frontmatter; bodies are read
+    when they are rendered. Without ``keep_html`` (a streaming build) the
+    rendered HTML is not kept either, so memory does not grow with the
+    archive, at the cost of rendering some documents twice.
+    """
+
+    def __init__(self, markdown_backend: str = DEFAULT_MARKDOWN_BACKEND, keep_html: bool = True):
+        self.markdown_backend = markdown_backend
+        self.keep_html = keep_html
+        self._documents: dict[Path, dict[str, Any]] = {}
+
+    def get(self, path: Path) -> dict[str, Any]:
+        document = self._documents.get(path)
+        if document is None:
+            document = self._documents[path] = {
+                "path": path,
+                "frontmatter": read_frontmatter(path),
+                "html": None,
+            }
+        return document
+
+    def html(self, path: Path) -> str:
+        document = self.get(path)
+        if document["html"] is not None:
+            return document["html"]
+        html = render_markdown(read_markdown_body(path), self.markdown_backend)
+        if self.keep_html:
+            document["html"] = html
+        return html
+
+    def prime(self, path: Path, frontmatter: dict[str, Any]) -> None:
+        """Use frontmatter parsed elsewhere (see PostIndex) instead of reading it."""
+        if path not in self._documents:
+            self._documents[path] = {"path": path, "frontmatter": frontmatter, "html": None}
+
+    def set_html(self, path: Path, html: str) -> None:
+        """Keep HTML that was rendered elsewhere, e.g. in a worker process."""
+        if self.keep_html:
+            self.get(path)["html"] = html
+
+
+def _update_entry(md_path: Path, frontmatter: dict[str, Any]) -> dict[str, Any]:
+    base_name = md_path.stem  # e.g., "memorandum"
+    date_str = frontmatter.get("date", "")
+    parsed_date = parse_post_date(date_str)
+    date_prefix = parsed_date.strftime("%Y%m%d-") if parsed_date else ""
+    return {
+        "name": date_prefix + base_name,
+        "slug": slug_for_path(md_path),
+        "title": frontmatter.get("title", base_name),
+        "date": date_str,
+        "date_day": parsed_date.strftime("%a, %d %b %Y") if parsed_date else date_str,
+        "date_iso": parsed_date.date().isoformat() if parsed_date else "",
+        "parsed_date": parsed_date,
+        "subject": frontmatter.get("subject", ""),
+        "i18n_key": frontmatter.get("i18n_key", ""),
+    }
+
+
+def _post_tags(frontmatter: dict[str, Any]) -> list[str]:
+    tags = frontmatter.get("tags") or []
+    if isinstance(tags, str):
+        tags = tags.split(",")
+    return sorted({str(tag).strip() for tag in tags if str(tag).strip()})
+
+
+def _json_roundtrip(value: Any) -> str | None:
+    """Encode value as JSON if it decodes back to an equal value, else None."""
+    try:
+        encoded = json.dumps(value, ensure_ascii=False, sort_keys=True)
+    except (TypeError, ValueError):
+        return None
+    return encoded if json.loads(encoded) == value else None
+
+
+class PostIndex:
+    """Post metadata kept across builds in SQLite, updated incrementally.
+
+    Each post in posts/ has a row with its source stat and hash, its
+    frontmatter, the listing entry derived from it (see
+    collect_update_entries) and the hash of its rendered markdown. sync()
+    only reads and parses the posts whose stat changed, so listings and feed
+    windows come out of posts() without touching unchanged sources.
+    Frontmatter that does not survive a JSON round trip is not stored, and
+    such posts are parsed on every sync.
+    """
+
+    SCHEMA_VERSION = 2
+
+    def __init__(self, path: Path | None):
+        self.path = path
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            self.db = self._open()
+        except sqlite3.DatabaseError:
+            if path is None:
+                raise
+            # A damaged index is only a cache; start over.
+            path.unlink(missing_ok=True)
+            self.db = self._open()
+
+    def _open(self) -> sqlite3.Connection:
+        db = sqlite3.connect(self.path if self.path is not None else ":memory:")
+        if db.execute("PRAGMA user_version").fetchone()[0] != self.SCHEMA_VERSION:
+            db.executescript(
+                f"""
+                DROP TABLE IF EXISTS post_tags;
+                DROP TABLE IF EXISTS posts;
+                CREATE TABLE posts (
+                    source TEXT PRIMARY KEY,
+                    mtime_ns INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    source_hash TEXT NOT NULL,
+                    content_hash TEXT,
+                    sort_date TEXT NOT NULL,
+                    year INTEGER,
+                    frontmatter TEXT,
+                    entry TEXT
+                );
+                CREATE INDEX posts_by_date ON posts (sort_date DESC, source);
+                CREATE INDEX posts_by_year ON posts (year, sort_date DESC);
+                CREATE TABLE post_tags (
+                    source TEXT NOT NULL REFERENCES posts (source) ON DELETE CASCADE,
+                    tag TEXT NOT NULL,
+                    PRIMARY KEY (tag, source)
+                );
+                PRAGMA user_version = {self.SCHEMA_VERSION};
+                """
+            )
+        db.execute("PRAGMA foreign_keys = ON")
+        return db
+
+    def close(self) -> None:
+        self.db.commit()
+        self.db.close()
+
+    def __enter__(self) -> PostIndex:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def sync(self, posts_dir: Path, store: DocumentStore) -> int:
+        """Bring the index in line with posts_dir, returning the posts reparsed.
+
+        Stored frontmatter is handed to ``store`` so that unchanged posts are
+        not read again for the pages that use it either.
+        """
+        known = {
+            source: (mtime_ns, size, source_hash, frontmatter)
+            for source, mtime_ns, size, source_hash, frontmatter in self.db.execute(
+                "SELECT source, mtime_ns, size, source_hash, frontmatter FROM posts"
+            )
+        }
+        seen: set[str] = set()
+        reparsed = 0
+        md_paths = sorted(posts_dir.glob("*.md")) if posts_dir.exists() else []
+        for md_path in md_paths:
+            if md_path.name in UPDATE_IGNORED_FILES:
+                continue
+            source = md_path.relative_to(ROOT).as_posix()
+            seen.add(source)
+            stat = md_path.stat()
+            previous = known.get(source)
+            if previous and previous[3] is not None and previous[:2] == (stat.st_mtime_ns, stat.st_size):
+                store.prime(md_path, json.loads(previous[3]))
+                continue
+            source_hash = hashlib.sha256(md_path.read_bytes()).hexdigest()
+            if previous and previous[3] is not None and previous[2] == source_hash:
+                # Touched but unchanged.
+                self.db.execute(
+                    "UPDATE posts SET mtime_ns = ?, size = ? WHERE source = ?",
+                    (stat.st_mtime_ns, stat.st_size, source),
+                )
+                store.prime(md_path, json.loads(previous[3]))
+                continue
+            self._store(md_path, source, stat, source_hash, store.get(md_path)["frontmatter"])
+            reparsed += 1
+        for source in known.keys() - seen:
+            self.db.execute("DELETE FROM posts WHERE source = ?", (source,))
+        self.db.commit()
+        return reparsed
+
+    def _store(
+        self, md_path: Path, source: str, stat: os.stat_result, source_hash: str, frontmatter: dict[str, Any]
+    ) -> None:
+        entry = _update_entry(md_path, frontmatter)
+        parsed_date = entry["parsed_date"]
+        # Sort order and archive year both follow UTC, so a post dated near
+        # midnight on New Year's files under the year it sorts into.
+        utc_date = parsed_date.astimezone(timezone.utc) if parsed_date else None
+        self.db.execute("DELETE FROM posts WHERE source = ?", (source,))
+        self.db.execute(
+            "INSERT INTO posts VALUES (?, ?, ?, ?, NULL, ?, ?, ?, ?)",
+            (
+                source,
+                stat.st_mtime_ns,
+                stat.st_size,
+                source_hash,
+                utc_date.isoformat() if utc_date else "",
+                utc_date.year if utc_date else None,
+                _json_roundtrip(frontmatter),
+                _json_roundtrip({**entry, "parsed_date": parsed_date.isoformat() if parsed_date else None}),
+            ),
+        )
+        self.db.executemany(
+            "INSERT INTO post_tags VALUES (?, ?)", [(source, tag) for tag in _post_tags(frontmatter)]
+        )
+
+    def posts(self, limit: int | None = None, year: int | None = None, tag: str | None = None) -> list[dict[str, Any]]:
+        """Listing entries, newest first, optionally for one year or tag."""
+        query = "SELECT posts.source, entry FROM posts"
+        conditions: list[str] = []
+        parameters: list[Any] = []
+        if tag is not None:
+            query += " JOIN post_tags ON post_tags.source = posts.source"
+            conditions.append("post_tags.tag = ?")
+            parameters.append(tag)
+        if year is not None:
+            conditions.append("year = ?")
+            parameters.append(year)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY sort_date DESC, posts.source"
+        if limit is not None:
+            query += " LIMIT ?"
+            parameters.append(limit)
+        entries = []
+        for source, entry in self.db.execute(query, parameters):
+            md_path = ROOT / source
+            if entry is None:
+                entry = _update_entry(md_path, read_frontmatter(md_path))
+            else:
+                entry = json.loads(entry)
+                entry["parsed_date"] = entry["parsed_date"] and datetime.fromisoformat(entry["parsed_date"])
+            entry["source"] = md_path
+            entries.append(entry)
+        return entries
+
+    def content_hashes(self, md_paths: Iterable[Path]) -> dict[Path, str | None]:
+        sources = {md_path.relative_to(ROOT).as_posix(): md_path for md_path in md_paths}
+        hashes: dict[Path, str | None] = dict.fromkeys(sources.values())
+        for source, content_hash in self.db.execute(
+            f"SELECT source, content_hash FROM posts WHERE source IN ({', '.join('?' * len(sources))})",
+            list(sources),
+        ):
+            hashes[sources[source]] = content_hash
+        return hashes
+
+    def record_content_hash(self, md_path: Path, content_hash: str) -> None:
+        """Remember the hash of a post's rendered markdown."""
+        self.db.execute(
+            "UPDATE posts SET content_hash = ? WHERE source = ?",
+            (content_hash, md_path.relative_to(ROOT).as_posix()),
+        )
+
+
+def collect_update_entries(
+    store: DocumentStore | None = None, index: PostIndex | None = None
+) -> list[dict[str, Any]]:
+    """Collect update files with their metadata, newest first.
+
+    Rendered content is not part of the entries; read it from the store via
+    the entry's ``source`` path when needed. The entries come from ``index``,
+    by default the one at POST_INDEX_PATH, after syncing it with posts/.
+    """
+    if store is None:
+        store = DocumentStore()
+    if index is None:
+        with PostIndex(POST_INDEX_PATH) as index:
+            return collect_update_entries(store, index)
+    index.sync(ROOT / "posts", store)
+    return index.posts()
 
 
 def _format_rss_date(dt: datetime) -> str:
@@ -405,7 +1113,31 @@ def _serialize_xml(root: ElementTree.Element) -> str:
     return ElementTree.tostring(root, encoding="unicode", xml_declaration=True)
 
 
-def _generate_atom_feed(title: str, feed_url: str, subtitle: str, updates):
+def _write_xml(
+    out: TextIO,
+    root: ElementTree.Element,
+    parent: ElementTree.Element,
+    items: Iterable[ElementTree.Element],
+    level: int,
+) -> None:
+    """Write root like _serialize_xml, streaming items into parent.
+
+    Items are serialised one at a time as they come, indented for ``level``
+    (the depth of parent plus one), so only one is ever in memory. They must
+    use the same default namespace as root, and not declare their own.
+    """
+    parent.append(ElementTree.Comment("items"))
+    head, tail = _serialize_xml(root).split("<!--items-->")
+    separator = "\n" + "  " * level
+    out.write(head.removesuffix(separator))
+    for item in items:
+        ElementTree.indent(item, space="  ", level=level)
+        out.write(separator)
+        out.write(ElementTree.tostring(item, encoding="unicode"))
+    out.write(tail)
+
+
+def _write_atom_feed(out: TextIO, title: str, feed_url: str, subtitle: str, updates: Iterable[dict[str, Any]]) -> None:
     atom_namespace = "http://www.w3.org/2005/Atom"
     xml_namespace = "http://www.w3.org/XML/1998/namespace"
     ElementTree.register_namespace("", atom_namespace)
@@ -432,26 +1164,29 @@ def _generate_atom_feed(title: str, feed_url: str, subtitle: str, updates):
     author = ElementTree.SubElement(feed, atom_element("author"))
     ElementTree.SubElement(author, atom_element("name")).text = "Earendil"
 
-    for update in updates:
-        if not update["parsed_date"]:
-            continue
-        entry_date = update["parsed_date"].astimezone(timezone.utc).isoformat()
-        update_url = SITE_URL.rstrip("/") + update["slug"]
-        entry = ElementTree.SubElement(feed, atom_element("entry"))
-        ElementTree.SubElement(entry, atom_element("id")).text = update_url
-        ElementTree.SubElement(entry, atom_element("title")).text = update["title"]
-        ElementTree.SubElement(entry, atom_element("link"), {"href": update_url})
-        ElementTree.SubElement(entry, atom_element("published")).text = entry_date
-        ElementTree.SubElement(entry, atom_element("updated")).text = entry_date
-        author = ElementTree.SubElement(entry, atom_element("author"))
-        ElementTree.SubElement(author, atom_element("name")).text = "Earendil"
-        content = ElementTree.SubElement(entry, atom_element("content"), {"type": "html"})
-        content.text = _absolutize_html_urls(update["content"], update_url)
-
-    return _serialize_xml(feed)
-
-
-def _generate_rss_feed(title: str, feed_url: str, subtitle: str, updates):
+    def entries() -> Iterator[ElementTree.Element]:
+        # Entries are written inside <feed>, so they use its default namespace.
+        for update in updates:
+            if not update["parsed_date"]:
+                continue
+            entry_date = update["parsed_date"].astimezone(timezone.utc).isoformat()
+            update_url = SITE_URL.rstrip("/") + update["slug"]
+            entry = ElementTree.Element("entry")
+            ElementTree.SubElement(entry, "id").text = update_url
+            ElementTree.SubElement(entry, "title").text = update["title"]
+            ElementTree.SubElement(entry, "link", {"href": update_url})
+            ElementTree.SubElement(entry, "published").text = entry_date
+            ElementTree.SubElement(entry, "updated").text = entry_date
+            author = ElementTree.SubElement(entry, "author")
+            ElementTree.SubElement(author, "name").text = "Earendil"
+            content = ElementTree.SubElement(entry, "content", {"type": "html"})
+            content.text = _absolutize_html_urls(update["content"], update_url)
+            yield entry
+
+    _write_xml(out, feed, feed, entries(), 1)
+
+
+def _write_rss_feed(out: TextIO, title: str, feed_url: str, subtitle: str, updates: Iterable[dict[str, Any]]) -> None:
     atom_namespace = "http://www.w3.org/2005/Atom"
     ElementTree.register_namespace("atom", atom_namespace)
 
@@ -468,177 +1203,2428 @@ def _generate_rss_feed(title: str, feed_url: str, subtitle: str, updates):
     ElementTree.SubElement(channel, "language").text = "en"
     ElementTree.SubElement(channel, "lastBuildDate").text = _format_rss_date(datetime.now(timezone.utc))
 
-    for update in updates:
-        if not update["parsed_date"]:
-            continue
-        update_url = SITE_URL.rstrip("/") + update["slug"]
-        item = ElementTree.SubElement(channel, "item")
-        ElementTree.SubElement(item, "title").text = update["title"]
-        ElementTree.SubElement(item, "link").text = update_url
-        ElementTree.SubElement(item, "guid", {"isPermaLink": "true"}).text = update_url
-        ElementTree.SubElement(item, "pubDate").text = _format_rss_date(update["parsed_date"])
-        description = ElementTree.SubElement(item, "description")
-        description.text = _absolutize_html_urls(update["content"], update_url)
+    def items() -> Iterator[ElementTree.Element]:
+        for update in updates:
+            if not update["parsed_date"]:
+                continue
+            update_url = SITE_URL.rstrip("/") + update["slug"]
+            item = ElementTree.Element("item")
+            ElementTree.SubElement(item, "title").text = update["title"]
+            ElementTree.SubElement(item, "link").text = update_url
+            ElementTree.SubElement(item, "guid", {"isPermaLink": "true"}).text = update_url
+            ElementTree.SubElement(item, "pubDate").text = _format_rss_date(update["parsed_date"])
+            description = ElementTree.SubElement(item, "description")
+            description.text = _absolutize_html_urls(update["content"], update_url)
+            yield item
+
+    _write_xml(out, rss, channel, items(), 2)
 
-    return _serialize_xml(rss)
 
+def _generate_atom_feed(title: str, feed_url: str, subtitle: str, updates) -> str:
+    out = io.StringIO()
+    _write_atom_feed(out, title, feed_url, subtitle, updates)
+    return out.getvalue()
 
-def build_update_feeds(updates, build_dir: Path) -> None:
+
+def _generate_rss_feed(title: str, feed_url: str, subtitle: str, updates) -> str:
+    out = io.StringIO()
+    _write_rss_feed(out, title, feed_url, subtitle, updates)
+    return out.getvalue()
+
+
+def build_update_feeds(updates, build_dir: Path, store: DocumentStore | None = None) -> None:
+    """Write the Atom and RSS feeds of the most recent updates.
+
+    Feed entries are rendered and written one at a time, straight into the
+    feed files.
+    """
     if not updates:
         return
-    recent_updates = updates[:UPDATES_FEED_LIMIT]
+    if store is None:
+        store = DocumentStore()
+
+    def recent_updates() -> Iterator[dict[str, Any]]:
+        for update in updates[:UPDATES_FEED_LIMIT]:
+            yield {**update, "content": store.html(update["source"])}
+
     posts_dir = build_dir / "posts"
     posts_dir.mkdir(parents=True, exist_ok=True)
 
     atom_feed_url = SITE_URL.rstrip("/") + "/posts/feed.atom"
     rss_feed_url = SITE_URL.rstrip("/") + "/posts/feed.rss"
 
-    atom_xml = _generate_atom_feed(
-        title="Earendil Posts",
-        feed_url=atom_feed_url,
-        subtitle="Posts from Earendil",
-        updates=recent_updates,
+    with (posts_dir / "feed.atom").open("w", encoding="utf-8") as out:
+        _write_atom_feed(
+            out,
+            title="Earendil Posts",
+            feed_url=atom_feed_url,
+            subtitle="Posts from Earendil",
+            updates=recent_updates(),
+        )
+
+    with (posts_dir / "feed.rss").open("w", encoding="utf-8") as out:
+        _write_rss_feed(
+            out,
+            title="Earendil Posts",
+            feed_url=rss_feed_url,
+            subtitle="Posts from Earendil",
+            updates=recent_updates(),
+        )
+
+
+
+def content_digest(*parts: bytes | str) -> str:
+    """Hash a sequence of values without ambiguity between their boundaries."""
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, str):
+            part = part.encode("utf-8")
+        digest.update(len(part).to_bytes(8, "big"))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+class BuildManifest:
+    """Input hashes of the previous build and the outputs each one produced.
+
+    Every unit of work (a page, a static file, the feeds, ...) is recorded under
+    a key together with the hash of everything it was built from. An entry is
+    fresh when its hash is unchanged and all of its outputs still exist, so the
+    next build can skip it. Outputs that no entry produced this time are
+    removed when the build finishes.
+
+    When the caller knows exactly which source files changed (the dev server's
+    file watcher does), passing them as ``changed_paths`` lets every other
+    file reuse its previous hash without even a stat call.
+    """
+
+    def __init__(
+        self,
+        path: Path | None,
+        build_dir: Path,
+        global_key: str,
+        changed_paths: set[Path] | None = None,
+    ):
+        self.path = path
+        self.build_dir = build_dir
+        self.global_key = global_key
+        self.changed_paths = changed_paths
+        self.previous: dict[str, dict[str, Any]] = {}
+        self.entries: dict[str, dict[str, Any]] = {}
+        self.recorded: set[str] = set()
+        self.removed_outputs: list[str] = []
+        self.previous_files: dict[str, list[Any]] = {}
+        self.files: dict[str, list[Any]] = {}
+
+    def load(self) -> bool:
+        """Load the previous manifest if it describes the current build setup."""
+        if self.path is None or not self.path.exists() or not self.build_dir.exists():
+            return False
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return False
+        if data.get("version") != MANIFEST_VERSION or data.get("global") != self.global_key:
+            return False
+        self.previous = data.get("entries", {})
+        self.previous_files = data.get("files", {})
+        return True
+
+    def file_hash(self, path: Path) -> str:
+        """Hash a file, reusing the previous hash while its stat is unchanged."""
+        key = path.relative_to(ROOT).as_posix()
+        if key in self.files:
+            return self.files[key][2]
+        previous = self.previous_files.get(key)
+        if previous and self.changed_paths is not None and path not in self.changed_paths:
+            self.files[key] = previous
+            return previous[2]
+        stat = path.stat()
+        if previous and previous[0] == stat.st_mtime_ns and previous[1] == stat.st_size:
+            file_hash = previous[2]
+        else:
+            file_hash = hashlib.sha256(path.read_bytes()).hexdigest()
+        self.files[key] = [stat.st_mtime_ns, stat.st_size, file_hash]
+        return file_hash
+
+    def is_fresh(self, key: str, input_hash: str) -> bool:
+        """Keep the previous entry if its inputs and outputs are unchanged."""
+        previous = self.previous.get(key)
+        if not previous or previous["hash"] != input_hash:
+            return False
+        if not all((self.build_dir / output).exists() for output in previous["outputs"]):
+            return False
+        self.entries[key] = previous
+        return True
+
+    def record(self, key: str, input_hash: str, outputs: list[Path]) -> None:
+        self.entries[key] = {
+            "hash": input_hash,
+            "outputs": [output.relative_to(self.build_dir).as_posix() for output in outputs],
+        }
+        self.recorded.add(key)
+
+    def changed_outputs(self) -> list[str]:
+        """Outputs written or removed by this build, relative to build_dir."""
+        written = {
+            output
+            for key in self.recorded
+            for output in self.entries[key]["outputs"]
+        }
+        return sorted(written.union(self.removed_outputs))
+
+    def finish(self) -> int:
+        """Delete outputs of vanished entries and persist the manifest."""
+        current_outputs = {output for entry in self.entries.values() for output in entry["outputs"]}
+        removed = 0
+        for entry in self.previous.values():
+            for output in entry["outputs"]:
+                if output in current_outputs:
+                    continue
+                output_path = self.build_dir / output
+                if output_path.is_file():
+                    output_path.unlink()
+                    removed += 1
+                    self.removed_outputs.append(output)
+                    _prune_empty_dirs(output_path.parent, self.build_dir)
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(
+                json.dumps(
+                    {
+                        "version": MANIFEST_VERSION,
+                        "global": self.global_key,
+                        "files": self.files,
+                        "entries": self.entries,
+                    },
+                    sort_keys=True,
+                ),
+                encoding="utf-8",
+            )
+        return removed
+
+
+def _prune_empty_dirs(directory: Path, stop: Path) -> None:
+    while directory != stop and directory.is_dir() and not any(directory.iterdir()):
+        directory.rmdir()
+        directory = directory.parent
+
+
+def copy_tree_incremental(
+    source_dir: Path,
+    target_dir: Path,
+    manifest: BuildManifest,
+    key_prefix: str,
+    exclude: set[str] | None = None,
+) -> tuple[int, int]:
+    """Copy changed files from source_dir to target_dir, returning (copied, unchanged).
+
+    Files whose path relative to source_dir is in ``exclude`` are skipped.
+    """
+    copied = 0
+    unchanged = 0
+    for path in sorted(source_dir.rglob("*")):
+        if not path.is_file():
+            continue
+        rel = path.relative_to(source_dir)
+        if exclude and rel.as_posix() in exclude:
+            continue
+        key = f"{key_prefix}:{rel.as_posix()}"
+        input_hash = manifest.file_hash(path)
+        target = target_dir / rel
+        if manifest.is_fresh(key, input_hash):
+            unchanged += 1
+            continue
+        target.parent.mkdir(parents=True, exist_ok=True)
+        # Fingerprinted copies may share the target's inode, so never write
+        # through it.
+        if target.exists():
+            target.unlink()
+        shutil.copy2(path, target)
+        manifest.record(key, input_hash, [target])
+        copied += 1
+    return copied, unchanged
+
+
+def _split_url_suffix(url: str) -> tuple[str, str]:
+    """Split a URL into its path and any ?query or #fragment suffix."""
+    match = re.search(r"[?#]", url)
+    if not match:
+        return url, ""
+    return url[: match.start()], url[match.start() :]
+
+
+def _fingerprinted_name(rel: str, file_hash: str) -> str:
+    directory, name = posixpath.split(rel)
+    stem, dot, suffix = name.rpartition(".")
+    if not dot or not stem:
+        stem, suffix = name, ""
+    hashed = f"{stem}.{file_hash[:ASSET_HASH_LENGTH]}" + (f".{suffix}" if suffix else "")
+    return posixpath.join(directory, hashed)
+
+
+def rewrite_css_urls(css: str, css_url: str, assets: dict[str, str]) -> str:
+    """Point url() references in a stylesheet at fingerprinted assets.
+
+    Relative references stay relative; fingerprinted files always live next
+    to their originals.
+    """
+    base = posixpath.dirname(css_url)
+
+    def replace_url(match: re.Match[str]) -> str:
+        url, suffix = _split_url_suffix(match.group("url").strip())
+        if not url or url.startswith(("data:", "http://", "https://", "//")):
+            return match.group(0)
+        resolved = url if url.startswith("/") else posixpath.normpath(posixpath.join(base, url))
+        hashed = assets.get(resolved)
+        if hashed is None:
+            return match.group(0)
+        if not url.startswith("/"):
+            hashed = posixpath.join(posixpath.dirname(url), posixpath.basename(hashed))
+        quote = match.group("quote")
+        return f"url({quote}{hashed}{suffix}{quote})"
+
+    return CSS_URL_RE.sub(replace_url, css)
+
+
+def rewrite_asset_urls(html: str, assets: dict[str, str]) -> str:
+    """Point href, src and content attributes at fingerprinted assets."""
+    if not assets:
+        return html
+    site_prefix = SITE_URL.rstrip("/")
+
+    def replace_url(match: re.Match[str]) -> str:
+        url, suffix = _split_url_suffix(match.group("url"))
+        origin = ""
+        if url.startswith(site_prefix + STATIC_URL_PREFIX):
+            origin, url = site_prefix, url[len(site_prefix) :]
+        hashed = assets.get(url)
+        if hashed is None:
+            return match.group(0)
+        quote = match.group("quote")
+        return f"{match.group('prefix')}{quote}{origin}{hashed}{suffix}{quote}"
+
+    return HTML_URL_ATTR_RE.sub(replace_url, html)
+
+
+def fingerprint_static_assets(
+    build_dir: Path,
+    manifest: BuildManifest,
+    stylesheets: dict[str, str] | None = None,
+    exclude: set[str] | None = None,
+) -> dict[str, str]:
+    """Add content-hashed copies of every static file next to the original.
+
+    Stylesheets are fingerprinted after their url() references have been
+    rewritten (including @imported stylesheets), so a changed font or image
+    also changes the name of every stylesheet that uses it. Originals stay in
+    place for references this stage cannot see, such as URLs built in
+    JavaScript. ``stylesheets`` replaces the source of stylesheets that an
+    earlier stage rewrote, by path relative to the static directory, and
+    files in ``exclude`` were not copied and get no fingerprinted copy.
+    Returns the mapping from original to fingerprinted URL, which is also
+    written to static/assets.json.
+    """
+    static_dir = build_dir / "static"
+    sources = {
+        path.relative_to(STATIC_DIR).as_posix(): path
+        for path in sorted(STATIC_DIR.rglob("*"))
+        if path.is_file() and path.relative_to(STATIC_DIR).as_posix() not in (exclude or ())
+    }
+    assets: dict[str, str] = {}
+    in_progress: set[str] = set()
+
+    def fingerprint(rel: str) -> str:
+        url = STATIC_URL_PREFIX + rel
+        if url in assets or rel in in_progress:
+            return assets.get(url, url)
+        in_progress.add(rel)
+        source = sources[rel]
+        if source.suffix == ".css":
+            css = (stylesheets or {}).get(rel) or source.read_text(encoding="utf-8")
+            base = posixpath.dirname(url)
+            for match in CSS_URL_RE.finditer(css):
+                ref, _ = _split_url_suffix(match.group("url").strip())
+                resolved = ref if ref.startswith("/") else posixpath.normpath(posixpath.join(base, ref))
+                if resolved.startswith(STATIC_URL_PREFIX) and resolved[len(STATIC_URL_PREFIX) :] in sources:
+                    fingerprint(resolved[len(STATIC_URL_PREFIX) :])
+            css = rewrite_css_urls(css, url, assets)
+            content_hash = content_digest(css)
+            target = static_dir / _fingerprinted_name(rel, content_hash)
+            if not manifest.is_fresh(f"asset:{rel}", content_hash):
+                target.parent.mkdir(parents=True, exist_ok=True)
+                target.write_text(css, encoding="utf-8")
+                manifest.record(f"asset:{rel}", content_hash, [target])
+        else:
+            content_hash = manifest.file_hash(source)
+            target = static_dir / _fingerprinted_name(rel, content_hash)
+            if not manifest.is_fresh(f"asset:{rel}", content_hash):
+                link_or_copy(static_dir / rel, target)
+                manifest.record(f"asset:{rel}", content_hash, [target])
+        assets[url] = STATIC_URL_PREFIX + target.relative_to(static_dir).as_posix()
+        in_progress.discard(rel)
+        return assets[url]
+
+    for rel in sources:
+        fingerprint(rel)
+
+    asset_manifest = static_dir / ASSET_MANIFEST_NAME
+    assets_json = json.dumps(assets, indent=2, sort_keys=True) + "\n"
+    if not manifest.is_fresh("asset-manifest", content_digest(assets_json)):
+        asset_manifest.write_text(assets_json, encoding="utf-8")
+        manifest.record("asset-manifest", content_digest(assets_json), [asset_manifest])
+    return assets
+
+
+def _responsive_widths(width: int) -> list[int]:
+    return [candidate for candidate in RESPONSIVE_IMAGE_WIDTHS if candidate < width] + [width]
+
+
+def _image_size(path: Path) -> tuple[int, int]:
+    """Read an image's displayed size from its header, honouring EXIF rotation."""
+    with Image.open(path) as image:
+        width, height = image.size
+        # Reading EXIF from a PNG decodes the whole image, and PNG exports
+        # are not rotated anyway.
+        if image.format == "JPEG" and image.getexif().get(ExifTags.Base.Orientation, 1) in (5, 6, 7, 8):
+            return height, width
+        return width, height
+
+
+def _encode_image_variants(source: Path, variants: list[tuple[Path, int, str, dict[str, Any]]]) -> None:
+    """Write the missing variants of one source image into the image cache."""
+    with Image.open(source) as opened:
+        image = ImageOps.exif_transpose(opened)
+        image.load()
+    if image.mode not in ("RGB", "RGBA"):
+        has_alpha = image.mode in ("LA", "PA", "RGBa") or "transparency" in image.info
+        image = image.convert("RGBA" if has_alpha else "RGB")
+    for cached_path, width, image_format, options in variants:
+        height = max(1, round(image.height * width / image.width))
+        resized = image if width == image.width else image.resize((width, height), Image.Resampling.LANCZOS)
+        partial_path = cached_path.with_name(f"{cached_path.stem}.{os.getpid()}.{threading.get_ident()}.tmp")
+        resized.save(partial_path, image_format.upper(), **options)
+        partial_path.replace(cached_path)
+
+
+def build_responsive_images(
+    build_dir: Path, manifest: BuildManifest, jobs: int = 1
+) -> tuple[dict[str, dict[str, Any]], int]:
+    """Generate AVIF and WebP variants of post images at several widths.
+
+    An image and its ``@2x`` export are one group: variants are made from the
+    largest file, while the intrinsic size is the one of the 1x file. Variants
+    are kept in a content-addressed cache keyed by the source hash and the
+    encoder settings, and linked into the build next to the originals as
+    ``name-<width>w.<hash>.<ext>``. Encoding runs in ``jobs`` threads since
+    Pillow releases the GIL while resizing and encoding. Returns the variants of
+    every grouped image URL (see rewrite_responsive_images) and the number of
+    groups whose variants were (re)linked.
+    """
+    image_dir = STATIC_DIR / RESPONSIVE_IMAGE_DIR
+    if not image_dir.exists():
+        return {}, 0
+    groups: dict[Path, list[Path]] = {}
+    for path in sorted(image_dir.rglob("*")):
+        if path.is_file() and path.suffix.lower() in RESPONSIVE_IMAGE_SUFFIXES:
+            stem = path.stem.removesuffix(RESPONSIVE_IMAGE_DENSITY_SUFFIX)
+            groups.setdefault(path.with_name(stem), []).append(path)
+
+    images: dict[str, dict[str, Any]] = {}
+    pending: dict[Path, list[tuple[Path, int, str, dict[str, Any]]]] = {}
+    changed: list[tuple[str, str, list[tuple[Path, Path]]]] = []
+    for base, paths in groups.items():
+        sizes = {path: _image_size(path) for path in paths}
+        source = max(paths, key=lambda path: sizes[path][0])
+        intrinsic = min(paths, key=lambda path: sizes[path][0])
+        source_hash = manifest.file_hash(source)
+        rel = base.relative_to(STATIC_DIR).as_posix()
+        url_dir = posixpath.dirname(STATIC_URL_PREFIX + rel)
+        links: list[tuple[Path, Path]] = []
+        encodes: list[tuple[Path, int, str, dict[str, Any]]] = []
+        srcsets: dict[str, list[str]] = {}
+        for width in _responsive_widths(sizes[source][0]):
+            for image_format, mime_type, options in RESPONSIVE_IMAGE_FORMATS:
+                variant_hash = content_digest(source_hash, repr((width, image_format, sorted(options.items()))))
+                cached_path = IMAGE_CACHE_DIR / f"{variant_hash}.{image_format}"
+                name = f"{base.name}-{width}w.{variant_hash[:ASSET_HASH_LENGTH]}.{image_format}"
+                links.append((cached_path, build_dir / "static" / posixpath.dirname(rel) / name))
+                srcsets.setdefault(mime_type, []).append(f"{url_dir}/{name} {width}w")
+                encodes.append((cached_path, width, image_format, options))
+        group_hash = content_digest(*(cached_path.name for cached_path, _ in links))
+        if not manifest.is_fresh(f"image:{rel}", group_hash):
+            changed.append((rel, group_hash, links))
+            missing = [encode for encode in encodes if not encode[0].exists()]
+            if missing:
+                pending[source] = missing
+        image = {
+            "width": sizes[intrinsic][0],
+            "height": sizes[intrinsic][1],
+            "sources": [[mime_type, ", ".join(srcset)] for mime_type, srcset in srcsets.items()],
+        }
+        for path in paths:
+            images[STATIC_URL_PREFIX + path.relative_to(STATIC_DIR).as_posix()] = image
+
+    if pending:
+        IMAGE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            list(executor.map(_encode_image_variants, pending.keys(), pending.values()))
+    for rel, group_hash, links in changed:
+        for cached_path, target in links:
+            link_or_copy(cached_path, target)
+        manifest.record(f"image:{rel}", group_hash, [target for _, target in links])
+    return images, len(changed)
+
+
+def rewrite_responsive_images(html: str, images: dict[str, dict[str, Any]]) -> str:
+    """Wrap <img> tags with variants in a <picture> with AVIF and WebP sources.
+
+    The <img> stays as the fallback and gets its intrinsic width and height,
+    ``loading="lazy"`` and ``decoding="async"`` unless it sets them itself.
+    Its ``sizes`` (or RESPONSIVE_IMAGE_SIZES) is used for the sources too.
+    Images already inside a <picture> are left alone.
+    """
+    if not images:
+        return html
+
+    def replace_img(match: re.Match[str]) -> str:
+        tag = match.group(0)
+        if html.rfind("<picture", 0, match.start()) > html.rfind("</picture>", 0, match.start()):
+            return tag
+        attrs = {
+            attr.group("name").lower(): unescape(
+                attr.group("double") or attr.group("single") or attr.group("bare") or ""
+            )
+            for attr in HTML_ATTR_RE.finditer(tag, 4, len(tag) - 1)
+        }
+        image = images.get(_split_url_suffix(attrs.get("src", ""))[0])
+        if image is None:
+            return tag
+        sizes = attrs.get("sizes") or RESPONSIVE_IMAGE_SIZES
+        defaults = {
+            "width": str(image["width"]),
+            "height": str(image["height"]),
+            "loading": "lazy",
+            "decoding": "async",
+        }
+        if "srcset" in attrs:
+            defaults["sizes"] = sizes
+        missing = "".join(
+            f' {name}="{escape(value)}"' for name, value in defaults.items() if name not in attrs
+        )
+        sources = "".join(
+            f'<source type="{mime_type}" srcset="{escape(srcset)}" sizes="{escape(sizes)}">'
+            for mime_type, srcset in image["sources"]
+        )
+        img = tag[:-1].rstrip().removesuffix("/").rstrip() + missing + ">"
+        return f"<picture>{sources}{img}</picture>"
+
+    return IMG_TAG_RE.sub(replace_img, html)
+
+
+def _font_slice(codepoint: int) -> str:
+    for name, ranges in FONT_SLICES:
+        if any(start <= codepoint <= end for start, end in ranges):
+            return name
+    return FONT_FALLBACK_SLICE
+
+
+def _unicode_range(codepoints: list[int]) -> str:
+    """Format sorted codepoints as a compact CSS unicode-range."""
+    spans: list[list[int]] = []
+    for codepoint in codepoints:
+        if spans and spans[-1][1] == codepoint - 1:
+            spans[-1][1] = codepoint
+        else:
+            spans.append([codepoint, codepoint])
+    return ", ".join(f"U+{start:X}" if start == end else f"U+{start:X}-{end:X}" for start, end in spans)
+
+
+def collect_used_characters(store: DocumentStore, md_paths: list[Path], manifest: BuildManifest) -> set[str]:
+    """Every character the site can show: pages, templates and translations.
+
+    A page's characters come from its rendered markdown and its frontmatter
+    and are cached by source hash, markdown backend and renderer version, so
+    only changed sources are rendered here (and then not again when the page
+    itself is rendered).
+    """
+    characters: set[str] = set()
+    renderer = repr((store.markdown_backend, MARKDOWN_RENDER_VERSION, CODE_BLOCK_MARKUP_VERSION))
+    for md_path in md_paths:
+        cached_path = GLYPH_CACHE_DIR / f"{content_digest(manifest.file_hash(md_path), renderer)}.txt"
+        if cached_path.exists():
+            characters.update(cached_path.read_text(encoding="utf-8"))
+            continue
+        frontmatter = store.get(md_path)["frontmatter"]
+        text = unescape(store.html(md_path)) + json.dumps(frontmatter, ensure_ascii=False, default=str)
+        used = "".join(sorted(set(text)))
+        cached_path.parent.mkdir(parents=True, exist_ok=True)
+        cached_path.write_text(used, encoding="utf-8")
+        characters.update(used)
+    for path in sorted(TEMPLATES_DIR.rglob("*.html")):
+        characters.update(unescape(path.read_text(encoding="utf-8")))
+    for messages in _LOCALE_MESSAGES.values():
+        for message in messages.values():
+            characters.update(unescape(message))
+    return characters
+
+
+def _font_codepoints(font_path: Path, font_hash: str) -> list[int]:
+    """The characters a font has glyphs for, cached by font hash."""
+    cached_path = FONT_CACHE_DIR / f"{font_hash}.json"
+    if cached_path.exists():
+        return json.loads(cached_path.read_text(encoding="utf-8"))
+    codepoints = sorted(TTFont(font_path, lazy=True).getBestCmap())
+    cached_path.parent.mkdir(parents=True, exist_ok=True)
+    cached_path.write_text(json.dumps(codepoints), encoding="utf-8")
+    return codepoints
+
+
+def _subset_font(source: Path, codepoints: list[int], cached_path: Path) -> None:
+    # fontTools warns about every table it drops or cannot subset.
+    logging.getLogger("fontTools").setLevel(logging.ERROR)
+    options = font_subset.Options()
+    options.flavor = "woff2"
+    font = TTFont(source, recalcTimestamp=False)
+    subsetter = font_subset.Subsetter(options)
+    subsetter.populate(unicodes=codepoints)
+    subsetter.subset(font)
+    partial_path = cached_path.with_name(f"{cached_path.stem}.{os.getpid()}.tmp")
+    font.save(partial_path)
+    partial_path.replace(cached_path)
+
+
+def _static_file(url: str, css_url: str) -> Path | None:
+    """The file in the static directory a stylesheet URL points at, if any."""
+    resolved = url if url.startswith("/") else posixpath.normpath(posixpath.join(posixpath.dirname(css_url), url))
+    if not resolved.startswith(STATIC_URL_PREFIX):
+        return None
+    path = STATIC_DIR / resolved[len(STATIC_URL_PREFIX) :]
+    return path if path.is_file() else None
+
+
+def unreferenced_fonts(stylesheets: dict[str, str] | None = None) -> set[str]:
+    """Font files in the static directory that no stylesheet points at.
+
+    Fonts are only fetched through @font-face, so these (commented-out
+    weights, and the originals of fonts subset_fonts replaced) would never be
+    served. ``stylesheets`` replaces the source of rewritten stylesheets as in
+    fingerprint_static_assets. Returns paths relative to the static directory.
+    """
+    fonts = {
+        path.relative_to(STATIC_DIR).as_posix()
+        for path in STATIC_DIR.rglob("*")
+        if path.suffix in FONT_FILE_SUFFIXES and path.is_file()
+    }
+    for path in STATIC_DIR.rglob("*.css"):
+        rel = path.relative_to(STATIC_DIR).as_posix()
+        css = (stylesheets or {}).get(rel) or path.read_text(encoding="utf-8")
+        for match in CSS_URL_RE.finditer(CSS_COMMENT_RE.sub("", css)):
+            url, _ = _split_url_suffix(match.group("url").strip())
+            font_path = _static_file(url, STATIC_URL_PREFIX + rel)
+            if font_path is not None:
+                fonts.discard(font_path.relative_to(STATIC_DIR).as_posix())
+    return fonts
+
+
+def subset_fonts(
+    build_dir: Path, manifest: BuildManifest, characters: set[str], jobs: int = 1
+) -> tuple[dict[str, str], dict[str, str], int]:
+    """Split the fonts of FONT_STYLESHEETS into WOFF2 unicode-range slices.
+
+    Every @font-face is replaced by one rule per slice of FONT_SLICES that
+    holds a used character (see collect_used_characters) or one of
+    FONT_BASELINE_RANGES, each pointing at a WOFF2 subset of the font with
+    exactly those characters. Subsets are kept in a content-addressed cache
+    keyed by the font and its characters. Returns the rewritten stylesheets
+    by path relative to the static directory (see fingerprint_static_assets),
+    the first slice of each font by original URL, so preloads fetch a subset,
+    and the number of stylesheets that were rewritten.
+    """
+    used = {ord(character) for character in characters}
+    used.update(codepoint for start, end in FONT_BASELINE_RANGES for codepoint in range(start, end + 1))
+    subsets: dict[Path, tuple[Path, list[int]]] = {}
+    stylesheets: dict[str, str] = {}
+    preloads: dict[str, str] = {}
+    changed: list[tuple[str, str, dict[Path, Path]]] = []
+
+    for rel in FONT_STYLESHEETS:
+        source = STATIC_DIR / rel
+        if not source.exists():
+            continue
+        css_url = STATIC_URL_PREFIX + rel
+        links: dict[Path, Path] = {}
+
+        def rewrite_font_face(match: re.Match[str]) -> str:
+            body = match.group("body")
+            src = FONT_SRC_RE.search(body) if body is not None else None
+            if src is None:
+                return match.group(0)
+            entries = [
+                (entry, _static_file(entry.group("url"), css_url) if entry.group("url") else None)
+                for entry in FONT_SRC_ENTRY_RE.finditer(src.group("value"))
+            ]
+            # Local sources of one face are the same font in other formats.
+            font_path = next((path for _, path in entries if path is not None), None)
+            if font_path is None:
+                return match.group(0)
+            font_hash = manifest.file_hash(font_path)
+            slices: dict[str, list[int]] = {}
+            for codepoint in sorted(used.intersection(_font_codepoints(font_path, font_hash))):
+                slices.setdefault(_font_slice(codepoint), []).append(codepoint)
+
+            font_dir = font_path.parent.relative_to(STATIC_DIR).as_posix()
+            rules = []
+            for name in [name for name, _ in FONT_SLICES] + [FONT_FALLBACK_SLICE]:
+                codepoints = slices.get(name)
+                if not codepoints:
+                    continue
+                unicode_range = _unicode_range(codepoints)
+                subset_hash = content_digest(font_hash, unicode_range)
+                cached_path = FONT_CACHE_DIR / f"{subset_hash}.woff2"
+                subset_name = f"{font_path.stem}.{name}.{subset_hash[:ASSET_HASH_LENGTH]}.woff2"
+                subset_url = STATIC_URL_PREFIX + posixpath.join(font_dir, subset_name)
+                subsets[cached_path] = (font_path, codepoints)
+                links[cached_path] = build_dir / "static" / font_dir / subset_name
+
+                sources: list[str] = []
+                for entry, path in entries:
+                    if path is None:
+                        rendered = entry.group(0)
+                    else:
+                        if not rules:
+                            preloads[STATIC_URL_PREFIX + path.relative_to(STATIC_DIR).as_posix()] = subset_url
+                        url = entry.group("url")
+                        href = subset_url if url.startswith("/") else posixpath.join(posixpath.dirname(url), subset_name)
+                        variations = (entry.group("format") or "").endswith("-variations")
+                        rendered = f"url('{href}') format('{'woff2-variations' if variations else 'woff2'}')"
+                    if rendered not in sources:
+                        sources.append(rendered)
+                declarations = body[: src.start()] + "src: " + ", ".join(sources) + ";" + body[src.end() :]
+                rules.append(
+                    f"/* {name} */\n@font-face {{{declarations.rstrip()}\n  unicode-range: {unicode_range};\n}}"
+                )
+            return "\n\n".join(rules)
+
+        css = FONT_FACE_RE.sub(rewrite_font_face, source.read_text(encoding="utf-8"))
+        stylesheets[rel] = css
+        css_hash = content_digest(css)
+        if not manifest.is_fresh(f"fonts:{rel}", css_hash):
+            changed.append((rel, css_hash, links))
+
+    missing = {
+        cached_path: subsets[cached_path]
+        for _, _, links in changed
+        for cached_path in links
+        if not cached_path.exists()
+    }
+    if missing:
+        FONT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fonts = [font_path for font_path, _ in missing.values()]
+        codepoints = [codepoints for _, codepoints in missing.values()]
+        if jobs > 1 and len(missing) > 1:
+            with ProcessPoolExecutor(max_workers=min(jobs, len(missing))) as executor:
+                list(executor.map(_subset_font, fonts, codepoints, missing))
+        else:
+            list(map(_subset_font, fonts, codepoints, missing))
+
+    for rel, css_hash, links in changed:
+        target = build_dir / "static" / rel
+        # Fingerprinted copies may share the target's inode, so never write
+        # through it.
+        if target.exists():
+            target.unlink()
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(stylesheets[rel], encoding="utf-8")
+        for cached_path, subset_path in links.items():
+            link_or_copy(cached_path, subset_path)
+        manifest.record(f"fonts:{rel}", css_hash, [target, *links.values()])
+    return stylesheets, preloads, len(changed)
+
+
+def _locale_messages(language_dir: Path) -> dict[str, str]:
+    """Merge a language's namespaces into one flat ``namespace.key`` table."""
+    messages: dict[str, str] = {}
+    for path in sorted(language_dir.glob("*.json")):
+        for key, value in json.loads(path.read_text(encoding="utf-8")).items():
+            # English sources carry {message, context} objects for translators.
+            if isinstance(value, dict):
+                value = value.get("message")
+            if isinstance(value, str) and value:
+                messages[f"{path.stem}.{key}"] = value
+    return messages
+
+
+# Bundled messages per language, loaded at most once per build.
+_LOCALE_MESSAGES: dict[str, dict[str, str]] = {}
+
+
+def locale_config() -> dict[str, Any]:
+    return json.loads((LOCALES_DIR / "config.json").read_text(encoding="utf-8"))
+
+
+def bundled_messages(code: str, fallback_code: str) -> dict[str, str]:
+    """A language's messages with missing keys taken from the fallback language."""
+    if code not in _LOCALE_MESSAGES:
+        messages = _locale_messages(LOCALES_DIR / code)
+        if code != fallback_code:
+            messages = {**bundled_messages(fallback_code, fallback_code), **messages}
+        _LOCALE_MESSAGES[code] = messages
+    return _LOCALE_MESSAGES[code]
+
+
+def build_locale_bundles(build_dir: Path, manifest: BuildManifest) -> dict[str, str]:
+    """Write one minified, content-hashed translation bundle per language.
+
+    Each bundle holds every namespace of the language with translator context
+    stripped and missing keys filled in from the fallback language, so the
+    client needs a single request. Returns the bundle hash of each language.
+    """
+    config = locale_config()
+    _LOCALE_MESSAGES.clear()
+    bundles: dict[str, str] = {}
+    for language in config["languages"]:
+        code = language["code"]
+        messages = bundled_messages(code, config["fallbackLanguage"])
+        bundle = json.dumps(messages, ensure_ascii=False, separators=(",", ":"), sort_keys=True)
+        bundle_hash = content_digest(bundle)[:ASSET_HASH_LENGTH]
+        target = build_dir / "locales" / f"{code}.{bundle_hash}.json"
+        if not manifest.is_fresh(f"locale:{code}", bundle_hash):
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text(bundle, encoding="utf-8")
+            manifest.record(f"locale:{code}", bundle_hash, [target])
+        bundles[code] = bundle_hash
+    return bundles
+
+
+@functools.cache
+def _date_pattern(code: str) -> str | None:
+    if babel is None:
+        return None
+    try:
+        locale = babel.Locale.parse(code)
+    except (ValueError, babel.UnknownLocaleError):
+        return None
+    skeletons = locale.datetime_skeletons
+    pattern = skeletons[babel.dates.match_skeleton("yMMMEd", skeletons)].pattern
+    # i18n.js asks Intl for two-digit days; leave quoted literals alone.
+    return re.sub(r"'[^']*'|d+", lambda match: "dd" if match[0] == "d" else match[0], pattern)
+
+
+def format_localized_date(value: str, code: str) -> str | None:
+    """Format an ISO date like i18n.js does, or None if that is not possible."""
+    pattern = _date_pattern(code)
+    if pattern is None:
+        return None
+    try:
+        date = datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        return None
+    return babel.dates.format_date(date, pattern, locale=code)
+
+
+class HTMLLocalizer(HTMLParser):
+    """Resolve the data-i18n attributes of a rendered page for one language.
+
+    Mirrors updateDOM() in i18n.js, so keys without a translation keep their
+    English markup. Root-relative page links are pointed at the same
+    language and hreflang alternates are added to the head. Everything else
+    is written back as it was parsed.
+    """
+
+    def __init__(
+        self,
+        language: dict[str, str],
+        messages: dict[str, str],
+        prefix: str,
+        alternates: list[tuple[str, str]],
+        localize_dates: bool = True,
+    ):
+        super().__init__(convert_charrefs=False)
+        self.language = language
+        self.messages = messages
+        self.prefix = prefix
+        self.alternates = alternates
+        self.localize_dates = localize_dates
+        self.out: list[str] = []
+        # The element whose content is being replaced, and its nesting depth.
+        self.replacing: str | None = None
+        self.depth = 0
+
+    def localize(self, html: str) -> str:
+        self.feed(html)
+        self.close()
+        return "".join(self.out)
+
+    def _start(self, tag: str, attrs: list[tuple[str, str | None]], closed: bool) -> None:
+        if self.replacing is not None:
+            if tag == self.replacing and not closed:
+                self.depth += 1
+            return
+        values = dict(attrs)
+        changed = False
+        if tag == "html":
+            values["lang"] = self.language["code"]
+            values["dir"] = self.language.get("dir", "ltr")
+            values["data-i18n-prerendered"] = None
+            changed = True
+        for source, target in (
+            ("data-i18n-aria", "aria-label"),
+            ("data-i18n-placeholder", "placeholder"),
+            ("data-i18n-tooltip", "title"),
+        ):
+            message = self.messages.get(values.get(source) or "")
+            if message:
+                values[target] = message
+                changed = True
+        href = values.get("href")
+        if self.prefix and tag == "a" and href and href.startswith("/") and not href.startswith("//") and href.endswith("/"):
+            values["href"] = self.prefix + href
+            changed = True
+        hx_get = values.get("hx-get")
+        if self.prefix and hx_get and hx_get.startswith("/") and not hx_get.startswith("//"):
+            values["hx-get"] = self.prefix + hx_get
+            changed = True
+
+        if changed:
+            rendered = "".join(
+                f" {name}" if value is None else f' {name}="{escape(value)}"' for name, value in values.items()
+            )
+            self.out.append(f"<{tag}{rendered}{' /' if closed else ''}>")
+        else:
+            self.out.append(self.get_starttag_text() or "")
+        if closed:
+            return
+
+        content = self._replacement(tag, values)
+        if content is not None:
+            self.out.append(content)
+            self.replacing = tag
+            self.depth = 1
+
+    def _replacement(self, tag: str, values: dict[str, str | None]) -> str | None:
+        """The new content of an element, or None to keep the parsed one."""
+        if tag == "title" and values.get("data-i18n-doc-title"):
+            title_format = self.messages.get(values["data-i18n-doc-title"])
+            if not title_format:
+                return None
+            title = self.messages.get(values.get("data-i18n-title-key") or "") or values.get("data-i18n-default-title") or ""
+            return escape(title_format.replace("{title}", title), quote=False)
+        if "data-i18n-date" in values:
+            if not self.localize_dates:
+                return None
+            formatted = format_localized_date(values.get("datetime") or "", self.language["code"])
+            return escape(formatted, quote=False) if formatted else None
+        message = self.messages.get(values.get("data-i18n") or "")
+        if message:
+            return escape(message, quote=False)
+        message = self.messages.get(values.get("data-i18n-html") or "")
+        if message:
+            return message.replace("\n\n", "</p><p>").replace("\n", "<br>")
+        return None
+
+    def handle_starttag(self, tag, attrs):
+        self._start(tag, attrs, closed=False)
+
+    def handle_startendtag(self, tag, attrs):
+        self._start(tag, attrs, closed=True)
+
+    def handle_endtag(self, tag):
+        if self.replacing is not None:
+            if tag != self.replacing:
+                return
+            self.depth -= 1
+            if self.depth:
+                return
+            self.replacing = None
+        if tag == "head":
+            for hreflang, url in self.alternates:
+                self.out.append(f'  <link rel="alternate" hreflang="{hreflang}" href="{escape(url)}">\n')
+        # Tag names arrive lowercased; keep the source spelling (e.g. SVG's
+        # feFlood).
+        end = self.rawdata.find(">", self._endtag_start)
+        self.out.append(self.rawdata[self._endtag_start : end + 1] if end != -1 else f"</{tag}>")
+
+    def parse_endtag(self, i):
+        self._endtag_start = i
+        return super().parse_endtag(i)
+
+    def _raw(self, text: str) -> None:
+        if self.replacing is None:
+            self.out.append(text)
+
+    def handle_data(self, data):
+        self._raw(data)
+
+    def handle_entityref(self, name):
+        self._raw(f"&{name};")
+
+    def handle_charref(self, name):
+        self._raw(f"&#{name};")
+
+    def handle_comment(self, data):
+        self._raw(f"<!--{data}-->")
+
+    def handle_decl(self, decl):
+        self._raw(f"<!{decl}>")
+
+    def handle_pi(self, data):
+        self._raw(f"<?{data}>")
+
+    def unknown_decl(self, data):
+        self._raw(f"<![{data}]>")
+
+
+def write_localized_pages(
+    html: str,
+    output_path: Path,
+    build_dir: Path,
+    languages: list[dict[str, str]],
+    fallback_language: str,
+) -> list[tuple[str, Path, str]]:
+    """Write a rendered page once per language, the fallback one in place.
+
+    Returns the language, path and HTML of every page written.
+    """
+    url = output_url(output_path.relative_to(build_dir).as_posix())
+    site = SITE_URL.rstrip("/")
+
+    def prefix(code: str) -> str:
+        return "" if code == fallback_language else f"/{code}"
+
+    alternates = [(language["code"], site + prefix(language["code"]) + url) for language in languages]
+    alternates.append(("x-default", site + url))
+    outputs = []
+    for language in languages:
+        code = language["code"]
+        localizer = HTMLLocalizer(
+            language,
+            bundled_messages(code, fallback_language),
+            prefix(code),
+            alternates,
+            # The fallback language keeps the server-rendered date style.
+            localize_dates=code != fallback_language,
+        )
+        target = build_dir / prefix(code).lstrip("/") / output_path.relative_to(build_dir)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        localized = localizer.localize(html)
+        target.write_text(localized)
+        outputs.append((code, target, localized))
+    return outputs
+
+
+SEARCH_CJK_CHARS = "\u3040-\u30ff\u31f0-\u31ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff"
+SEARCH_THAI_CHARS = "\u0e00-\u0e7f"
+
+
+@functools.cache
+def _search_token_re() -> re.Pattern[str]:
+    # \w misses combining marks, which would split words in Indic scripts.
+    marks = "".join(
+        re.escape(chr(code)) for code in range(0x300, 0x10000) if unicodedata.category(chr(code)).startswith("M")
+    )
+    scripts = SEARCH_CJK_CHARS + SEARCH_THAI_CHARS
+    return re.compile(
+        f"(?P<cjk>[{SEARCH_CJK_CHARS}]+)|(?P<thai>[{SEARCH_THAI_CHARS}]+)|(?P<word>(?:(?![{scripts}])[\\w{marks}])+)"
+    )
+
+
+def search_terms(text: str) -> list[str]:
+    """Split text into index terms; _static/search.js tokenizes queries alike.
+
+    Words are lowercased and NFKC-normalized. CJK and Thai are written
+    without spaces between words, so their runs are indexed as overlapping
+    character bigrams instead.
+    """
+    terms: list[str] = []
+    for match in _search_token_re().finditer(unicodedata.normalize("NFKC", text).lower()):
+        token = match[0]
+        if match["word"]:
+            if len(token) > 1 or token.isdigit():
+                terms.append(token)
+        elif len(token) == 1:
+            terms.append(token)
+        else:
+            terms.extend(token[index : index + 2] for index in range(len(token) - 1))
+    return terms
+
+
+def search_shard_name(term: str) -> str:
+    """Name of the shard holding a term, derived from the term's prefix."""
+    prefix = term[:2] if term[0].isascii() else term[:1]
+    return "".join(char if char.isascii() and char.isalnum() else f"_{ord(char):x}" for char in prefix)
+
+
+class _SearchTextExtractor(HTMLParser):
+    """Collect the visible text and first heading of a page's div.page."""
+
+    SKIPPED_TAGS = {"script", "style", "template", "svg"}
+
+    def __init__(self):
+        super().__init__()
+        self.depth = 0
+        self.skipping = 0
+        self.heading: list[str] | None = None
+        self.title = ""
+        self.parts: list[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        if self.depth:
+            if tag == "div":
+                self.depth += 1
+            elif tag in self.SKIPPED_TAGS:
+                self.skipping += 1
+            elif tag == "h1" and not self.title:
+                self.heading = []
+        elif tag == "div" and "page" in (dict(attrs).get("class") or "").split():
+            self.depth = 1
+
+    def handle_endtag(self, tag):
+        if not self.depth:
+            return
+        if tag == "div":
+            self.depth -= 1
+        elif tag in self.SKIPPED_TAGS:
+            self.skipping = max(self.skipping - 1, 0)
+        elif tag == "h1" and self.heading is not None:
+            self.title = " ".join("".join(self.heading).split())
+            self.heading = None
+
+    def handle_data(self, data):
+        if self.depth and not self.skipping:
+            self.parts.append(data)
+            if self.heading is not None:
+                self.heading.append(data)
+
+
+def search_document(html: str, url: str, fallback_title: str) -> dict[str, Any]:
+    """Term frequencies of a rendered page; title terms count extra."""
+    extractor = _SearchTextExtractor()
+    extractor.feed(html)
+    extractor.close()
+    title = extractor.title or fallback_title
+    frequencies: dict[str, int] = {}
+    for term in search_terms(" ".join(extractor.parts)):
+        frequencies[term] = frequencies.get(term, 0) + 1
+    for term in search_terms(title):
+        frequencies[term] = frequencies.get(term, 0) + SEARCH_TITLE_WEIGHT
+    return {"url": url, "title": title, "terms": frequencies}
+
+
+def search_document_path(page_hash: str) -> Path:
+    return SEARCH_CACHE_DIR / f"{page_hash}.json"
+
+
+def build_search_index(
+    build_dir: Path, manifest: BuildManifest, documents: dict[str, list[dict[str, Any]]]
+) -> int:
+    """Write the sharded inverted index of every language's documents.
+
+    search/<lang>/index.json lists the documents and the content hash of
+    each shard; shards at search/<lang>/<shard>.<hash>.json map each term
+    to a flat [document, frequency, ...] posting list. Documents are keyed
+    by a hash of their URL, so adding a page only touches the shards of its
+    own terms. Without --localized there are only the fallback language's
+    pages, so only its index is written and _static/search.js uses it for
+    every language. Returns the number of files written.
+    """
+    written = 0
+    for language, language_documents in sorted(documents.items()):
+        language_dir = build_dir / "search" / language
+        docs: dict[str, list[str]] = {}
+        shards: dict[str, dict[str, list[Any]]] = {}
+        for document in sorted(language_documents, key=lambda document: document["url"]):
+            doc_id = content_digest(document["url"])[:SEARCH_DOC_ID_LENGTH]
+            docs[doc_id] = [document["url"], document["title"]]
+            for term, frequency in sorted(document["terms"].items()):
+                shards.setdefault(search_shard_name(term), {}).setdefault(term, []).extend([doc_id, frequency])
+
+        shard_hashes: dict[str, str] = {}
+        for name, postings in sorted(shards.items()):
+            shard_json = json.dumps(postings, ensure_ascii=False, separators=(",", ":"), sort_keys=True)
+            shard_hash = content_digest(shard_json)[:ASSET_HASH_LENGTH]
+            shard_path = language_dir / f"{name}.{shard_hash}.json"
+            if not manifest.is_fresh(f"search:{language}:{name}", shard_hash):
+                shard_path.parent.mkdir(parents=True, exist_ok=True)
+                shard_path.write_text(shard_json, encoding="utf-8")
+                manifest.record(f"search:{language}:{name}", shard_hash, [shard_path])
+                written += 1
+            shard_hashes[name] = shard_hash
+
+        index_json = json.dumps(
+            {"docs": docs, "shards": shard_hashes}, ensure_ascii=False, separators=(",", ":"), sort_keys=True
+        )
+        index_path = language_dir / "index.json"
+        if not manifest.is_fresh(f"search:{language}", content_digest(index_json)):
+            index_path.parent.mkdir(parents=True, exist_ok=True)
+            index_path.write_text(index_json, encoding="utf-8")
+            manifest.record(f"search:{language}", content_digest(index_json), [index_path])
+            written += 1
+    return written
+
+
+class _SelectorTokenCollector(HTMLParser):
+    """Collect what CSS selectors can test in a page: tags, classes, ids and attributes."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.tokens: set[str] = set()
+
+    def handle_starttag(self, tag, attrs):
+        self.tokens.add(f"<{tag}")
+        for name, value in attrs:
+            self.tokens.add(f"[{name}")
+            if value is None:
+                continue
+            if name == "class":
+                self.tokens.update(f".{name}" for name in value.split())
+            elif name == "id":
+                self.tokens.add(f"#{value}")
+            self.tokens.add(f"[{name}={value}")
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+
+
+def _css_blocks(css: str) -> Iterator[tuple[str, str | None]]:
+    """Split CSS into its top-level rules as (prelude, block) pairs.
+
+    Statements such as @import have no block.
+    """
+    index, length = 0, len(css)
+    while index < length:
+        end, quote = index, None
+        while end < length:
+            char = css[end]
+            if quote:
+                if char == "\\":
+                    end += 1
+                elif char == quote:
+                    quote = None
+            elif char in "\"'":
+                quote = char
+            elif char in "{;}":
+                break
+            end += 1
+        prelude = css[index:end].strip()
+        if end >= length or css[end] != "{":
+            if prelude:
+                yield prelude, None
+            index = end + 1
+            continue
+        depth, close, quote = 1, end + 1, None
+        while close < length and depth:
+            char = css[close]
+            if quote:
+                if char == "\\":
+                    close += 1
+                elif char == quote:
+                    quote = None
+            elif char in "\"'":
+                quote = char
+            elif char == "{":
+                depth += 1
+            elif char == "}":
+                depth -= 1
+            close += 1
+        yield prelude, css[end + 1 : close - 1]
+        index = close
+
+
+def _split_selector_list(selectors: str) -> list[str]:
+    """Split a selector list on the commas that are not inside parentheses."""
+    parts, depth, start = [], 0, 0
+    for index, char in enumerate(selectors):
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "," and depth == 0:
+            parts.append(selectors[start:index].strip())
+            start = index + 1
+    parts.append(selectors[start:].strip())
+    return [part for part in parts if part]
+
+
+def _selector_requirements(selector: str) -> Iterator[str | list[list[str]]]:
+    """Yield the tokens a selector needs, or alternatives for :is() and friends.
+
+    Pseudo-classes describe state (or, for :not(), absence), so only the
+    simple selectors of the compound selectors count.
+    """
+    index = 0
+    while True:
+        match = SELECTOR_TOKEN_RE.search(selector, index)
+        if match is None:
+            return
+        index = match.end()
+        if match.group("pseudo") is not None:
+            if match.group("open") is None:
+                continue
+            depth, close = 1, index
+            while close < len(selector) and depth:
+                depth += {"(": 1, ")": -1}.get(selector[close], 0)
+                close += 1
+            if match.group("pseudo").lower() in SELECTOR_ANY_OF_PSEUDO_CLASSES:
+                yield [list(_selector_requirements(part)) for part in _split_selector_list(selector[index : close - 1])]
+            index = close
+        elif match.group("class") is not None:
+            yield "." + match.group("class")
+        elif match.group("id") is not None:
+            yield "#" + match.group("id")
+        elif match.group("attr") is not None:
+            attr = match.group("attr").lower()
+            yield "[" + attr
+            value = next((value for value in match.group("double", "single", "bare") if value is not None), None)
+            if match.group("op") == "=" and value is not None:
+                yield f"[{attr}={value}"
+        else:
+            yield "<" + match.group("tag").lower()
+
+
+def _requirements_met(requirements: list[str | list[list[str]]], tokens: set[str]) -> bool:
+    return all(
+        requirement in tokens
+        if isinstance(requirement, str)
+        else any(_requirements_met(alternative, tokens) for alternative in requirement)
+        for requirement in requirements
+    )
+
+
+def _flatten_requirements(requirements: list[str | list[list[str]]]) -> Iterator[str]:
+    for requirement in requirements:
+        if isinstance(requirement, str):
+            yield requirement
+        else:
+            for alternative in requirement:
+                yield from _flatten_requirements(alternative)
+
+
+def _absolutize_css_urls(css: str, css_url: str) -> str:
+    """Make relative url() references absolute so the CSS can move into a page."""
+    base = posixpath.dirname(css_url)
+
+    def replace_url(match: re.Match[str]) -> str:
+        url = match.group("url").strip()
+        if url.startswith(("/", "#", "data:", "http://", "https://")):
+            return match.group(0)
+        quote = match.group("quote")
+        return f"url({quote}{posixpath.normpath(posixpath.join(base, url))}{quote})"
+
+    return CSS_URL_RE.sub(replace_url, css)
+
+
+def _parse_stylesheet(css: str, css_url: str, build_dir: Path) -> list[tuple[Any, ...]]:
+    """Parse a stylesheet (and what it @imports from the build) into rules.
+
+    Style rules are kept as ("style", requirements per selector, text),
+    conditional group rules as ("group", prelude, rules) and @keyframes and
+    @font-face as ("keyframes", name, text) and ("font-face", family, text).
+    """
+    rules: list[tuple[Any, ...]] = []
+    for prelude, block in _css_blocks(re.sub(r"/\*.*?\*/", "", _absolutize_css_urls(css, css_url), flags=re.DOTALL)):
+        compact = " ".join(prelude.split())
+        if block is None:
+            imported = CSS_URL_RE.search(compact) if compact.lower().startswith("@import") else None
+            if imported and (build_dir / imported.group("url").lstrip("/")).is_file():
+                url = imported.group("url")
+                rules.extend(_parse_stylesheet((build_dir / url.lstrip("/")).read_text(encoding="utf-8"), url, build_dir))
+            elif not compact.lower().startswith(("@charset", "@import")):
+                rules.append(("other", f"{compact};"))
+            continue
+        body = " ".join(block.split())
+        keyword = compact.split(None, 1)[0].lower() if compact.startswith("@") else ""
+        if keyword in CSS_GROUP_AT_RULES:
+            rules.append(("group", compact, _parse_stylesheet(block, css_url, build_dir)))
+        elif keyword.endswith("keyframes"):
+            rules.append(("keyframes", compact.split(None, 1)[-1], f"{compact}{{{body}}}"))
+        elif keyword == "@font-face":
+            family = FONT_FAMILY_RE.search(body)
+            rules.append(("font-face", family.group("family") if family else "", f"{compact}{{{body}}}"))
+        elif keyword:
+            rules.append(("other", f"{compact}{{{body}}}"))
+        else:
+            requirements = [list(_selector_requirements(selector)) for selector in _split_selector_list(compact)]
+            rules.append(("style", requirements, f"{compact}{{{body}}}"))
+    return rules
+
+
+# Parsed stylesheets (with every token their selectors test) and script
+# classes by their fingerprinted, so content-addressed, URLs, and critical
+# CSS by template, stylesheets and the tokens of a page that decide it.
+_STYLESHEET_RULES: dict[str, tuple[list[tuple[Any, ...]], set[str]]] = {}
+_SCRIPT_CLASSES: dict[str, set[str]] = {}
+_CRITICAL_CSS: dict[tuple[str, tuple[str, ...], frozenset[str]], tuple[str, list[str]]] = {}
+
+
+def _stylesheet_rules(url: str, build_dir: Path) -> tuple[list[tuple[Any, ...]], set[str]]:
+    if url not in _STYLESHEET_RULES:
+        css = (build_dir / url.lstrip("/")).read_text(encoding="utf-8")
+        rules = _parse_stylesheet(css, url, build_dir)
+        tokens = {
+            token
+            for rule in _flatten_groups(rules)
+            for requirements in rule[1]
+            for token in _flatten_requirements(requirements)
+        }
+        _STYLESHEET_RULES[url] = (rules, tokens)
+    return _STYLESHEET_RULES[url]
+
+
+def _script_classes(url: str, build_dir: Path) -> set[str]:
+    """Classes a script adds to elements, which pages may show before the full CSS loads."""
+    if url not in _SCRIPT_CLASSES:
+        script = (build_dir / url.lstrip("/")).read_text(encoding="utf-8")
+        _SCRIPT_CLASSES[url] = {f".{match.group('name')}" for match in SCRIPT_CLASS_RE.finditer(script)}
+    return _SCRIPT_CLASSES[url]
+
+
+def _select_critical_rules(rules: list[tuple[Any, ...]], tokens: set[str]) -> list[str]:
+    kept = []
+    for rule in rules:
+        if rule[0] == "style":
+            if any(_requirements_met(requirements, tokens) for requirements in rule[1]):
+                kept.append(rule[2])
+        elif rule[0] == "group":
+            nested = _select_critical_rules(rule[2], tokens)
+            if nested:
+                kept.append(f"{rule[1]}{{{''.join(nested)}}}")
+        elif rule[0] == "other":
+            kept.append(rule[1])
+    return kept
+
+
+def _critical_css(
+    template: str, stylesheets: tuple[str, ...], tokens: set[str], build_dir: Path
+) -> tuple[str, list[str]]:
+    """The rules of stylesheets a page with tokens matches, and its fonts to preload.
+
+    Besides matched style rules this keeps @keyframes and @font-face rules
+    that they use. Fonts are preloaded for the faces covering Latin text, and
+    italic faces only if the page sets italic text.
+    """
+    rules: list[tuple[Any, ...]] = []
+    relevant: set[str] = set()
+    for url in stylesheets:
+        stylesheet_rules, stylesheet_tokens = _stylesheet_rules(url, build_dir)
+        rules += stylesheet_rules
+        relevant |= stylesheet_tokens
+    # Pages of one template mostly differ in tokens no selector tests, so
+    # they share their critical CSS.
+    key = (template, stylesheets, frozenset(tokens & relevant))
+    if key in _CRITICAL_CSS:
+        return _CRITICAL_CSS[key]
+
+    kept = _select_critical_rules(rules, tokens)
+    used = "".join(kept)
+    fonts: list[str] = []
+    for rule in _flatten_groups(rules, kinds=("keyframes", "font-face")):
+        if rule[0] == "keyframes" and re.search(rf"(?<![\w-]){re.escape(rule[1])}(?![\w-])", used):
+            kept.append(rule[2])
+        elif rule[0] == "font-face" and rule[1] and rule[1] in used:
+            kept.append(rule[2])
+            source = CSS_URL_RE.search(rule[2])
+            unicode_range = FONT_UNICODE_RANGE_RE.search(rule[2])
+            italic = "font-style:italic" in rule[2].replace(" ", "")
+            if (
+                source
+                and source.group("url") not in fonts
+                and (unicode_range is None or _unicode_range_covers(unicode_range.group("ranges"), ord("A")))
+                and (not italic or "italic" in used or tokens & {"<em", "<i", "<cite"})
+            ):
+                fonts.append(source.group("url"))
+    _CRITICAL_CSS[key] = ("".join(kept), fonts)
+    return _CRITICAL_CSS[key]
+
+
+def _flatten_groups(rules: list[tuple[Any, ...]], kinds: tuple[str, ...] = ("style",)) -> Iterator[tuple[Any, ...]]:
+    for rule in rules:
+        if rule[0] == "group":
+            yield from _flatten_groups(rule[2], kinds)
+        elif rule[0] in kinds:
+            yield rule
+
+
+def _unicode_range_covers(ranges: str, codepoint: int) -> bool:
+    for part in ranges.split(","):
+        start, _, end = part.strip().upper().removeprefix("U+").partition("-")
+        if "?" in start:
+            start, end = start.replace("?", "0"), start.replace("?", "F")
+        if int(start, 16) <= codepoint <= int(end or start, 16):
+            return True
+    return False
+
+
+def inline_critical_css(html: str, build_dir: Path, template: str, extra_tokens: Iterable[str] = ()) -> str:
+    """Inline the CSS a rendered page matches and load its stylesheets async.
+
+    The page's local stylesheets are replaced by a <style> with the rules the
+    page matches (see _critical_css), preloads for the stylesheets, the fonts
+    of the inlined rules and the page's scripts, and ASYNC_STYLESHEET_LOADER,
+    which adds the full stylesheets once the page has rendered. Classes that
+    the page's scripts add count as present, as do CRITICAL_CSS_SAFELIST and
+    ``extra_tokens``.
+    """
+    head_end = html.find("</head>")
+    if head_end < 0:
+        return html
+    links = []
+    preloaded = set()
+    for match in LINK_TAG_RE.finditer(html, 0, head_end):
+        attrs = {
+            attr.group("name").lower(): unescape(attr.group("double") or attr.group("single") or attr.group("bare") or "")
+            for attr in HTML_ATTR_RE.finditer(match.group(0), 5, len(match.group(0)) - 1)
+        }
+        href = attrs.get("href", "")
+        if attrs.get("rel") == "preload":
+            preloaded.add(href)
+        elif (
+            attrs.get("rel") == "stylesheet"
+            and attrs.get("media", "all") == "all"
+            and href.startswith(STATIC_URL_PREFIX)
+            and (build_dir / href.lstrip("/")).is_file()
+        ):
+            links.append((match, href))
+    if not links:
+        return html
+
+    scripts = [
+        src
+        for src in dict.fromkeys(match.group("src") for match in SCRIPT_SRC_RE.finditer(html))
+        if src.startswith(STATIC_URL_PREFIX) and (build_dir / src.lstrip("/")).is_file()
+    ]
+    collector = _SelectorTokenCollector()
+    collector.feed(html)
+    tokens = collector.tokens | CRITICAL_CSS_SAFELIST | set(extra_tokens)
+    for src in scripts:
+        tokens |= _script_classes(src, build_dir)
+    stylesheets = tuple(href for _, href in links)
+    css, fonts = _critical_css(template, stylesheets, tokens, build_dir)
+
+    first = links[0][0]
+    indent = html[html.rfind("\n", 0, first.start()) + 1 : first.start()]
+    tags = [f"<style>{css}</style>"]
+    tags += [
+        f'<link rel="preload" href="{escape(url)}" as="font"'
+        + (' type="font/woff2"' if url.endswith(".woff2") else "")
+        + " crossorigin>"
+        for url in fonts
+        if url not in preloaded
+    ]
+    tags += [f'<link rel="preload" href="{escape(href)}" as="style" data-stylesheet>' for href in stylesheets]
+    tags += [f'<link rel="preload" href="{escape(src)}" as="script">' for src in scripts if src not in preloaded]
+    tags.append(ASYNC_STYLESHEET_LOADER)
+    tags.append(
+        "<noscript>" + "".join(f'<link rel="stylesheet" href="{escape(href)}">' for href in stylesheets) + "</noscript>"
     )
-    (posts_dir / "feed.atom").write_text(atom_xml, encoding="utf-8")
 
-    rss_xml = _generate_rss_feed(
-        title="Earendil Posts",
-        feed_url=rss_feed_url,
-        subtitle="Posts from Earendil",
-        updates=recent_updates,
+    parts = [html[: first.start()], f"\n{indent}".join(tags)]
+    position = first.end()
+    for match, _ in links[1:]:
+        # The other links go, along with their indentation and line break.
+        start = match.start()
+        line_start = html.rfind("\n", position, start)
+        if line_start >= 0 and not html[line_start:start].strip():
+            start = line_start
+        parts.append(html[position:start])
+        position = match.end()
+    parts.append(html[position:])
+    return "".join(parts)
+
+
+def _compressed_cache_path(data_hash: str, suffix: str, brotli_quality: int) -> Path:
+    if suffix == ".br":
+        return COMPRESSED_CACHE_DIR / f"{data_hash}.q{brotli_quality}{suffix}"
+    return COMPRESSED_CACHE_DIR / f"{data_hash}{suffix}"
+
+
+def _compress_output(path: Path, data_hash: str, brotli_quality: int = BROTLI_QUALITY) -> list[str]:
+    """Fill the compression cache for path's content, returning the suffixes."""
+    data: bytes | None = None
+    suffixes = []
+    for coding, suffix in COMPRESSED_VARIANTS:
+        if coding == "br" and brotli is None:
+            continue
+        cached_path = _compressed_cache_path(data_hash, suffix, brotli_quality)
+        if not cached_path.exists():
+            if data is None:
+                data = path.read_bytes()
+            if coding == "br":
+                blob = brotli.compress(data, quality=brotli_quality)
+            else:
+                blob = gzip.compress(data, compresslevel=9, mtime=0)
+            partial_path = cached_path.with_name(f"{cached_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            partial_path.write_bytes(blob)
+            partial_path.replace(cached_path)
+        suffixes.append(suffix)
+    return suffixes
+
+
+def precompress_outputs(
+    build_dir: Path, manifest: BuildManifest, jobs: int = 1, brotli_quality: int = BROTLI_QUALITY
+) -> int:
+    """Write .gz (and .br, with brotli installed) next to compressible outputs.
+
+    Variants are only recomputed for outputs whose content hash changed since
+    the previous build, and are kept in a content-addressed cache, so files
+    with identical content (like fingerprinted copies) are compressed once.
+    Compression runs in ``jobs`` threads since zlib and brotli release the
+    GIL. Returns the number of outputs that got new variants.
+    """
+    outputs = sorted(
+        (output, key in manifest.recorded)
+        for key, entry in list(manifest.entries.items())
+        for output in entry["outputs"]
+        if posixpath.splitext(output)[1] in COMPRESSIBLE_SUFFIXES
     )
-    (posts_dir / "feed.rss").write_text(rss_xml, encoding="utf-8")
+    # Keyed by quality too, so switching between build and serve redoes the
+    # brotli variants (from the cache, after the first time).
+    key_prefix = f"compressed-q{brotli_quality}:"
+    pending: list[tuple[str, str, str, Path]] = []
+    for output, rewritten in outputs:
+        previous = manifest.previous.get(key_prefix + output)
+        # An output that was not rewritten still has the content its
+        # variants were made from, so skip reading and hashing it.
+        if not rewritten and previous and manifest.is_fresh(key_prefix + output, previous["hash"]):
+            continue
+        path = build_dir / output
+        if path.stat().st_size < COMPRESS_MIN_SIZE:
+            continue
+        data_hash = hashlib.sha256(path.read_bytes()).hexdigest()
+        output_hash = content_digest(data_hash, "brotli" if brotli is not None else "")
+        if not manifest.is_fresh(key_prefix + output, output_hash):
+            pending.append((output, output_hash, data_hash, path))
+    if not pending:
+        return 0
+
+    COMPRESSED_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    unique = {data_hash: path for _, _, data_hash, path in pending}
+    compress = functools.partial(_compress_output, brotli_quality=brotli_quality)
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        suffixes = dict(zip(unique, executor.map(compress, unique.values(), unique.keys())))
+
+    for output, output_hash, data_hash, path in pending:
+        size = path.stat().st_size
+        written = []
+        for suffix in suffixes[data_hash]:
+            cached_path = _compressed_cache_path(data_hash, suffix, brotli_quality)
+            variant_path = path.with_name(path.name + suffix)
+            if cached_path.stat().st_size < size:
+                link_or_copy(cached_path, variant_path)
+                written.append(variant_path)
+            elif variant_path.exists():
+                variant_path.unlink()
+        manifest.record(key_prefix + output, output_hash, written)
+    return len(pending)
+
+
+def _copy_summary(count: int, unchanged: int, noun: str) -> str:
+    summary = f"  Copied {count} {noun}"
+    if unchanged:
+        summary += f" ({unchanged} unchanged)"
+    return summary
+
+
+@contextmanager
+def timed(timings: dict[str, list[float]], name: str) -> Iterator[None]:
+    """Add the wall and CPU seconds spent in the block to timings[name]."""
+    wall, cpu = time.perf_counter(), time.process_time()
+    try:
+        yield
+    finally:
+        total = timings.setdefault(name, [0.0, 0.0])
+        total[0] += time.perf_counter() - wall
+        total[1] += time.process_time() - cpu
 
 
+def _peak_rss_bytes(who: int) -> int | None:
+    if resource is None:
+        return None
+    peak = resource.getrusage(who).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return peak if sys.platform == "darwin" else peak * 1024
+
 
-def build_to(build_dir: Path) -> None:
-    if build_dir.exists():
+class BuildProfiler:
+    """Wall and CPU time per build phase and per page, plus peak memory.
+
+    Page phases are measured where the page is rendered, which may be a pool
+    worker, and are merged in here from the page results.
+    """
+
+    def __init__(self):
+        self.phases: dict[str, list[float]] = {}
+        self.pages: list[dict[str, Any]] = []
+        self._start = (time.perf_counter(), time.process_time())
+
+    def phase(self, name: str):
+        return timed(self.phases, name)
+
+    def add_page(self, source: Path, timings: dict[str, list[float]]) -> None:
+        for name, (wall, cpu) in timings.items():
+            total = self.phases.setdefault(f"page {name}", [0.0, 0.0])
+            total[0] += wall
+            total[1] += cpu
+        self.pages.append({
+            "source": source.relative_to(ROOT).as_posix(),
+            "wall": sum(wall for wall, _ in timings.values()),
+            "phases": {name: {"wall": wall, "cpu": cpu} for name, (wall, cpu) in timings.items()},
+        })
+
+    def report(self) -> dict[str, Any]:
+        pages = sorted(self.pages, key=lambda page: page["wall"], reverse=True)
+        return {
+            "wall": time.perf_counter() - self._start[0],
+            "cpu": time.process_time() - self._start[1],
+            "peak_rss_bytes": {
+                "main": _peak_rss_bytes(resource.RUSAGE_SELF) if resource else None,
+                "workers": _peak_rss_bytes(resource.RUSAGE_CHILDREN) if resource else None,
+            },
+            "phases": {name: {"wall": wall, "cpu": cpu} for name, (wall, cpu) in self.phases.items()},
+            "pages": pages,
+        }
+
+    def write_report(self, path: Path) -> dict[str, Any]:
+        report = self.report()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        return report
+
+    @staticmethod
+    def print_summary(report: dict[str, Any], top: int = PROFILE_TOP_N) -> None:
+        print(f"Build took {report['wall']:.3f}s wall, {report['cpu']:.3f}s CPU (main process)")
+        print("Phases:")
+        for name, phase in sorted(report["phases"].items(), key=lambda item: item[1]["wall"], reverse=True):
+            print(f"  {name:<24} {phase['wall']:8.3f}s wall {phase['cpu']:8.3f}s CPU")
+        if report["pages"]:
+            print("Slowest pages:")
+            for page in report["pages"][:top]:
+                print(f"  {page['wall']:8.3f}s  {page['source']}")
+        peak = report["peak_rss_bytes"]
+        if peak["main"] is not None:
+            print(f"Peak RSS: {peak['main'] / 2**20:.1f} MiB main, {peak['workers'] / 2**20:.1f} MiB workers")
+
+
+_TEMPLATE_ENV: Environment | None = None
+# Source hashes of the templates as _TEMPLATE_ENV may have loaded them.
+_TEMPLATE_ENV_HASHES: dict[str, str] = {}
+# Templates referenced by a template source, keyed by its hash. None marks a
+# reference that cannot be resolved statically.
+_TEMPLATE_REFERENCES: dict[str, set[str] | None] = {}
+# Context variables a template source reads, keyed by its hash.
+_TEMPLATE_VARIABLES: dict[str, set[str]] = {}
+
+
+def _page_environment() -> Environment:
+    """Return this process's template environment, creating it on first use."""
+    global _TEMPLATE_ENV
+    if _TEMPLATE_ENV is None:
+        _TEMPLATE_ENV = Environment(loader=load_from_path(str(TEMPLATES_DIR)))
+    return _TEMPLATE_ENV
+
+
+def _template_references(source: str) -> set[str] | None:
+    references: set[str] = set()
+    for match in TEMPLATE_REFERENCE_RE.finditer(source):
+        names = TEMPLATE_NAME_RE.findall(match["args"])
+        if not names:
+            return None
+        references.update(names)
+    return references
+
+
+class TemplateGraph:
+    """The extends/include/import relationships between the templates.
+
+    A page depends on its own template and everything that template pulls in,
+    so its hash only changes when one of those files does. A template whose
+    references are computed at render time depends on every template.
+    """
+
+    def __init__(self, templates_dir: Path, manifest: BuildManifest):
+        self.hashes: dict[str, str] = {}
+        self.references: dict[str, set[str] | None] = {}
+        self._digests: dict[str, str] = {}
+        if templates_dir.exists():
+            for path in sorted(templates_dir.rglob("*")):
+                if not path.is_file():
+                    continue
+                name = path.relative_to(templates_dir).as_posix()
+                file_hash = manifest.file_hash(path)
+                if file_hash not in _TEMPLATE_REFERENCES:
+                    _TEMPLATE_REFERENCES[file_hash] = _template_references(
+                        path.read_text(encoding="utf-8")
+                    )
+                self.hashes[name] = file_hash
+                self.references[name] = _TEMPLATE_REFERENCES[file_hash]
+
+    def dependencies(self, name: str) -> set[str]:
+        """The template itself and every template it extends, includes or imports."""
+        seen = {name}
+        pending = [name]
+        while pending:
+            references = self.references.get(pending.pop(), set())
+            if references is None:
+                return seen.union(self.hashes)
+            for reference in references - seen:
+                seen.add(reference)
+                pending.append(reference)
+        return seen
+
+    def variables(self, name: str) -> set[str]:
+        """Context variables read by a template or anything it pulls in."""
+        variables: set[str] = set()
+        for dependency in self.dependencies(name):
+            file_hash = self.hashes.get(dependency)
+            if file_hash is None:
+                continue
+            if file_hash not in _TEMPLATE_VARIABLES:
+                _TEMPLATE_VARIABLES[file_hash] = _page_environment().undeclared_variables_in_template(dependency)
+            variables |= _TEMPLATE_VARIABLES[file_hash]
+        return variables
+
+    def digest(self, name: str) -> str:
+        """Hash the sources a page rendered with this template depends on."""
+        if name not in self._digests:
+            self._digests[name] = content_digest(
+                *(f"{dependency}:{self.hashes.get(dependency, '')}" for dependency in sorted(self.dependencies(name)))
+            )
+        return self._digests[name]
+
+
+def refresh_template_environment(graph: TemplateGraph) -> None:
+    """Evict templates whose source changed since this process loaded them.
+
+    The environment lives as long as the process, so the dev server keeps
+    every unchanged template compiled across rebuilds.
+    """
+    global _TEMPLATE_ENV_HASHES
+    if _TEMPLATE_ENV is not None:
+        for name, file_hash in _TEMPLATE_ENV_HASHES.items():
+            if graph.hashes.get(name) != file_hash:
+                _TEMPLATE_ENV.remove_template(name)
+    _TEMPLATE_ENV_HASHES = dict(graph.hashes)
+
+
+def paginate_posts(posts: list[dict[str, Any]], slug: str) -> Iterator[tuple[list[dict[str, Any]], dict[str, Any]]]:
+    """Split the posts listing into pages of POSTS_PER_PAGE.
+
+    The first page lives at slug, page N at {slug}page/N/, which also gets a
+    fragment.html holding just its list items for loading on scroll.
+    """
+    chunks = [posts[start : start + POSTS_PER_PAGE] for start in range(0, len(posts), POSTS_PER_PAGE)] or [[]]
+
+    def page_url(number: int) -> str:
+        return slug if number == 1 else f"{slug}page/{number}/"
+
+    for number, chunk in enumerate(chunks, 1):
+        has_next = number < len(chunks)
+        yield chunk, {
+            "number": number,
+            "total": len(chunks),
+            "url": page_url(number),
+            "previous_url": page_url(number - 1) if number > 1 else None,
+            "next_url": page_url(number + 1) if has_next else None,
+            "next_fragment_url": f"{page_url(number + 1)}fragment.html" if has_next else None,
+        }
+
+
+def page_fragment(html: str) -> str | None:
+    """Cut a rendered page down to what a boosted navigation swaps in.
+
+    That is the <div class="page"> element, preceded by a
+    <template data-page-head> holding the page's title, meta and hreflang
+    tags for the layout script to swap into the current head. Returns None
+    for pages without a div.page.
+    """
+    start = PAGE_DIV_RE.search(html)
+    if not start:
+        return None
+    depth = 0
+    for tag in DIV_TAG_RE.finditer(html, start.start()):
+        depth += -1 if tag.group(1) else 1
+        if depth == 0:
+            break
+    else:
+        return None
+    head_end = html.find("</head>", 0, start.start())
+    head_tags = PAGE_HEAD_TAG_RE.findall(html, 0, head_end) if head_end != -1 else []
+    head = "<template data-page-head>" + "".join(head_tags) + "</template>\n"
+    return head + html[start.start() : tag.end()] + "\n"
+
+
+def render_page(
+    document: dict[str, Any],
+    posts: list[dict[str, Any]] | None,
+    searchable: bool = False,
+    *,
+    build_dir: Path,
+    og_inputs_hash: str,
+    assets: dict[str, str],
+    images: dict[str, dict[str, Any]],
+    i18n_bundles: str,
+    languages: list[dict[str, str]] | None = None,
+    fallback_language: str = "en",
+    critical_tokens: frozenset[str] = frozenset(),
+    markdown_backend: str = DEFAULT_MARKDOWN_BACKEND,
+) -> dict[str, Any]:
+    """Render one markdown file (and its OG card) into build_dir.
+
+    ``posts`` is the posts listing for templates that use it, which is then
+    paginated (see paginate_posts), or None. Post images in the markdown get
+    their responsive variants from ``images`` (see rewrite_responsive_images).
+    With ``languages`` the page is also pre-rendered for each of them under
+    /{lang}/, the fallback language replacing the page itself. ``searchable``
+    pages also report their search documents, one per language.
+    ``critical_tokens`` are selector tokens pages may have before their full
+    stylesheets load (see inline_critical_css).
+
+    Runs in the main process or in a pool worker, so it only touches its own
+    outputs and reports them back, along with the rendered markdown, instead
+    of updating the manifest and the document store.
+    """
+    md_path = document["path"]
+    frontmatter = document["frontmatter"]
+    template_key = frontmatter.get("template", "index")
+    template_name = template_key + ".html"
+    timings: dict[str, list[float]] = {}
+    html_body = document["html"]
+    if html_body is None:
+        with timed(timings, "markdown"):
+            html_body = render_markdown(read_markdown_body(md_path), markdown_backend)
+    content = rewrite_responsive_images(html_body, images)
+    output_path = output_path_for(md_path, build_dir, frontmatter)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    slug = slug_for_path(md_path)
+    page_classes: list[str] = []
+    if template_key == "posts-index":
+        page_classes.append("page--posts")
+    elif template_key == "updates":
+        page_classes.extend(["page--posts", "page--post-detail"])
+
+    extra_page_classes = frontmatter.get("page_class", "")
+    if isinstance(extra_page_classes, str):
+        page_classes.extend(extra_page_classes.split())
+    elif isinstance(extra_page_classes, list):
+        page_classes.extend(str(value) for value in extra_page_classes if value)
+    page = dict(frontmatter)
+    if "date" in page:
+        parsed_page_date = parse_post_date(page.get("date", ""))
+        if parsed_page_date:
+            page["date_day"] = parsed_page_date.strftime("%a, %d %b %Y")
+            page["date_iso"] = parsed_page_date.date().isoformat()
+    page["from_html"] = safe(linkify_email_header(str(page.get("from", ""))))
+    page["to_html"] = safe(linkify_email_header(str(page.get("to", ""))))
+    is_article = template_key == "updates"
+    og_image_path = str(frontmatter.get("og_image", ""))
+    og = None
+    if is_article and not og_image_path:
+        og_image_path = f"/static/og{slug.rstrip('/')}.png"
+        og_title = str(frontmatter.get("title", "Earendil"))
+        og_output = build_dir / og_image_path.lstrip("/")
+        og_hash = content_digest(og_title, og_inputs_hash)
+        with timed(timings, "og_image"):
+            generate_og_image_cached(og_title, og_output, og_inputs_hash)
+        og = {"path": og_output, "hash": og_hash}
+    if og_image_path:
+        if og_image_path.startswith(("http://", "https://")):
+            og_image_url = og_image_path
+        else:
+            og_image_url = SITE_URL.rstrip("/") + "/" + og_image_path.lstrip("/")
+    else:
+        og_image_url = SITE_URL.rstrip("/") + "/static/favicon/android-chrome-512x512.png"
+
+    def render(name: str, **context: Any) -> str:
+        with timed(timings, "template"):
+            rendered = _page_environment().render_template(
+                name,
+                title=frontmatter.get("title", "Earendil"),
+                description=frontmatter.get("description", ""),
+                page=page,
+                content=safe(content),
+                slug=slug,
+                is_posts_section=slug.startswith("/posts/"),
+                is_article=is_article,
+                og_image=og_image_url,
+                page_classes=" ".join(page_classes),
+                i18n_bundles=i18n_bundles,
+                **context,
+            )
+        with timed(timings, "critical_css"):
+            return inline_critical_css(rewrite_asset_urls(rendered, assets), build_dir, name, critical_tokens)
+
+    fragments: list[Path] = []
+
+    def write(rendered: str, path: Path) -> list[tuple[str, Path, str]]:
+        with timed(timings, "write"):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if languages:
+                written = write_localized_pages(rendered, path, build_dir, languages, fallback_language)
+            else:
+                path.write_text(rendered)
+                written = [(fallback_language, path, rendered)]
+            for _, written_path, html in written:
+                fragment = page_fragment(html) if written_path.name == "index.html" else None
+                if fragment is not None:
+                    fragment_path = written_path.with_name(PAGE_FRAGMENT_NAME)
+                    fragment_path.write_text(fragment)
+                    fragments.append(fragment_path)
+            return written
+
+    if posts is None:
+        written = write(render(template_name, posts=None), output_path)
+    else:
+        written = []
+        for chunk, pagination in paginate_posts(posts, slug):
+            if pagination["number"] == 1:
+                written += write(render(template_name, posts=chunk, pagination=pagination), output_path)
+                continue
+            page_dir = output_path.parent / "page" / str(pagination["number"])
+            written += write(render(template_name, posts=chunk, pagination=pagination), page_dir / "index.html")
+            written += write(
+                render(POSTS_FRAGMENT_TEMPLATE, posts=chunk, pagination=pagination), page_dir / "fragment.html"
+            )
+
+    search = None
+    if searchable:
+        with timed(timings, "search"):
+            search = [
+                dict(
+                    search_document(
+                        html,
+                        output_url(path.relative_to(build_dir).as_posix()),
+                        str(frontmatter.get("title", "Earendil")),
+                    ),
+                    language=language,
+                )
+                for language, path, html in written
+            ]
+    return {
+        "output_path": output_path,
+        "outputs": [path for _, path, _ in written] + fragments,
+        "og": og,
+        "html": html_body,
+        "search": search,
+        "timings": timings,
+    }
+
+
+def _record_rendered_pages(
+    stale_pages: list[tuple[Path, str, str]],
+    results: Iterable[dict[str, Any]],
+    manifest: BuildManifest,
+    store: DocumentStore,
+    post_index: PostIndex,
+    build_dir: Path,
+    profiler: BuildProfiler,
+) -> None:
+    # Results arrive in source order, which keeps the log deterministic.
+    for (md_path, page_key, page_hash), result in zip(stale_pages, results):
+        profiler.add_page(md_path, result["timings"])
+        store.set_html(md_path, result["html"])
+        post_index.record_content_hash(md_path, content_digest(result["html"]))
+        output_path = result["output_path"]
+        manifest.record(page_key, page_hash, result["outputs"])
+        if result["search"] is not None:
+            search_path = search_document_path(page_hash)
+            search_path.parent.mkdir(parents=True, exist_ok=True)
+            search_path.write_text(json.dumps(result["search"], ensure_ascii=False), encoding="utf-8")
+        if result["og"]:
+            manifest.record(f"og:{page_key}", result["og"]["hash"], [result["og"]["path"]])
+        print(f"  {md_path.relative_to(ROOT)} -> {output_path.relative_to(build_dir)}", flush=True)
+
+
+def build_to(
+    build_dir: Path,
+    *,
+    incremental: bool = False,
+    manifest_path: Path | None = None,
+    jobs: int = 1,
+    changed_paths: set[Path] | None = None,
+    profiler: BuildProfiler | None = None,
+    localized: bool = False,
+    markdown_backend: str = DEFAULT_MARKDOWN_BACKEND,
+    streaming: bool = False,
+    brotli_quality: int = BROTLI_QUALITY,
+) -> list[str]:
+    """Render the site into build_dir.
+
+    With ``incremental`` the previous build in build_dir is kept and only the
+    entries whose inputs changed according to the manifest are rebuilt. A
+    missing or outdated manifest falls back to a full build. Pages are
+    rendered by ``jobs`` worker processes when it is greater than one.
+    ``changed_paths`` restricts change detection to the given source files
+    (see BuildManifest). Phase and page timings are recorded in ``profiler``
+    if given. With ``localized`` every page is also pre-rendered for each
+    language in locales/config.json. Markdown is converted with the
+    ``markdown_backend`` of MARKDOWN_BACKENDS. A ``streaming`` build keeps no
+    rendered markdown around (see DocumentStore), for archives too large to
+    hold in memory. Outputs are precompressed with brotli at
+    ``brotli_quality``. Returns the outputs that were written or removed.
+    """
+    if profiler is None:
+        profiler = BuildProfiler()
+    manifest = BuildManifest(
+        manifest_path,
+        build_dir,
+        content_digest(str(MANIFEST_VERSION), Path(__file__).read_bytes()),
+        changed_paths if incremental else None,
+    )
+    if not (incremental and manifest.load()) and build_dir.exists():
         shutil.rmtree(build_dir)
     build_dir.mkdir(parents=True, exist_ok=True)
 
-    if STATIC_DIR.exists():
-        shutil.copytree(STATIC_DIR, build_dir / "static")
-        static_files = list(STATIC_DIR.rglob("*"))
-        static_count = sum(1 for f in static_files if f.is_file())
-        print(f"  Copied {static_count} static files", flush=True)
-
+    # Translations and markdown come first since fonts are subset to the
+    # characters they use, before pages link the fingerprinted stylesheets.
+    locale_bundles: dict[str, str] = {}
+    languages: list[dict[str, str]] = []
+    fallback_language = "en"
+    # i18n.js may switch any page to another language and direction before
+    # the full stylesheets have loaded.
+    critical_tokens: frozenset[str] = frozenset()
     if LOCALES_DIR.exists():
-        shutil.copytree(LOCALES_DIR, build_dir / "locales")
-        locale_files = list(LOCALES_DIR.rglob("*.json"))
-        print(f"  Copied {len(locale_files)} locale files", flush=True)
+        config = locale_config()
+        critical_tokens = frozenset(
+            token
+            for language in config["languages"]
+            for token in (f"[lang={language['code']}", f"[dir={language.get('dir', 'ltr')}")
+        )
+        if localized:
+            languages = config["languages"]
+            fallback_language = config["fallbackLanguage"]
+        with profiler.phase("locale bundles"):
+            locale_bundles = build_locale_bundles(build_dir, manifest)
+        print(f"  Bundled translations for {len(locale_bundles)} languages", flush=True)
+
+    store = DocumentStore(markdown_backend, keep_html=not streaming)
+    md_files = iter_markdown_files()
+
+    assets: dict[str, str] = {}
+    images: dict[str, dict[str, Any]] = {}
+    if STATIC_DIR.exists():
+        stylesheets: dict[str, str] = {}
+        font_preloads: dict[str, str] = {}
+        if font_subset is not None and brotli is not None:
+            with profiler.phase("fonts"):
+                characters = collect_used_characters(store, md_files, manifest)
+                stylesheets, font_preloads, rewritten = subset_fonts(build_dir, manifest, characters, jobs)
+            if rewritten:
+                print(f"  Subset the fonts of {rewritten} stylesheets", flush=True)
+        with profiler.phase("static copy"):
+            unreferenced = unreferenced_fonts(stylesheets)
+            # subset_fonts already wrote the stylesheets it rewrote.
+            copied, unchanged = copy_tree_incremental(
+                STATIC_DIR, build_dir / "static", manifest, "static", unreferenced | set(stylesheets)
+            )
+        print(_copy_summary(copied, unchanged, "static files"), flush=True)
+        with profiler.phase("fingerprint assets"):
+            assets = fingerprint_static_assets(build_dir, manifest, stylesheets, unreferenced)
+        print(f"  Fingerprinted {len(assets)} static files", flush=True)
+        # Preloaded fonts are fetched as their first slice.
+        assets.update(font_preloads)
+        with profiler.phase("responsive images"):
+            images, generated = build_responsive_images(build_dir, manifest, jobs)
+        if generated:
+            print(f"  Generated responsive variants for {generated} images", flush=True)
 
     cname_file = ROOT / "CNAME"
     if cname_file.exists():
-        shutil.copy(cname_file, build_dir / "CNAME")
-
-    env = Environment(loader=load_from_path(str(TEMPLATES_DIR)))
+        cname_hash = manifest.file_hash(cname_file)
+        if not manifest.is_fresh("file:CNAME", cname_hash):
+            shutil.copy(cname_file, build_dir / "CNAME")
+            manifest.record("file:CNAME", cname_hash, [build_dir / "CNAME"])
+
+    # Templates and OG artwork may have changed since the last build in this
+    # process.
+    global _OG_RENDERER
+    _OG_RENDERER = None
+    template_graph = TemplateGraph(TEMPLATES_DIR, manifest)
+    refresh_template_environment(template_graph)
+    og_inputs_hash = og_inputs_digest(manifest.file_hash)
 
     # Collect updates for navigation + feeds
-    update_entries = collect_update_entries()
-    updates = [
-        {
-            "name": update["name"],
-            "slug": update["slug"],
-            "title": update["title"],
-            "date": update["date"],
-            "date_day": update["date_day"],
-            "date_iso": update["date_iso"],
-            "parsed_date": update["parsed_date"],
-            "subject": update["subject"],
-            "i18n_key": update["i18n_key"],
-        }
-        for update in update_entries
-    ]
+    post_index = PostIndex(POST_INDEX_PATH)
+    with profiler.phase("collect_update_entries"):
+        updates = collect_update_entries(store, post_index)
+    # Pages whose template reads the posts listing depend on its metadata.
+    listing_hash = content_digest(
+        *(repr(sorted((k, str(v)) for k, v in update.items() if k != "source")) for update in updates)
+    )
 
-    md_files = iter_markdown_files()
+    assets_hash = content_digest(json.dumps(assets, sort_keys=True), json.dumps(images, sort_keys=True))
+    i18n_bundles = json.dumps(locale_bundles, separators=(",", ":"), sort_keys=True)
+
+    unchanged_pages = 0
+    stale_pages: list[tuple[Path, str, str]] = []
+    listing_pages: set[Path] = set()
+    searchable_pages: dict[Path, str] = {}
     for md_path in md_files:
-        raw = md_path.read_text()
-        frontmatter, body = parse_frontmatter(raw)
-        template_key = frontmatter.get("template", "index")
-        template_name = template_key + ".html"
-        html_body = render_markdown(body)
-        output_path = output_path_for(md_path, build_dir, frontmatter)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        slug = slug_for_path(md_path)
-        page_classes: list[str] = []
-        if template_key == "posts-index":
-            page_classes.append("page--posts")
-        elif template_key == "updates":
-            page_classes.extend(["page--posts", "page--post-detail"])
-
-        extra_page_classes = frontmatter.get("page_class", "")
-        if isinstance(extra_page_classes, str):
-            page_classes.extend(extra_page_classes.split())
-        elif isinstance(extra_page_classes, list):
-            page_classes.extend(str(value) for value in extra_page_classes if value)
-        page = dict(frontmatter)
-        if "date" in page:
-            parsed_page_date = parse_post_date(page.get("date", ""))
-            if parsed_page_date:
-                page["date_day"] = parsed_page_date.strftime("%a, %d %b %Y")
-                page["date_iso"] = parsed_page_date.date().isoformat()
-        page["from_html"] = safe(linkify_email_header(str(page.get("from", ""))))
-        page["to_html"] = safe(linkify_email_header(str(page.get("to", ""))))
-        is_article = template_key == "updates"
-        og_image_path = str(frontmatter.get("og_image", ""))
-        if is_article and not og_image_path:
-            og_image_path = f"/static/og{slug.rstrip('/')}.png"
-            generate_og_image(
-                str(frontmatter.get("title", "Earendil")),
-                build_dir / og_image_path.lstrip("/"),
+        rel_path = md_path.relative_to(ROOT)
+        page_key = f"page:{rel_path.as_posix()}"
+        frontmatter = store.get(md_path)["frontmatter"]
+        template_name = frontmatter.get("template", "index") + ".html"
+        template_hash = template_graph.digest(template_name)
+        if "posts" in template_graph.variables(template_name):
+            listing_pages.add(md_path)
+            template_hash = content_digest(
+                template_hash,
+                template_graph.digest(POSTS_FRAGMENT_TEMPLATE),
+                listing_hash,
+                str(POSTS_PER_PAGE),
             )
-        if og_image_path:
-            if og_image_path.startswith(("http://", "https://")):
-                og_image_url = og_image_path
-            else:
-                og_image_url = SITE_URL.rstrip("/") + "/" + og_image_path.lstrip("/")
-        else:
-            og_image_url = SITE_URL.rstrip("/") + "/static/favicon/android-chrome-512x512.png"
-
-        rendered = env.render_template(
-            template_name,
-            title=frontmatter.get("title", "Earendil"),
-            description=frontmatter.get("description", ""),
-            page=page,
-            content=safe(html_body),
-            slug=slug,
-            posts=updates,
-            is_posts_section=slug.startswith("/posts/"),
-            is_article=is_article,
-            og_image=og_image_url,
-            page_classes=" ".join(page_classes),
+        page_hash = content_digest(
+            manifest.file_hash(md_path),
+            template_hash,
+            og_inputs_hash,
+            assets_hash,
+            i18n_bundles,
+            str(localized),
+            markdown_backend,
         )
-        output_path.write_text(rendered)
-        rel_path = md_path.relative_to(ROOT)
-        print(f"  {rel_path} -> {output_path.relative_to(build_dir)}", flush=True)
-
-    build_update_feeds(update_entries, build_dir)
+        # Listings and error pages are left out of the search index.
+        if (
+            md_path not in listing_pages
+            and frontmatter.get("search", True)
+            and output_path_for(md_path, build_dir, frontmatter).name == "index.html"
+        ):
+            searchable_pages[md_path] = page_hash
+        og_key = f"og:{page_key}"
+        # The OG card has its own entry so body edits keep it, but it is
+        # derived from this page's inputs and stays fresh along with it.
+        if (
+            manifest.is_fresh(page_key, page_hash)
+            and (
+                og_key not in manifest.previous
+                or manifest.is_fresh(og_key, manifest.previous[og_key]["hash"])
+            )
+            and (md_path not in searchable_pages or search_document_path(page_hash).exists())
+        ):
+            unchanged_pages += 1
+            continue
 
+        stale_pages.append((md_path, page_key, page_hash))
+
+    render = functools.partial(
+        render_page,
+        build_dir=build_dir,
+        og_inputs_hash=og_inputs_hash,
+        assets=assets,
+        images=images,
+        i18n_bundles=i18n_bundles,
+        languages=languages,
+        fallback_language=fallback_language,
+        critical_tokens=critical_tokens,
+        markdown_backend=markdown_backend,
+    )
+    # Documents only carry frontmatter; workers read and render each body
+    # and results are recorded as they arrive, one page at a time.
+    documents = (store.get(md_path) for md_path, _, _ in stale_pages)
+    listings = (updates if md_path in listing_pages else None for md_path, _, _ in stale_pages)
+    searchable = (md_path in searchable_pages for md_path, _, _ in stale_pages)
+    with profiler.phase("pages"):
+        if jobs > 1 and len(stale_pages) > 1:
+            with ProcessPoolExecutor(max_workers=min(jobs, len(stale_pages))) as executor:
+                results = executor.map(render, documents, listings, searchable)
+                _record_rendered_pages(stale_pages, results, manifest, store, post_index, build_dir, profiler)
+        else:
+            _record_rendered_pages(
+                stale_pages,
+                map(render, documents, listings, searchable),
+                manifest,
+                store,
+                post_index,
+                build_dir,
+                profiler,
+            )
 
-def build() -> None:
+    if unchanged_pages:
+        print(f"  Skipped {unchanged_pages} unchanged pages", flush=True)
+
+    with profiler.phase("search index"):
+        search_documents: dict[str, list[dict[str, Any]]] = {}
+        for page_hash in searchable_pages.values():
+            for document in json.loads(search_document_path(page_hash).read_text(encoding="utf-8")):
+                search_documents.setdefault(document.pop("language"), []).append(document)
+        written = build_search_index(build_dir, manifest, search_documents)
+    if written:
+        print(f"  Wrote {written} search index files", flush=True)
+
+    # Feeds embed the rendered markdown, which also depends on the backend.
+    feed_updates = updates[:UPDATES_FEED_LIMIT]
+    content_hashes = post_index.content_hashes(update["source"] for update in feed_updates)
+    feeds_hash = content_digest(
+        markdown_backend,
+        *(
+            repr(
+                (
+                    update["slug"],
+                    update["title"],
+                    update["date"],
+                    manifest.file_hash(update["source"]),
+                    content_hashes[update["source"]],
+                )
+            )
+            for update in feed_updates
+        ),
+    )
+    post_index.close()
+    if updates and not manifest.is_fresh("feeds", feeds_hash):
+        with profiler.phase("feeds"):
+            build_update_feeds(updates, build_dir, store)
+        posts_dir = build_dir / "posts"
+        manifest.record("feeds", feeds_hash, [posts_dir / "feed.atom", posts_dir / "feed.rss"])
+
+    with profiler.phase("compress"):
+        compressed = precompress_outputs(build_dir, manifest, jobs, brotli_quality)
+    if compressed:
+        print(f"  Compressed {compressed} outputs", flush=True)
+
+    with profiler.phase("cleanup"):
+        removed = manifest.finish()
+    if removed:
+        print(f"  Removed {removed} stale outputs", flush=True)
+    return manifest.changed_outputs()
+
+
+def build(
+    incremental: bool = False,
+    jobs: int = 1,
+    changed_paths: set[Path] | None = None,
+    profiler: BuildProfiler | None = None,
+    localized: bool = False,
+    markdown_backend: str = DEFAULT_MARKDOWN_BACKEND,
+    streaming: bool = False,
+    brotli_quality: int = BROTLI_QUALITY,
+) -> list[str]:
+    if incremental:
+        return build_to(
+            BUILD_DIR,
+            incremental=True,
+            manifest_path=MANIFEST_PATH,
+            jobs=jobs,
+            changed_paths=changed_paths,
+            profiler=profiler,
+            localized=localized,
+            markdown_backend=markdown_backend,
+            streaming=streaming,
+            brotli_quality=brotli_quality,
+        )
     temp_dir = BUILD_DIR.with_name(f"{BUILD_DIR.name}_tmp")
-    build_to(temp_dir)
+    changed_outputs = build_to(
+        temp_dir,
+        manifest_path=MANIFEST_PATH,
+        jobs=jobs,
+        profiler=profiler,
+        localized=localized,
+        markdown_backend=markdown_backend,
+        streaming=streaming,
+        brotli_quality=brotli_quality,
+    )
     if BUILD_DIR.exists():
         shutil.rmtree(BUILD_DIR)
     temp_dir.replace(BUILD_DIR)
+    return changed_outputs
 
 
 HOST = "0.0.0.0"
 PORT = 8000
 DEBOUNCE_DELAY = 0.3
-IGNORE_DIRS = {"_build", "_build_tmp", ".git"}
+IGNORE_DIRS = {"__pycache__", "_build", "_build_tmp", "_cache", "node_modules"}
+
+SSE_KEEPALIVE_INTERVAL = 15.0
+SSE_SEND_TIMEOUT = 2.0
 
-# Global dictionary to track reload events by connection ID
-RELOAD_EVENTS: dict[int, threading.Event] = {}
-RELOAD_EVENTS_LOCK = threading.Lock()
+
+class ReloadBroadcaster:
+    """Fan live reload messages out to every SSE client from one thread.
+
+    SSE connections are handed over by their request handler, so an open tab
+    costs a socket rather than a server thread. The broadcaster sleeps until
+    a message is published and otherwise only wakes up for sparse keepalives,
+    which is also when disconnected tabs are noticed and dropped.
+    """
+
+    def __init__(self, keepalive_interval: float = SSE_KEEPALIVE_INTERVAL):
+        self.keepalive_interval = keepalive_interval
+        self._clients: list[socket.socket] = []
+        self._pending: list[bytes] = []
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+
+    def add_client(self, sock: socket.socket) -> None:
+        sock.settimeout(SSE_SEND_TIMEOUT)
+        with self._condition:
+            self._clients.append(sock)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+    def publish(self, data: str) -> None:
+        with self._condition:
+            self._pending.append(f"data: {data}\n\n".encode("utf-8"))
+            self._condition.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending, timeout=self.keepalive_interval)
+                payload = b"".join(self._pending) or b": keepalive\n\n"
+                self._pending.clear()
+                clients = list(self._clients)
+
+            dead = []
+            for sock in clients:
+                try:
+                    sock.sendall(payload)
+                except OSError:
+                    dead.append(sock)
+            if dead:
+                with self._condition:
+                    self._clients = [sock for sock in self._clients if sock not in dead]
+                for sock in dead:
+                    sock.close()
+
+
+RELOAD_BROADCASTER = ReloadBroadcaster()
 
 RELOAD_SCRIPT = """
 <script>
 (function() {
   console.log('Live reload enabled');
   const eventSource = new EventSource('/sse');
+
+  // Fingerprinted names carry a 10 character hash before the extension.
+  function unhashed(path) {
+    return path.replace(/\.[0-9a-f]{10}(\.css)$/, '$1');
+  }
+
+  function swapStylesheets(stylesheets) {
+    document.querySelectorAll('link[rel="stylesheet"]').forEach(function(link) {
+      const url = new URL(link.href, location.href);
+      const next = stylesheets[unhashed(url.pathname)];
+      if (next && next !== url.pathname) {
+        link.href = next;
+      }
+    });
+  }
+
   eventSource.onmessage = function(event) {
-    if (event.data === 'reload') {
+    if (event.data === 'connected') {
+      return;
+    }
+    let message;
+    try {
+      message = JSON.parse(event.data);
+    } catch (err) {
+      message = { type: 'reload', urls: ['*'] };
+    }
+    if (message.type === 'css') {
+      console.log('Swapping stylesheets due to file changes...');
+      swapStylesheets(message.stylesheets);
+      return;
+    }
+    const urls = message.urls || ['*'];
+    if (urls.indexOf('*') !== -1 || urls.indexOf(location.pathname) !== -1) {
       console.log('Reloading page due to file changes...');
       location.reload();
     }
@@ -652,6 +3638,63 @@ RELOAD_SCRIPT = """
 """
 
 
+class ResponseCache:
+    """Bodies the dev server sends, kept in memory until the next build.
+
+    Entries are keyed by file and content coding and hold the body, its
+    content type and a strong ETag derived from the body.
+    """
+
+    def __init__(self):
+        self._entries: dict[tuple[str, str | None], dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[str, str | None], load: Callable[[], tuple[bytes, str]]) -> dict[str, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            body, content_type = load()
+            entry = {"body": body, "content_type": content_type, "etag": f'"{content_digest(body)[:32]}"'}
+            with self._lock:
+                self._entries[key] = entry
+        return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+RESPONSE_CACHE = ResponseCache()
+
+
+def _parse_byte_range(header: str, size: int) -> tuple[int, int] | None:
+    """Parse a single ``bytes=`` range into inclusive offsets.
+
+    Returns None for headers this server ignores (other units, several
+    ranges), in which case the whole body is sent, and (size, size) for
+    ranges that cannot be satisfied.
+    """
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    start, dash, end = spec.strip().partition("-")
+    try:
+        if not dash:
+            return None
+        if not start:
+            length = int(end)
+            if length <= 0:
+                return size, size
+            return max(size - length, 0), size - 1
+        first = int(start)
+        last = min(int(end), size - 1) if end else size - 1
+    except ValueError:
+        return None
+    if first >= size or last < first:
+        return size, size
+    return first, last
+
+
 class LiveReloadHandler(SimpleHTTPRequestHandler):
     """HTTP handler with live reload support via SSE."""
 
@@ -670,6 +3713,12 @@ class LiveReloadHandler(SimpleHTTPRequestHandler):
         except (ConnectionResetError, BrokenPipeError):
             pass
 
+    def do_HEAD(self):
+        try:
+            self.handle_file_with_reload(head=True)
+        except (ConnectionResetError, BrokenPipeError):
+            pass
+
     def handle_sse(self):
         """Handle Server-Sent Events for live reload."""
         self.send_response(200)
@@ -679,95 +3728,214 @@ class LiveReloadHandler(SimpleHTTPRequestHandler):
         self.send_header("Access-Control-Allow-Origin", "*")
         self.end_headers()
 
-        connection_id = id(self)
-        try:
-            self.wfile.write(b"data: connected\n\n")
-            self.wfile.flush()
+        self.wfile.write(b"data: connected\n\n")
+        self.wfile.flush()
 
-            reload_event = threading.Event()
-            with RELOAD_EVENTS_LOCK:
-                RELOAD_EVENTS[connection_id] = reload_event
+        # Hand the connection to the broadcaster and free this thread. The
+        # server must then leave the socket open; see LiveReloadServer.
+        self.server.detach_request(self.request)
+        RELOAD_BROADCASTER.add_client(self.request)
+        self.close_connection = True
 
-            while True:
-                try:
-                    if reload_event.wait(timeout=0.1):
-                        self.wfile.write(b"data: reload\n\n")
-                        self.wfile.flush()
-                        break
-                    else:
-                        self.wfile.write(b": keepalive\n\n")
-                        self.wfile.flush()
-                except (BrokenPipeError, ConnectionResetError):
-                    break
-        finally:
-            with RELOAD_EVENTS_LOCK:
-                RELOAD_EVENTS.pop(connection_id, None)
-
-    def handle_file_with_reload(self):
-        """Handle file requests. For HTML, inject live reload script."""
-        # Let parent class handle the actual file serving securely
-        # We just need to intercept HTML responses to inject reload script
-        
-        # Check if this looks like an HTML request
-        path = self.path.split('?')[0]
-        if not (path.endswith('.html') or path.endswith('/') or path == '/' or '.' not in path.split('/')[-1]):
-            super().do_GET()
-            return
-        
-        # For HTML requests, we need to intercept the response
-        # Use parent's translate_path which is secure
+    def handle_file_with_reload(self, head: bool = False):
+        """Serve a file from RESPONSE_CACHE, injecting the reload script into HTML.
+
+        Responses carry strong ETags, so revalidations get a 304, and single
+        byte ranges are honoured. Static files are sent as their build-time
+        .br or .gz variant and HTML is gzipped if the client accepts it,
+        except for range requests. Directories without an index.html
+        and missing files are left to SimpleHTTPRequestHandler.
+        """
         fs_path = self.translate_path(self.path)
-        
-        # Check if it's a directory (serve index.html)
         if os.path.isdir(fs_path):
             fs_path = os.path.join(fs_path, "index.html")
-        
-        if not os.path.isfile(fs_path) or not fs_path.endswith('.html'):
-            super().do_GET()
+        if not os.path.isfile(fs_path):
+            super().do_HEAD() if head else super().do_GET()
             return
-        
-        try:
-            with open(fs_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Inject reload script
-            if "</body>" in content:
-                content = content.replace("</body>", f"{RELOAD_SCRIPT}</body>")
-            else:
-                content += RELOAD_SCRIPT
-            
-            encoded = content.encode('utf-8')
-            self.send_response(200)
-            self.send_header("Content-Type", "text/html; charset=utf-8")
-            self.send_header("Content-Length", str(len(encoded)))
+
+        is_html = fs_path.endswith(".html")
+        accepted = self.accepted_encodings() if "Range" not in self.headers else set()
+        coding = None
+        for candidate, suffix in COMPRESSED_VARIANTS:
+            if candidate in accepted or "*" in accepted:
+                if (candidate == "gzip") if is_html else os.path.isfile(fs_path + suffix):
+                    coding = candidate
+                    break
+
+        entry = RESPONSE_CACHE.get((fs_path, coding), lambda: self.load_response(fs_path, coding))
+        body = entry["body"]
+        if self.etag_matches(self.headers.get("If-None-Match"), entry["etag"]):
+            self.send_response(304)
+            self.send_header("ETag", entry["etag"])
+            self.send_header("Cache-Control", "no-cache")
+            self.end_headers()
+            return
+
+        byte_range = None
+        if "Range" in self.headers and self.headers.get("If-Range", entry["etag"]) == entry["etag"]:
+            byte_range = _parse_byte_range(self.headers["Range"], len(body))
+        if byte_range is not None and byte_range[0] >= len(body):
+            self.send_response(416)
+            self.send_header("Content-Range", f"bytes */{len(body)}")
+            self.send_header("Content-Length", "0")
             self.end_headers()
-            self.wfile.write(encoded)
-        except Exception:
-            super().do_GET()
+            return
+
+        self.send_response(206 if byte_range else 200)
+        self.send_header("Content-Type", entry["content_type"])
+        if coding:
+            self.send_header("Content-Encoding", coding)
+        self.send_header("Vary", "Accept-Encoding")
+        self.send_header("ETag", entry["etag"])
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Accept-Ranges", "bytes")
+        if byte_range:
+            first, last = byte_range
+            self.send_header("Content-Range", f"bytes {first}-{last}/{len(body)}")
+            body = body[first : last + 1]
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if not head:
+            self.wfile.write(body)
+
+    def load_response(self, fs_path: str, coding: str | None) -> tuple[bytes, str]:
+        """Read a file for RESPONSE_CACHE, returning its body and content type."""
+        if not fs_path.endswith(".html"):
+            suffix = dict(COMPRESSED_VARIANTS)[coding] if coding else ""
+            with open(fs_path + suffix, "rb") as f:
+                return f.read(), self.guess_type(fs_path)
+
+        with open(fs_path, "r", encoding="utf-8") as f:
+            content = f.read()
+        if "</body>" in content:
+            content = content.replace("</body>", f"{RELOAD_SCRIPT}</body>")
+        else:
+            content += RELOAD_SCRIPT
+        body = content.encode("utf-8")
+        if coding == "gzip":
+            # Speed over size: this runs on the first request after a build.
+            body = gzip.compress(body, compresslevel=1, mtime=0)
+        return body, "text/html; charset=utf-8"
+
+    @staticmethod
+    def etag_matches(header: str | None, etag: str) -> bool:
+        if not header:
+            return False
+        candidates = [candidate.strip().removeprefix("W/") for candidate in header.split(",")]
+        return "*" in candidates or etag in candidates
+
+    def accepted_encodings(self) -> set[str]:
+        accepted = set()
+        for item in self.headers.get("Accept-Encoding", "").split(","):
+            coding, _, params = item.strip().partition(";")
+            quality = params.strip()
+            if quality.startswith("q="):
+                try:
+                    if float(quality[2:]) <= 0:
+                        continue
+                except ValueError:
+                    continue
+            if coding:
+                accepted.add(coding.strip().lower())
+        return accepted
 
     def log_message(self, format, *args):
         pass
 
 
-def notify_reload():
-    """Signal all SSE clients to reload."""
-    with RELOAD_EVENTS_LOCK:
-        for event in RELOAD_EVENTS.values():
-            event.set()
-        RELOAD_EVENTS.clear()
+def reload_message(
+    changed_paths: set[Path],
+    changed_outputs: list[str],
+    build_dir: Path = BUILD_DIR,
+) -> dict[str, Any] | None:
+    """Describe what open tabs need to do after a rebuild.
+
+    Stylesheet-only edits are hot-swapped: the message carries the new
+    fingerprinted URL of every stylesheet. Otherwise tabs showing one of the
+    rewritten pages reload; "*" reloads every tab, which is needed when
+    runtime inputs like locale files change. Returns None when nothing
+    visible changed.
+    """
+    if not changed_outputs:
+        return None
+    if changed_paths and all(
+        path.suffix == ".css" and STATIC_DIR in path.parents for path in changed_paths
+    ):
+        asset_manifest = build_dir / "static" / ASSET_MANIFEST_NAME
+        assets = json.loads(asset_manifest.read_text(encoding="utf-8")) if asset_manifest.exists() else {}
+        return {
+            "type": "css",
+            "stylesheets": {url: hashed for url, hashed in assets.items() if url.endswith(".css")},
+        }
+
+    urls: set[str] = set()
+    for output in changed_outputs:
+        if output.startswith("locales/") or output.endswith(".js"):
+            urls = {"*"}
+            break
+        if output.endswith(".html"):
+            urls.add(output_url(output))
+    if not urls:
+        return None
+    return {"type": "reload", "urls": sorted(urls)}
+
+
+def notify_reload(changed_paths: set[Path] | None = None, changed_outputs: list[str] | None = None):
+    """Tell SSE clients which pages changed, or to reload everything."""
+    if changed_outputs is None:
+        message: dict[str, Any] | None = {"type": "reload", "urls": ["*"]}
+    else:
+        message = reload_message(changed_paths or set(), changed_outputs)
+    if message is not None:
+        RELOAD_BROADCASTER.publish(json.dumps(message))
+
+
+class LiveReloadServer(ThreadingHTTPServer):
+    """Threading HTTP server whose SSE connections outlive their handlers."""
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._detached: set[socket.socket] = set()
+        self._detached_lock = threading.Lock()
+
+    def detach_request(self, request: socket.socket) -> None:
+        with self._detached_lock:
+            self._detached.add(request)
+
+    def shutdown_request(self, request):
+        with self._detached_lock:
+            if request in self._detached:
+                self._detached.discard(request)
+                return
+        super().shutdown_request(request)
 
 
 class BackgroundBuilder:
-    """File watcher that triggers builds on changes."""
+    """File watcher that triggers builds on changes.
+
+    ``build_options`` are passed on to every build (see build()).
+    """
 
-    def __init__(self, on_build_complete: Callable[[], None] | None = None):
+    def __init__(
+        self,
+        on_build_complete: Callable[[set[Path], list[str]], None] | None = None,
+        build_options: dict[str, Any] | None = None,
+    ):
         self.debounce_delay = DEBOUNCE_DELAY
         self.last_change_time = 0.0
         self.build_thread: threading.Thread | None = None
         self.stop_event = threading.Event()
         self.build_lock = threading.Lock()
+        # Signalled on every relevant change and on stop; the build loop
+        # sleeps on it instead of polling.
+        self.changed = threading.Condition(self.build_lock)
         self.is_building = False
+        self.changed_paths: set[Path] = set()
         self.on_build_complete = on_build_complete
+        self.build_options = {"brotli_quality": SERVE_BROTLI_QUALITY, **(build_options or {})}
 
     def should_ignore(self, path: str) -> bool:
         """Check if a path should be ignored."""
@@ -775,7 +3943,7 @@ class BackgroundBuilder:
         try:
             rel = path_obj.relative_to(ROOT)
             parts = rel.parts
-            return any(part in IGNORE_DIRS or part.startswith(("_", ".")) for part in parts)
+            return any(part in IGNORE_DIRS or part.startswith(".") for part in parts)
         except ValueError:
             return True
 
@@ -787,41 +3955,55 @@ class BackgroundBuilder:
         dest_path = getattr(event, "dest_path", None)
         if dest_path:
             paths.append(dest_path)
-        if all(self.should_ignore(path) for path in paths if path):
+        relevant = [Path(path) for path in paths if path and not self.should_ignore(path)]
+        if not relevant:
             return
-        self.last_change_time = time.time()
+        with self.changed:
+            self.changed_paths.update(relevant)
+            self.last_change_time = time.monotonic()
+            self.changed.notify()
+
+    def _wait_for_settled_change(self) -> bool:
+        """Block until a change is older than the debounce delay.
+
+        Returns False when the builder is stopped. Must hold build_lock.
+        """
+        while not self.stop_event.is_set():
+            if self.last_change_time > 0:
+                remaining = self.last_change_time + self.debounce_delay - time.monotonic()
+                if remaining <= 0:
+                    return True
+                self.changed.wait(remaining)
+            else:
+                self.changed.wait()
+        return False
 
     def _build_loop(self):
         """Background thread that triggers builds after debounce delay."""
-        while not self.stop_event.is_set():
-            should_build = False
-
-            with self.build_lock:
-                if (
-                    self.last_change_time > 0
-                    and time.time() - self.last_change_time > self.debounce_delay
-                    and not self.is_building
-                ):
-                    should_build = True
-                    self.is_building = True
-                    build_trigger_time = self.last_change_time
-
-            if should_build:
-                try:
-                    print("Rebuilding...", flush=True)
-                    build()
-                    print("Done.", flush=True)
-                    if self.on_build_complete:
-                        self.on_build_complete()
-                except Exception:
-                    traceback.print_exc()
-                finally:
-                    with self.build_lock:
-                        self.is_building = False
-                        if self.last_change_time == build_trigger_time:
-                            self.last_change_time = 0
-
-            time.sleep(0.1)
+        while True:
+            with self.changed:
+                if not self._wait_for_settled_change():
+                    return
+                self.is_building = True
+                build_trigger_time = self.last_change_time
+                changed_paths, self.changed_paths = self.changed_paths, set()
+
+            try:
+                print("Rebuilding...", flush=True)
+                changed_outputs = build(incremental=True, changed_paths=changed_paths, **self.build_options)
+                print("Done.", flush=True)
+                if self.on_build_complete:
+                    self.on_build_complete(changed_paths, changed_outputs)
+            except Exception:
+                traceback.print_exc()
+                # The failed build may have left these unprocessed.
+                with self.build_lock:
+                    self.changed_paths.update(changed_paths)
+            finally:
+                with self.build_lock:
+                    self.is_building = False
+                    if self.last_change_time == build_trigger_time:
+                        self.last_change_time = 0
 
     def start(self):
         """Start watching for file changes."""
@@ -830,7 +4012,7 @@ class BackgroundBuilder:
 
         # Initial build
         print("Building...", flush=True)
-        build()
+        build(incremental=True, **self.build_options)
         print("Done.", flush=True)
 
         # Set up file watcher
@@ -851,24 +4033,29 @@ class BackgroundBuilder:
     def stop(self):
         """Stop the file watcher."""
         self.stop_event.set()
+        with self.changed:
+            self.changed.notify_all()
         self.observer.stop()
         self.observer.join()
         if self.build_thread:
             self.build_thread.join(timeout=5)
 
 
-def serve() -> None:
-    """Serve with file watching and live reload."""
-    background_builder = BackgroundBuilder(on_build_complete=notify_reload)
+def serve(build_options: dict[str, Any] | None = None) -> None:
+    """Serve with file watching and live reload, building with ``build_options``."""
+    def on_build_complete(changed_paths: set[Path], changed_outputs: list[str]):
+        RESPONSE_CACHE.clear()
+        notify_reload(changed_paths, changed_outputs)
+
+    background_builder = BackgroundBuilder(on_build_complete=on_build_complete, build_options=build_options)
     background_builder.start()
 
     try:
         print(f"Serving on http://{HOST}:{PORT}/ with live reload")
-        server = ThreadingHTTPServer(
+        server = LiveReloadServer(
             (HOST, PORT),
             lambda *args: LiveReloadHandler(*args, directory=str(BUILD_DIR)),
         )
-        server.allow_reuse_address = True
         server.serve_forever()
     except KeyboardInterrupt:
         print("\nStopping...")
@@ -882,14 +4069,72 @@ def serve() -> None:
 def main() -> None:
     parser = argparse.ArgumentParser(description="Build the site.")
     parser.add_argument("command", nargs="?", default="build", choices=["build", "serve"])
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="reuse the previous build and only rebuild outputs whose inputs changed",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="render pages in N worker processes (0 uses every CPU core)",
+    )
+    parser.add_argument(
+        "--localized",
+        action="store_true",
+        help="also pre-render every page for each language under /{lang}/",
+    )
+    parser.add_argument(
+        "--markdown",
+        choices=sorted(MARKDOWN_BACKENDS),
+        default=DEFAULT_MARKDOWN_BACKEND,
+        help="markdown backend (markdown-it needs markdown-it-py and mdit-py-plugins)",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="keep memory flat for large archives by not holding rendered markdown",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help=f"time build phases and pages and write _build/{PROFILE_REPORT_NAME}",
+    )
+    parser.add_argument(
+        "--cprofile",
+        action="store_true",
+        help=f"also write cProfile stats of the main process to _build/{PROFILE_CPROFILE_NAME}",
+    )
     args = parser.parse_args()
+    jobs = args.jobs if args.jobs > 0 else os.cpu_count() or 1
+    if not markdown_backend_available(args.markdown):
+        parser.error(f"the {args.markdown} markdown backend is not installed")
+
+    build_options = {
+        "jobs": jobs,
+        "localized": args.localized,
+        "markdown_backend": args.markdown,
+        "streaming": args.stream,
+    }
 
     if args.command == "serve":
-        serve()
+        serve(build_options)
     else:
         print("Building...", flush=True)
-        build()
+        profiler = BuildProfiler() if args.profile or args.cprofile else None
+        cprofiler = cProfile.Profile() if args.cprofile else None
+        if cprofiler:
+            cprofiler.enable()
+        build(incremental=args.incremental, profiler=profiler, **build_options)
+        if cprofiler:
+            cprofiler.disable()
+            cprofiler.dump_stats(BUILD_DIR / PROFILE_CPROFILE_NAME)
         print("Done.", flush=True)
+        if profiler:
+            report = profiler.write_report(BUILD_DIR / PROFILE_REPORT_NAME)
+            BuildProfiler.print_summary(report)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,331 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# dependencies = ["minijinja", "pyyaml", "markdown", "watchdog", "pillow", "brotli", "babel", "fonttools", "pygments", "markdown-it-py", "mdit-py-plugins"]
+# ///
+"""Benchmark build.py against a synthetic corpus.
+
+Generates a site root in a temporary directory with thousands of posts
+(frontmatter, ◊ code reveals, long titles) and every locale from
+locales/config.json, next to a copy of build.py, and times the expensive
+parts of the build. Whole builds run the copy's CLI in a fresh process each
+time, so no in-process memo carries over between them, as with real
+``build.py build`` runs. Results are written as JSON so runs on different
+commits can be compared with --compare.
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+import build  # noqa: E402
+
+RESULTS_DIR = REPO_ROOT / "_cache" / "benchmarks"
+
+WORDS = (
+    "agent harness prompt cache session model token context tool result "
+    "protocol agency software human joy division bridge compaction portability "
+    "latency cost inference pipeline archive review commit branch merge window "
+    "sandbox terminal editor reader letter ledger signal lantern harbor meadow"
+).split()
+LANGUAGES = ("python", "javascript", "rust", "text", "")
+
+
+def _sentence(rng: random.Random, low: int = 6, high: int = 18) -> str:
+    words = [rng.choice(WORDS) for _ in range(rng.randint(low, high))]
+    return " ".join(words).capitalize() + "."
+
+
+def _title(rng: random.Random, index: int) -> str:
+    # Most titles are short; every fifth one is long enough to wrap, clamp
+    # and ellipsize on the OG card, and some contain a word that must split.
+    if index % 5 == 0:
+        words = [rng.choice(WORDS) for _ in range(rng.randint(14, 28))]
+        if index % 10 == 0:
+            words.insert(3, "".join(rng.choice(WORDS) for _ in range(5)))
+        return " ".join(words).title()
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(2, 7))).title()
+
+
+def _code_block(rng: random.Random) -> str:
+    lines = [f"{rng.choice(WORDS)}_{i} = {rng.randint(0, 999)}" for i in range(rng.randint(3, 12))]
+    # Put reveal markers in front of some lines, as hand-written posts do.
+    body = "\n".join(
+        (build.CODE_REVEAL_MARKER + line if i and rng.random() < 0.4 else line)
+        for i, line in enumerate(lines)
+    )
+    return f"```{rng.choice(LANGUAGES)}\n{body}\n```"
+
+
+def _post_body(rng: random.Random) -> str:
+    blocks = []
+    for _ in range(rng.randint(6, 20)):
+        kind = rng.random()
+        if kind < 0.55:
+            blocks.append(" ".join(_sentence(rng) for _ in range(rng.randint(2, 6))))
+        elif kind < 0.7:
+            blocks.append(_code_block(rng))
+        elif kind < 0.8:
+            blocks.append("\n".join(f"- {_sentence(rng, 3, 8)}" for _ in range(rng.randint(2, 6))))
+        elif kind < 0.9:
+            blocks.append(f"## {_sentence(rng, 2, 5).rstrip('.')}")
+        else:
+            blocks.append(f"A [link to {rng.choice(WORDS)}](/posts/) and `inline {rng.choice(WORDS)}` code.")
+    return "\n\n".join(blocks) + "\n"
+
+
+def generate_corpus(root: Path, posts: int, og_posts: int, seed: int) -> list[str]:
+    """Write a synthetic site into root and return the post titles."""
+    rng = random.Random(seed)
+    shutil.copytree(REPO_ROOT / "_templates", root / "_templates")
+    # Hardlinks keep the static tree (fonts, images) cheap to set up.
+    shutil.copytree(REPO_ROOT / "_static", root / "_static", copy_function=os.link)
+    shutil.copytree(REPO_ROOT / "locales", root / "locales")
+    # build.py derives every path from its own location.
+    shutil.copy(REPO_ROOT / "build.py", root / "build.py")
+    for name in ("_index.md", "values.md", "purpose.md", "join.md", "unsubscribe.md", "404.md"):
+        shutil.copy(REPO_ROOT / name, root / name)
+    posts_dir = root / "posts"
+    posts_dir.mkdir()
+    for name in ("_index.md", "subscribe.md"):
+        shutil.copy(REPO_ROOT / "posts" / name, posts_dir / name)
+
+    config = json.loads((root / "locales" / "config.json").read_text(encoding="utf-8"))
+    languages = [language["code"] for language in config["languages"]]
+    locale_titles: dict[str, dict[str, Any]] = {code: {} for code in languages}
+
+    titles = []
+    start = datetime(2020, 1, 1, 9, 30, tzinfo=timezone.utc)
+    for index in range(posts):
+        title = _title(rng, index)
+        titles.append(title)
+        slug = f"bench-{index:05d}"
+        date = start + timedelta(hours=index * 7 + rng.randint(0, 5))
+        frontmatter = {
+            "title": title,
+            "description": _sentence(rng),
+            "template": "updates",
+            "aria_label": "Earendil posts",
+            "from": "Earendil Engineering <rfc@earendil.com>",
+            "to": "You",
+            "date": format_datetime(date),
+            "subject": title,
+        }
+        # Only a slice of the posts get generated OG cards so that a cold
+        # build stays affordable; the OG benchmark measures cards directly.
+        if index >= og_posts:
+            frontmatter["og_image"] = "/static/og/earendil-logo.png"
+        header = "\n".join(f"{key}: {json.dumps(value, ensure_ascii=False)}" for key, value in frontmatter.items())
+        (posts_dir / f"{slug}.md").write_text(f"---\n{header}\n---\n\n{_post_body(rng)}", encoding="utf-8")
+        for code in languages:
+            key = f"post.{slug}.title"
+            if code == "en":
+                locale_titles[code][key] = {"message": title, "context": "Synthetic benchmark post title"}
+            else:
+                locale_titles[code][key] = f"[{code}] {title}"
+
+    for code, entries in locale_titles.items():
+        content_path = root / "locales" / code / "content.json"
+        content = json.loads(content_path.read_text(encoding="utf-8")) if content_path.exists() else {}
+        content.update(entries)
+        content_path.write_text(json.dumps(content, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    return titles
+
+
+def load_site_build(root: Path) -> ModuleType:
+    """Import the copy of build.py in root, whose paths all point into root."""
+    spec = importlib.util.spec_from_file_location("site_build", root / "build.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_build(root: Path, *args: str) -> None:
+    """Run the site's build.py CLI in a fresh interpreter."""
+    subprocess.run([sys.executable, str(root / "build.py"), "build", *args], cwd=root, stdout=subprocess.DEVNULL, check=True)
+
+
+def measure(fn: Callable[[], Any], repeat: int = 1) -> dict[str, Any]:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            fn()
+        samples.append(time.perf_counter() - start)
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "samples": samples,
+    }
+
+
+def run_benchmarks(root: Path, titles: list[str], args: argparse.Namespace) -> dict[str, Any]:
+    results: dict[str, Any] = {}
+    site = load_site_build(root)
+
+    def run(name: str, fn: Callable[[], Any], repeat: int = 1, per: int | None = None) -> None:
+        print(f"  {name}...", flush=True)
+        result = measure(fn, repeat)
+        if per:
+            result["per_item"] = result["median"] / per
+            result["items"] = per
+        results[name] = result
+        print(f"    {result['median']:.3f}s", flush=True)
+
+    jobs = f"--jobs={args.jobs}"
+    run("build cold", lambda: run_build(root, jobs))
+    run("build warm caches", lambda: run_build(root, jobs), repeat=args.repeat)
+    run("build incremental no-op", lambda: run_build(root, "--incremental", jobs), repeat=args.repeat)
+
+    edited = root / "posts" / "bench-00001.md"
+    original = edited.read_text(encoding="utf-8")
+
+    def edit_one_post() -> None:
+        edited.write_text(original + f"\nEdited at {time.perf_counter()}.\n", encoding="utf-8")
+        run_build(root, "--incremental", jobs)
+
+    run("build incremental one post", edit_one_post, repeat=args.repeat)
+    edited.write_text(original, encoding="utf-8")
+
+    run("collect_update_entries", site.collect_update_entries, repeat=args.repeat, per=len(titles))
+
+    bodies = [
+        site.parse_frontmatter(path.read_text(encoding="utf-8"))[1]
+        for path in sorted((root / "posts").glob("bench-*.md"))
+    ]
+    for backend in sorted(site.MARKDOWN_BACKENDS):
+        if not site.markdown_backend_available(backend):
+            continue
+        name = "render_markdown" if backend == site.DEFAULT_MARKDOWN_BACKEND else f"render_markdown {backend}"
+        run(
+            name,
+            lambda backend=backend: [site.render_markdown(body, backend) for body in bodies],
+            repeat=args.repeat,
+            per=len(bodies),
+        )
+
+    og_titles = titles[: args.og_cards]
+    og_output = root / "og-benchmark.png"
+    run(
+        "generate_og_image",
+        lambda: [site.generate_og_image(title, og_output) for title in og_titles],
+        per=len(og_titles),
+    )
+
+    updates = site.collect_update_entries()
+    store = site.DocumentStore()
+    feed_updates = [
+        {**update, "content": store.html(update["source"])}
+        for update in updates[: site.UPDATES_FEED_LIMIT]
+    ]
+    feed_args = {
+        "title": "Earendil Posts",
+        "feed_url": site.SITE_URL + "posts/feed.atom",
+        "subtitle": "Posts from Earendil",
+        "updates": feed_updates,
+    }
+    run("atom feed", lambda: site._generate_atom_feed(**feed_args), repeat=args.repeat)
+    run("rss feed", lambda: site._generate_rss_feed(**feed_args), repeat=args.repeat)
+    return results
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any]) -> None:
+    print(f"Compared with {baseline['revision']} ({baseline['created']}):")
+    for name, result in current["results"].items():
+        previous = baseline["results"].get(name)
+        if not previous:
+            print(f"  {name:<32} {result['median']:9.3f}s  (new)")
+            continue
+        ratio = result["median"] / previous["median"] if previous["median"] else float("inf")
+        print(f"  {name:<32} {previous['median']:9.3f}s -> {result['median']:9.3f}s  x{ratio:.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark build.py on a synthetic corpus.")
+    parser.add_argument("--posts", type=int, default=2000, help="number of synthetic posts")
+    parser.add_argument(
+        "--og-posts",
+        type=int,
+        default=50,
+        help="posts that get a generated OG card during builds",
+    )
+    parser.add_argument("--og-cards", type=int, default=20, help="cards rendered by the OG benchmark")
+    parser.add_argument("--repeat", type=int, default=3, help="repetitions of the cheaper benchmarks")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="worker processes for the measured builds")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", type=Path, help="result file (default: _cache/benchmarks/<revision>.json)")
+    parser.add_argument("--compare", type=Path, help="earlier result file to compare against")
+    parser.add_argument("--keep", action="store_true", help="keep the synthetic site for inspection")
+    args = parser.parse_args()
+
+    root = Path(tempfile.mkdtemp(prefix="earendil-bench-"))
+    try:
+        print(f"Generating {args.posts} posts in {root}...", flush=True)
+        titles = generate_corpus(root, args.posts, args.og_posts, args.seed)
+        print("Running benchmarks:", flush=True)
+        results = run_benchmarks(root, titles, args)
+    finally:
+        if args.keep:
+            print(f"Kept synthetic site in {root}")
+        else:
+            shutil.rmtree(root, ignore_errors=True)
+
+    revision = git_revision()
+    report = {
+        "revision": revision,
+        "created": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "parameters": {
+            "posts": args.posts,
+            "og_posts": args.og_posts,
+            "og_cards": args.og_cards,
+            "repeat": args.repeat,
+            "jobs": args.jobs,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+    output = args.output or RESULTS_DIR / f"{revision}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    print(f"Wrote {output}")
+    if args.compare:
+        compare(report, json.loads(args.compare.read_text(encoding="utf-8")))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# dependencies = ["minijinja", "pyyaml", "markdown", "pillow", "pygments", "markdown-it-py", "mdit-py-plugins"]
+# ///
+"""Compare the HTML two markdown backends of build.py produce.
+
+Renders every file from build.iter_markdown_files() and a synthetic corpus
+(see benchmark.py) with both backends, normalises the HTML so that
+serialisation details (attribute order, entity style, whitespace between
+tags) do not count, and prints a diff for each document that still differs.
+Exits with status 1 if any do.
+"""
+from __future__ import annotations
+
+import argparse
+import difflib
+import shutil
+import sys
+import tempfile
+import time
+from html import escape
+from html.parser import HTMLParser
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+import build  # noqa: E402
+from benchmark import generate_corpus  # noqa: E402
+
+VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+
+
+class HTMLNormalizer(HTMLParser):
+    """Re-serialise HTML one tag or text run per line.
+
+    Attributes are sorted and re-escaped, character references resolved, and
+    whitespace outside <pre> collapsed, with whitespace-only runs dropped.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.lines: list[str] = []
+        self.pre_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "pre":
+            self.pre_depth += 1
+        rendered = "".join(f' {name}="{escape(value or "")}"' for name, value in sorted(attrs))
+        self.lines.append(f"<{tag}{rendered}>")
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_TAGS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        if tag in VOID_TAGS:
+            return
+        if tag == "pre":
+            self.pre_depth = max(self.pre_depth - 1, 0)
+        self.lines.append(f"</{tag}>")
+
+    def handle_data(self, data):
+        if not self.pre_depth:
+            data = " ".join(data.split())
+            if not data:
+                return
+        self.lines.append(escape(data, quote=False))
+
+    def handle_comment(self, data):
+        self.lines.append(f"<!--{data}-->")
+
+
+def normalize(html: str) -> list[str]:
+    normalizer = HTMLNormalizer()
+    normalizer.feed(html)
+    normalizer.close()
+    return normalizer.lines
+
+
+def collect_documents(corpus_posts: int, seed: int, corpus_root: Path) -> list[tuple[str, str]]:
+    """Return (name, markdown body) for the site's files and the corpus."""
+    documents = []
+    for path in sorted(build.iter_markdown_files()):
+        _, body = build.parse_frontmatter(path.read_text(encoding="utf-8"))
+        documents.append((path.relative_to(build.ROOT).as_posix(), body))
+    if corpus_posts:
+        generate_corpus(corpus_root, corpus_posts, 0, seed)
+        for path in sorted((corpus_root / "posts").glob("bench-*.md")):
+            _, body = build.parse_frontmatter(path.read_text(encoding="utf-8"))
+            documents.append((f"corpus/{path.name}", body))
+    return documents
+
+
+def render_all(backend: str, documents: list[tuple[str, str]]) -> tuple[list[str], float]:
+    build.render_markdown("warm up", backend)
+    start = time.perf_counter()
+    rendered = [build.render_markdown(body, backend) for _, body in documents]
+    return rendered, time.perf_counter() - start
+
+
+def main() -> None:
+    backends = sorted(build.MARKDOWN_BACKENDS)
+    parser = argparse.ArgumentParser(description="Diff the HTML of two markdown backends.")
+    parser.add_argument("--baseline", choices=backends, default=build.DEFAULT_MARKDOWN_BACKEND)
+    parser.add_argument("--candidate", choices=backends, default="markdown-it")
+    parser.add_argument("--posts", type=int, default=200, help="synthetic posts to add to the site's files")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--context", type=int, default=2, help="lines of context in each diff")
+    parser.add_argument("--max-diffs", type=int, default=20, help="differing documents to print in full")
+    args = parser.parse_args()
+    for backend in (args.baseline, args.candidate):
+        if not build.markdown_backend_available(backend):
+            parser.error(f"the {backend} markdown backend is not installed")
+
+    corpus_root = Path(tempfile.mkdtemp(prefix="earendil-markdown-diff-"))
+    try:
+        documents = collect_documents(args.posts, args.seed, corpus_root)
+    finally:
+        shutil.rmtree(corpus_root, ignore_errors=True)
+
+    baseline, baseline_time = render_all(args.baseline, documents)
+    candidate, candidate_time = render_all(args.candidate, documents)
+    print(f"{len(documents)} documents")
+    print(f"  {args.baseline}: {baseline_time:.3f}s")
+    print(f"  {args.candidate}: {candidate_time:.3f}s")
+
+    differing = 0
+    for (name, _), expected, actual in zip(documents, baseline, candidate):
+        if expected == actual:
+            continue
+        expected_lines, actual_lines = normalize(expected), normalize(actual)
+        if expected_lines == actual_lines:
+            continue
+        differing += 1
+        if differing > args.max_diffs:
+            continue
+        print(f"\n{name}")
+        diff = difflib.unified_diff(
+            expected_lines,
+            actual_lines,
+            fromfile=args.baseline,
+            tofile=args.candidate,
+            n=args.context,
+            lineterm="",
+        )
+        for line in diff:
+            print(f"  {line}")
+
+    if differing > args.max_diffs:
+        print(f"\n... and {differing - args.max_diffs} more")
+    print(f"\n{differing} of {len(documents)} documents differ")
+    sys.exit(1 if differing else 0)
+
+
+if __name__ == "__main__":
+    main()